@@ -13,6 +13,20 @@ ITEM_DETAIL_URL = f"{BASE_URL}/Fgdc/ItemDetail"
 USERNAME = os.getenv("FNGUIDE_USERNAME")
 PASSWORD = os.getenv("FNGUIDE_PASSWORD")
 
+
+def _parse_accounts(value):
+    """FNGUIDE_ACCOUNTS 값 ("id1:pw1,id2:pw2") -> [(ID, 비밀번호), ...]"""
+    accounts = []
+    for item in (value or "").split(","):
+        username, sep, password = item.strip().partition(":")
+        if username and sep:
+            accounts.append((username, password))
+    return accounts
+
+
+# 여러 계정 (FNGUIDE_ACCOUNTS가 없으면 FNGUIDE_USERNAME/FNGUIDE_PASSWORD 한 계정)
+ACCOUNTS = _parse_accounts(os.getenv("FNGUIDE_ACCOUNTS")) or [(USERNAME, PASSWORD)]
+
 # 분기 설정
 QUARTER_CONFIG = {
     'year': None,  # 조회할 연도 (사용자 입력)
@@ -44,6 +58,11 @@ SELECTORS = {
         'selector': "#selGsYm",
         'option_template': "#selGsYm > option[value='{}']"  # value 값으로 옵션 선택
     },
+    # 종목 검색 관련 선택자
+    'search': {
+        'input': "#txtSearchWd",
+        'autocomplete_item': "#divAutoComp > div.result > ul > li"
+    },
     # 연간/분기 선택 관련 선택자
     'annual': {
         'selector': "#selAqGb",
@@ -58,15 +77,138 @@ IMPLICIT_WAIT = 10  # seconds
 
 # Request Settings
 REQUEST_TIMEOUT = 30  # seconds
-REQUEST_DELAY = 2  # seconds between requests
+
+# 이벤트 대기 설정 (조건이 충족되면 즉시 진행, 값은 최대 대기 시간(초))
+WAIT_TIMEOUTS = {
+    'poll_interval': 0.1,  # 조건 확인 주기
+    'page_load': 10,  # 페이지 이동 후 문서 로딩 완료
+    'autocomplete': 3,  # 종목코드 입력 후 자동완성 목록 표시
+    'search_result': 2,  # 종목 선택 후 검색 결과 반영
+    'dropdown': 1,  # 드롭다운 옵션 채움/선택값 반영
+    'table_refresh': 3,  # 조회 버튼 클릭 후 데이터 테이블 갱신
+    'login': 5,  # 로그인 버튼 클릭 후 로그인 페이지 이탈
+}
 
 # File Paths
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "cache")
 
 # Create directories if they don't exist
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(LOG_DIR, exist_ok=True) 
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+# 로그인 세션 저장 설정 (저장된 쿠키가 유효하면 로그인 폼 생략)
+SESSION_CONFIG = {
+    'enabled': True,
+    'store_dir': os.path.join(CACHE_DIR, "sessions"),
+    'max_age_hours': 12,  # 저장 후 이 시간이 지나면 폐기
+    'bootstrap_url': f"{BASE_URL}/robots.txt",  # 쿠키 복원용 같은 도메인의 가벼운 페이지
+}
+
+# 요청 속도 제한 설정 (호스트의 모든 크롤러/스레드/프로세스가 공유하는 토큰 버킷)
+# 페이지 이동, 검색/조회 제출, HTTP 요청만 토큰을 소비함
+RATE_LIMIT_CONFIG = {
+    'enabled': True,
+    'rate': 2.0,  # 초당 허용 요청 수
+    'burst': 4,  # 순간적으로 허용되는 최대 요청 수
+    'state_dir': os.path.join(CACHE_DIR, "rate_limit"),  # 프로세스 간 공유 상태 파일 위치
+    'shared_rate_ttl': 60,  # 적응형 속도 조절로 바꾼 속도를 다른 프로세스가 따르는 시간(초, 조절한 프로세스가 요청할 때마다 연장)
+}
+
+# 계정별 설정 (계정마다 로그인 세션, 요청 속도 제한, 상태를 따로 관리)
+# 전체 요청 속도는 RATE_LIMIT_CONFIG가 상한이므로 계정을 늘릴 때는 함께 올려야 함
+ACCOUNT_CONFIG = {
+    'rate': 2.0,  # 계정별 초당 허용 요청 수
+    'burst': 4,  # 계정별 순간 허용 요청 수
+    'max_login_redirects': 2,  # 연속으로 로그인 페이지로 이동되면 해당 계정 사용 중단
+}
+
+# 적응형 속도 조절 설정 (AIMD: 정상이면 가산 증가, 오류가 늘면 승산 감소)
+THROTTLE_CONFIG = {
+    'enabled': False,
+    'window': 10,  # 한도를 재계산할 표본(종목) 수
+    'initial_concurrency': 2,  # 시작 동시성 (풀 크기를 넘지 않음)
+    'min_concurrency': 1,
+    'target_latency': 10.0,  # 종목당 처리 시간 p90 목표(초), 초과 시 증가 보류
+    'max_error_rate': 0.1,  # 이 비율을 넘는 오류(시간 초과/로그인 이동/HTTP 오류) 발생 시 감소
+    'decrease_factor': 0.5,  # 감소 배율
+    'rate_step': 0.2,  # 요청 속도 증가폭(초당)
+    'min_rate': 0.2,  # 요청 속도 하한(초당)
+    'max_rate': 10.0,  # 요청 속도 상한(초당, RATE_LIMIT_CONFIG['rate'] 등 버킷에 설정된 속도를 넘지 않음)
+    'history_size': 100,  # 보관할 한도 변경 이력 수
+}
+
+# 실행 기록(저널) 설정 - 중단된 실행 이어서 진행(--resume)용
+JOURNAL_CONFIG = {
+    'dir': os.path.join(DATA_DIR, "journal"),
+}
+
+# 분산 작업 큐 설정 (작업 = 종목 목록 x 기간 목록, (종목코드, 기간) 단위로 리스를 주고 처리)
+WORK_QUEUE_CONFIG = {
+    'db_file': os.path.join(CACHE_DIR, "work_queue.sqlite3"),  # 코디네이터의 큐 SQLite 파일
+    'server_url': os.getenv("FNGUIDE_QUEUE_URL"),  # 다른 머신의 큐 서버 주소 (없으면 로컬 SQLite 직접 사용)
+    'server_host': "127.0.0.1",  # 큐 서버 바인드 주소 (다른 머신의 워커를 받으려면 --host 0.0.0.0 등으로 지정)
+    'server_token': os.getenv("FNGUIDE_QUEUE_TOKEN"),  # 큐 서버 공유 토큰 (서버/워커 모두 같은 값, X-Queue-Token 헤더)
+    'server_port': 8765,  # 큐 서버 포트
+    'lease_seconds': 180,  # 리스 유효 시간 (하트비트가 끊기면 만료 후 다른 워커에 재배정)
+    'heartbeat_seconds': 30,  # 워커 하트비트 주기
+    'max_attempts': 3,  # 항목별 최대 시도 횟수 (초과 시 실패 처리)
+    'batch_size': 4,  # 한 번에 가져올 항목 수 (같은 종목의 여러 기간은 한 번의 검색으로 조회)
+    'idle_poll_seconds': 10,  # 가져올 항목이 없을 때 다른 워커의 리스 만료를 기다리는 주기
+}
+
+# 조회 결과 캐시 설정 ((종목코드, 기간) 단위)
+# 기간 종료 후 settlement_days가 지난 기간은 확정된 것으로 보고 만료 없이 보관
+RESULT_CACHE_CONFIG = {
+    'enabled': True,
+    'path': os.path.join(CACHE_DIR, "results.sqlite3"),
+    'settlement_days': 120,  # 기간 종료 후 수치가 확정되기까지의 일수
+    'open_period_ttl_seconds': 6 * 3600,  # 확정 전(최근) 기간의 유효 시간
+    'ttl_seconds': 24 * 3600,  # 기간 값을 해석할 수 없을 때의 유효 시간
+    'max_entries': 1000000,  # 최대 보관 항목 수 (초과 시 LRU 삭제, 종목 수 x 기간 수 이상 권장)
+    'evict_interval': 1000,  # 크기 제한 확인 주기 (저장 횟수, 시작 시에도 한 번 확인)
+}
+
+# 네트워크 응답 캡처 설정 (CDP 성능 로그로 결과 응답 본문을 받아 렌더링을 기다리지 않고 추출)
+NETWORK_CAPTURE_CONFIG = {
+    'enabled': False,
+    'url_patterns': ['ItemDetail'],  # 결과 데이터 응답으로 볼 URL 부분 문자열
+    'resource_types': ['Document', 'XHR', 'Fetch'],  # 대상 요청 유형
+    'mime_types': ['text/html', 'application/json', 'text/plain'],  # 파싱할 응답 형식
+}
+
+# 결과 페이지 HTML 보관 설정 (gzip 압축, 내용 해시 단위 저장 - reparse.py로 브라우저 없이 재파싱)
+HTML_ARCHIVE_CONFIG = {
+    'enabled': False,
+    'dir': os.path.join(DATA_DIR, "archive"),
+    'compress_level': 6,  # gzip 압축 수준 (1~9)
+    'reparse_workers': None,  # 재파싱 프로세스 수 (None: CPU 코어 수)
+}
+
+# 종목코드 해석 캐시 설정 (검색으로 찾은 결과 페이지 URL/종목명 저장, 다음 조회부터 자동완성 생략)
+STOCK_RESOLUTION_CONFIG = {
+    'enabled': True,
+    'cache_file': os.path.join(CACHE_DIR, "stock_resolution.json"),
+    'flush_interval': 100,  # 변경이 이만큼 쌓이면 파일에 기록 (크롤러 종료 시에도 기록)
+}
+
+# 크롬드라이버 캐시 설정 (크롬 메이저 버전이 바뀔 때만 다시 조회)
+DRIVER_CACHE_CONFIG = {
+    'enabled': True,
+    'cache_file': os.path.join(CACHE_DIR, "driver_cache.json"),
+}
+
+# 원격 WebDriver 설정 (Selenium standalone/grid 주소, 없으면 로컬 크롬 실행)
+# 예: FNGUIDE_REMOTE_DRIVERS="http://node1:4444/wd/hub,http://node2:4444/wd/hub"
+# 테스트용으로 로컬 standalone 서버(http://localhost:4444)를 지정할 수 있음
+REMOTE_DRIVER_CONFIG = {
+    'endpoints': [url.strip() for url in os.getenv("FNGUIDE_REMOTE_DRIVERS", "").split(",") if url.strip()],
+    'check_status': True,  # 세션 생성 전 /status로 준비 상태와 빈 슬롯 확인
+    'status_timeout': 3,  # /status 응답 대기 시간(초)
+    'max_sessions_per_endpoint': None,  # 주소별 최대 세션 수 (None: 제한 없음, /status의 슬롯 수 우선)
+}
 
 # 크롤러 기본 설정
 CRAWLER_CONFIG = {
@@ -75,6 +217,43 @@ CRAWLER_CONFIG = {
     'debug_mode': False,  # 디버그 안 보임
     # 'debug_mode': True,  # 디버그 모드
     'skip_step': 0,  # 디버그 모드에서 스킵할 단계
+    'pool_size': 1,  # 동시에 실행할 로그인 브라우저 수 (1: 순차 처리)
+    'lean_mode': False,  # 이미지/폰트/CSS/외부 스크립트 차단 및 비차단 페이지 로드
+    'fetch_mode': 'selenium',  # 'selenium': 브라우저 조회, 'http': 로그인 후 결과 페이지 직접 요청
+    'navigation_mode': 'ui',  # 'ui': 화면 조작 조회, 'direct': 조회 파라미터로 결과 페이지 바로 로드 (실패 시 화면 조작)
+    'query_macro': False,  # 구분/기간 선택, 조회, 테이블 추출을 한 번의 비동기 스크립트로 실행 (실패 시 화면 조작)
+    'tabs': 1,  # 한 브라우저에서 조회를 겹쳐 실행할 탭 수 (1: 탭 파이프라인 사용 안 함)
+}
+
+# 비동기 크롤링 엔진 설정
+ASYNC_ENGINE_CONFIG = {
+    'max_concurrency': 16,  # 동시에 진행할 최대 조회 수
+    'per_host_limit': 8,  # 호스트별 최대 동시 연결 수
+}
+
+# HTTP 조회 설정 (CRAWLER_CONFIG['fetch_mode']가 'http'일 때 적용)
+HTTP_CONFIG = {
+    'pool_connections': 4,  # 호스트별 keep-alive 연결 풀 수
+    'pool_maxsize': 10,  # 연결 풀 최대 크기
+    'retries': 2,  # 일시적 오류(502/503/504) 재시도 횟수
+    'backoff_factor': 0.5,  # 재시도 간격 계수
+}
+
+# 경량 모드 설정 (CRAWLER_CONFIG['lean_mode']가 True일 때 적용)
+LEAN_MODE_CONFIG = {
+    'page_load_strategy': 'none',  # 로드 완료를 기다리지 않음 (준비 여부는 조건 대기로 판단)
+    'blocked_url_patterns': [
+        # 이미지
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.webp', '*.bmp',
+        # 웹 폰트
+        '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+        # 스타일시트
+        '*.css',
+        # 광고/분석 스크립트
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*googlesyndication.com*', '*facebook.net*', '*criteo.*', '*wcs.naver.net*',
+        '*analytics.kakao.com*', '*hotjar.com*',
+    ],
 }
 
 # 파일 경로 설정
@@ -91,8 +270,17 @@ LOGGING_CONFIG = {
     'encoding': 'utf-8'
 }
 
-# CSV 파일 설정
+# 추출 항목 정의 (#contents 테이블에서 한 번의 순회로 모든 항목 추출)
+# - name: 결과/CSV 컬럼명
+# - row / column: 행 머리글(행의 첫 셀) / 열 머리글 텍스트 (공백 무시, 목록이면 그중 하나와 일치)
+# - row_index / col_index: 머리글을 찾지 못할 때 사용할 위치 (1부터, tbody의 행 / 행의 셀 순서)
+FIELD_SPECS = [
+    {'name': 'sales', 'column': ['매출액', '영업수익'], 'row_index': 4, 'col_index': 2},
+    {'name': 'operating_profit', 'column': '영업이익', 'row_index': 4, 'col_index': 3},
+]
+
+# CSV 파일 설정 (컬럼은 추출 항목 정의에서 생성)
 CSV_CONFIG = {
     'encoding': 'utf-8',
-    'columns': ['stock_code', 'stock_name', 'sales', 'operating_profit']
+    'columns': ['stock_code', 'stock_name'] + [spec['name'] for spec in FIELD_SPECS]
 } 
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+분산 크롤링 스크립트
+종목 목록 x 기간 목록을 작업 큐에 등록하고(coordinator), 여러 머신의 워커(worker)가
+항목을 나눠 처리하며, 다른 머신의 워커는 큐 서버(serve)를 통해 같은 큐를 사용
+
+큐 서버는 기본적으로 로컬(127.0.0.1)에만 바인드하며, 다른 머신의 워커를 받으려면 서버와
+워커 모두 FNGUIDE_QUEUE_TOKEN(공유 토큰)을 설정하고 --host로 바인드 주소를 지정한다.
+
+사용 예:
+    python main_distributed.py serve --host 0.0.0.0
+    python main_distributed.py coordinator --job-id 2024q --from 2015Q1 --to 2024Q4
+    python main_distributed.py worker --job-id 2024q --queue-url http://coordinator:8765
+    python main_distributed.py coordinator --job-id 2024q --status
+    python main_distributed.py coordinator --job-id 2024q --export result.csv
+"""
+import argparse
+
+from main_quater import parse_quarter
+from src.core.crawler_service import CrawlerService
+from src.core.queue_worker import QueueWorker
+from src.crawler.fnguide import build_quarter_value, period_range
+from src.utils.file_utils import FileManager, read_stock_codes
+from src.utils.logging_utils import LoggerManager
+from src.utils.work_queue import QueueServer, get_work_queue
+from config.config import CRAWLER_CONFIG, FILE_PATHS, CSV_CONFIG
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="분산 크롤링 (작업 큐)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    coordinator = subparsers.add_parser("coordinator", help="작업 등록, 진행 상황 확인, 결과 내보내기")
+    coordinator.add_argument("--job-id", required=True, help="작업 ID")
+    coordinator.add_argument("--queue-url", default=None, help="큐 서버 주소 (생략 시 로컬 SQLite 또는 FNGUIDE_QUEUE_URL)")
+    coordinator.add_argument("--codes", default=FILE_PATHS['stock_codes'], help="종목코드 파일")
+    coordinator.add_argument("--from", dest="start", type=parse_quarter, default=None, help="시작 분기 (예: 2015Q1)")
+    coordinator.add_argument("--to", dest="end", type=parse_quarter, default=None, help="끝 분기 (생략 시 --from과 같음)")
+    coordinator.add_argument("--from-year", type=int, default=None, help="시작 연도 (연간 데이터)")
+    coordinator.add_argument("--to-year", type=int, default=None, help="끝 연도 (생략 시 --from-year와 같음)")
+    coordinator.add_argument("--status", action="store_true", help="진행 상황만 출력")
+    coordinator.add_argument("--export", default=None, metavar="CSV", help="완료된 결과를 CSV로 저장")
+
+    worker = subparsers.add_parser("worker", help="큐의 항목을 받아 크롤링 (머신/브라우저마다 하나씩 실행)")
+    worker.add_argument("--job-id", required=True, help="작업 ID")
+    worker.add_argument("--queue-url", default=None, help="큐 서버 주소 (생략 시 로컬 SQLite 또는 FNGUIDE_QUEUE_URL)")
+    worker.add_argument("--worker-id", default=None, help="워커 ID (생략 시 호스트명-PID)")
+    worker.add_argument("--batch-size", type=int, default=None, help="한 번에 가져올 항목 수")
+
+    serve = subparsers.add_parser("serve", help="로컬 큐를 HTTP로 제공 (다른 머신의 워커용)")
+    serve.add_argument("--host", default=None, help="바인드 주소 (기본 127.0.0.1, 외부 공개 시 FNGUIDE_QUEUE_TOKEN 필요)")
+    serve.add_argument("--port", type=int, default=None, help="포트")
+    return parser.parse_args()
+
+
+def build_work_items(stock_codes, periods):
+    """종목 목록 x 기간 목록 -> (종목코드, 연도, 분기, 기간 값) 목록"""
+    return [
+        (code, year, quarter, build_quarter_value(year, quarter))
+        for code in stock_codes
+        for year, quarter in periods
+    ]
+
+
+def run_coordinator(args, logger):
+    """작업 등록 / 진행 상황 / 결과 내보내기"""
+    queue = get_work_queue(args.queue_url)
+
+    if args.export:
+        rows = queue.results(args.job_id)
+        columns = ['period'] + CSV_CONFIG['columns']
+        file_manager = FileManager(CSV_CONFIG['encoding'])
+        for idx, data in enumerate(rows):
+            file_manager.save_data_to_csv(data, args.export, columns, idx == 0)
+        logger.info(f"결과 내보내기 완료 - 파일: {args.export}, {len(rows)}건")
+        return
+
+    if not args.status:
+        if args.start:
+            periods = period_range(args.start, args.end or args.start)
+        elif args.from_year:
+            periods = period_range((args.from_year, None), (args.to_year or args.from_year, None))
+        else:
+            logger.error("--from 또는 --from-year로 기간을 지정하세요.")
+            return
+        stock_codes = read_stock_codes(args.codes)
+        if not stock_codes or not periods:
+            logger.error("등록할 종목 또는 기간이 없습니다.")
+            return
+        added = queue.create_job(args.job_id, build_work_items(stock_codes, periods))
+        logger.info(
+            f"작업 {args.job_id} 등록 - 종목 {len(stock_codes)}개 x 기간 {len(periods)}개, 새 항목 {added}건"
+        )
+
+    logger.info(f"작업 {args.job_id} 진행 상황: {queue.progress(args.job_id)}")
+
+
+def run_worker(args, logger):
+    """큐의 항목이 모두 끝날 때까지 크롤링"""
+    service = CrawlerService(
+        headless=CRAWLER_CONFIG['headless'],
+        debug_mode=False,
+        skip_step=CRAWLER_CONFIG['skip_step'],
+        log_dir=FILE_PATHS['log_dir']
+    )
+    service.logger = logger
+    worker = QueueWorker(
+        service,
+        get_work_queue(args.queue_url),
+        args.job_id,
+        worker_id=args.worker_id,
+        batch_size=args.batch_size,
+        logger=logger
+    )
+    try:
+        worker.run()
+    except KeyboardInterrupt:
+        logger.info("워커 중단 - 처리 중이던 항목은 리스 만료 후 다시 배정됩니다.")
+    finally:
+        service.close()
+
+
+def main():
+    """분산 크롤링 메인 함수"""
+    args = parse_args()
+    logger = LoggerManager(FILE_PATHS['log_dir']).setup_logger(__name__, f"distributed_{args.command}")
+
+    try:
+        if args.command == "serve":
+            QueueServer(host=args.host, port=args.port).serve_forever()
+        elif args.command == "coordinator":
+            run_coordinator(args, logger)
+        else:
+            run_worker(args, logger)
+    except KeyboardInterrupt:
+        logger.info("중단되었습니다.")
+    except Exception as e:
+        logger.error(f"분산 크롤링 중 오류 발생: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
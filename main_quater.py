@@ -2,7 +2,10 @@
 분기별 데이터 크롤링 메인 스크립트 (리팩토링 버전)
 새로운 모듈 구조를 사용하여 중복 코드 제거 및 구조 개선
 """
+import argparse
+
 from src.core.crawler_service import CrawlerService, CrawlingMode
+from src.crawler.fnguide import period_range
 from src.utils.file_utils import read_stock_codes
 from config.config import (
     CRAWLER_CONFIG, 
@@ -13,8 +16,43 @@ from config.config import (
 )
 
 
+def parse_quarter(text):
+    """'2024Q3' 형식의 분기 인자 파싱 -> (연도, 분기)"""
+    try:
+        year, quarter = text.upper().split("Q")
+        year, quarter = int(year), int(quarter)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"분기는 2024Q3 형식이어야 합니다: {text}")
+    if not (1 <= quarter <= 4):
+        raise argparse.ArgumentTypeError(f"분기는 1부터 4 사이여야 합니다: {text}")
+    return year, quarter
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="분기별 데이터 크롤링")
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="RUN_ID",
+        help="중단된 실행 이어서 진행 (RUN_ID 생략 시 같은 기간의 가장 최근 실행)"
+    )
+    parser.add_argument("--run-id", default=None, help="새 실행에 사용할 실행 ID")
+    parser.add_argument("--force-refresh", action="store_true", help="결과 캐시를 무시하고 모두 다시 조회")
+    parser.add_argument(
+        "--from", dest="start", type=parse_quarter, default=None,
+        help="여러 분기 조회 시작 분기 (예: 2015Q1, 지정 시 입력 없이 종목별 한 번의 검색으로 조회)"
+    )
+    parser.add_argument("--to", dest="end", type=parse_quarter, default=None, help="여러 분기 조회 끝 분기 (예: 2024Q4, 생략 시 --from과 같음)")
+    return parser.parse_args()
+
+
 def main():
     """분기별 데이터 크롤링 메인 함수"""
+    args = parse_args()
+    
     # 크롤러 서비스 초기화
     service = CrawlerService(
         headless=CRAWLER_CONFIG['headless'],
@@ -34,10 +72,18 @@ def main():
             logger.error("종목코드가 없습니다.")
             return
         
-        # 사용자 입력 받기 (연도, 분기)
-        year, quarter = service.get_user_input_quarterly()
-        if year is None or quarter is None:
-            return
+        # 기간 범위가 주어지면 입력 없이 사용, 아니면 사용자 입력 받기 (연도, 분기)
+        periods = None
+        if args.start:
+            periods = period_range(args.start, args.end or args.start)
+            if not periods:
+                logger.error("조회할 분기가 없습니다. --from/--to를 확인하세요.")
+                return
+            year, quarter = periods[0]
+        else:
+            year, quarter = service.get_user_input_quarterly()
+            if year is None or quarter is None:
+                return
         
         # 크롤러 초기화
         if not service.initialize_crawler(year, quarter):
@@ -49,12 +95,28 @@ def main():
             logger.error("로그인 실패")
             return
         
+        # 여러 기간: 종목별로 한 번 검색한 뒤 같은 페이지에서 기간만 바꿔 조회
+        if periods and len(periods) > 1:
+            file_name, success_count, failure_count = service.crawl_stock_periods(
+                stock_codes=stock_codes,
+                periods=periods,
+                csv_columns=CSV_CONFIG['columns'],
+                run_id=args.resume or args.run_id,
+                resume=args.resume is not None,
+                force_refresh=args.force_refresh
+            )
+            logger.info(f"크롤링 완료 - 파일: {file_name}, 성공: {success_count}, 실패: {failure_count}")
+            return
+        
         # 데이터 크롤링
         file_name, success_count, failure_count = service.crawl_stock_data(
             stock_codes=stock_codes,
             mode=CrawlingMode.QUARTERLY,
             csv_columns=CSV_CONFIG['columns'],
-            item_detail_url=ITEM_DETAIL_URL
+            item_detail_url=ITEM_DETAIL_URL,
+            run_id=args.resume or args.run_id,
+            resume=args.resume is not None,
+            force_refresh=args.force_refresh
         )
         
         logger.info(f"크롤링 완료 - 파일: {file_name}, 성공: {success_count}, 실패: {failure_count}")
@@ -0,0 +1,38 @@
+"""
+보관된 결과 페이지 HTML 재파싱 스크립트
+브라우저/로그인 없이 data/archive의 HTML을 다시 파싱하여 CSV로 저장
+"""
+import argparse
+
+from src.core.reparse import reparse_archive
+from src.utils.logging_utils import LoggerManager
+from config.config import FILE_PATHS
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="보관된 HTML 재파싱")
+    parser.add_argument("--period", default=None, help="재파싱할 기간 값 (예: 202412D, 2024093, 생략 시 전체)")
+    parser.add_argument("--output", default=None, help="CSV 파일명 (생략 시 자동 생성)")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (생략 시 CPU 코어 수)")
+    return parser.parse_args()
+
+
+def main():
+    """재파싱 메인 함수"""
+    args = parse_args()
+    logger = LoggerManager(FILE_PATHS['log_dir']).setup_logger(__name__, "reparse")
+
+    try:
+        reparse_archive(
+            period=args.period,
+            file_name=args.output,
+            workers=args.workers,
+            logger=logger
+        )
+    except Exception as e:
+        logger.error(f"재파싱 중 오류 발생: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
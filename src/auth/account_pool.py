@@ -0,0 +1,101 @@
+"""
+계정 풀 모듈
+여러 FnGuide 계정을 등록해 계정마다 로그인 세션, 요청 속도 제한, 상태를 따로 관리하고
+로그인 페이지로 계속 이동되는 계정은 사용을 중단함
+"""
+import hashlib
+import logging
+import threading
+from typing import List, Optional, Tuple
+
+from config.config import ACCOUNTS, ACCOUNT_CONFIG
+from src.utils.rate_limiter import get_rate_limiter, throttle
+
+
+class Account:
+    """계정 정보와 상태 클래스"""
+
+    def __init__(self, username: Optional[str], password: Optional[str]):
+        """
+        Args:
+            username: 계정 ID
+            password: 비밀번호
+        """
+        self.username = username
+        self.password = password
+        # 상태 파일명/로그에 계정 ID가 그대로 노출되지 않도록 해시 사용
+        self.key = hashlib.sha1(str(username).encode("utf-8")).hexdigest()[:8]
+        self.rate_limiter = get_rate_limiter(
+            f"account_{self.key}", ACCOUNT_CONFIG['rate'], ACCOUNT_CONFIG['burst']
+        )
+        self.enabled = True
+        self.login_redirects = 0  # 연속 로그인 페이지 이동 횟수
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """계정별 요청 토큰 획득"""
+        throttle(self.rate_limiter)
+
+    def record(self, status: Optional[str]):
+        """
+        조회 결과 상태 기록 (로그인 페이지 이동이 계속되면 사용 중단)
+
+        Args:
+            status: 크롤러 last_status ('ok', 'login_redirect' 등)
+        """
+        with self._lock:
+            if status == 'login_redirect':
+                self.login_redirects += 1
+                if self.enabled and self.login_redirects >= ACCOUNT_CONFIG['max_login_redirects']:
+                    self.enabled = False
+                    self.logger.warning(
+                        f"계정 {self} 로그인 페이지 이동 {self.login_redirects}회 연속 - 사용 중단"
+                    )
+            elif status == 'ok':
+                self.login_redirects = 0
+
+    def disable(self, reason: str):
+        """계정 사용 중단 (로그인 실패 등)"""
+        with self._lock:
+            if self.enabled:
+                self.enabled = False
+                self.logger.warning(f"계정 {self} 사용 중단: {reason}")
+
+    def __repr__(self):
+        return f"Account({self.key}{'' if self.enabled else ', disabled'})"
+
+
+class AccountPool:
+    """등록된 계정 목록 클래스"""
+
+    def __init__(self, credentials: Optional[List[Tuple[str, str]]] = None):
+        """
+        Args:
+            credentials: (ID, 비밀번호) 목록 (None이면 config.ACCOUNTS)
+        """
+        self.accounts = [Account(username, password) for username, password in (credentials or ACCOUNTS)]
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def __len__(self):
+        return len(self.accounts)
+
+    def healthy(self) -> List[Account]:
+        """사용 가능한 계정 목록"""
+        return [account for account in self.accounts if account.enabled]
+
+    def next_account(self) -> Optional[Account]:
+        """
+        사용 가능한 계정을 차례로 반환 (크롤러 생성 시 계정 분배용)
+
+        Returns:
+            Account 또는 사용 가능한 계정이 없으면 None
+        """
+        with self._lock:
+            for _ in range(len(self.accounts)):
+                account = self.accounts[self._next % len(self.accounts)]
+                self._next += 1
+                if account.enabled:
+                    return account
+            return None
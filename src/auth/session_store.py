@@ -0,0 +1,146 @@
+"""
+로그인 세션 저장소 모듈
+로그인 성공 후 쿠키/스토리지를 파일로 저장하고 새 드라이버에 복원하여
+매번 로그인 폼을 거치지 않도록 함
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Optional, Dict, Any
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.config import SESSION_CONFIG, WAIT_TIMEOUTS
+from src.utils.rate_limiter import get_rate_limiter, throttle
+
+_STORAGE_DUMP_SCRIPT = """
+var dump = function(storage) {
+    var result = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        result[key] = storage.getItem(key);
+    }
+    return result;
+};
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+_STORAGE_RESTORE_SCRIPT = """
+var data = arguments[0];
+Object.keys(data.local || {}).forEach(function(k) { window.localStorage.setItem(k, data.local[k]); });
+Object.keys(data.session || {}).forEach(function(k) { window.sessionStorage.setItem(k, data.session[k]); });
+"""
+
+
+class SessionStore:
+    """계정별 로그인 세션 저장소 클래스"""
+
+    def __init__(self, username: Optional[str], store_dir: Optional[str] = None):
+        """
+        Args:
+            username: 계정 ID (세션 파일 구분용)
+            store_dir: 세션 파일 저장 디렉토리
+        """
+        self.store_dir = store_dir or SESSION_CONFIG['store_dir']
+        self.logger = logging.getLogger(__name__)
+        # 파일명에 계정 ID가 그대로 노출되지 않도록 해시 사용
+        key = hashlib.sha1(str(username).encode("utf-8")).hexdigest()[:16]
+        self.file_path = os.path.join(self.store_dir, f"session_{key}.json")
+
+    def save(self, driver) -> bool:
+        """
+        현재 드라이버의 쿠키와 local/sessionStorage 저장
+
+        Args:
+            driver: 로그인된 WebDriver
+
+        Returns:
+            저장 성공 여부
+        """
+        try:
+            data = {
+                'saved_at': time.time(),
+                'cookies': driver.get_cookies(),
+                'storage': driver.execute_script(_STORAGE_DUMP_SCRIPT) or {},
+            }
+            os.makedirs(self.store_dir, exist_ok=True)
+            # 여러 워커가 동시에 저장해도 파일이 깨지지 않도록 임시 파일 후 교체
+            tmp_path = f"{self.file_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.file_path)
+            self.logger.info("로그인 세션 저장 완료")
+            return True
+        except (OSError, WebDriverException) as e:
+            self.logger.warning(f"로그인 세션 저장 실패: {str(e)}")
+            return False
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """저장된 세션 읽기 (만료되었거나 없으면 None)"""
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        max_age = SESSION_CONFIG['max_age_hours'] * 3600
+        if time.time() - data.get('saved_at', 0) > max_age:
+            self.logger.info("저장된 로그인 세션이 만료되었습니다.")
+            self.clear()
+            return None
+        return data
+
+    def restore(self, driver) -> bool:
+        """
+        저장된 세션을 드라이버에 복원
+
+        쿠키는 해당 도메인 페이지에서만 추가할 수 있으므로
+        가벼운 같은 도메인 페이지(bootstrap_url)로 먼저 이동한다.
+
+        Args:
+            driver: 새로 생성된 WebDriver
+
+        Returns:
+            복원 시도 여부 (실제 로그인 유효성은 호출 측에서 확인)
+        """
+        data = self.load()
+        if not data or not data.get('cookies'):
+            return False
+
+        try:
+            bootstrap_url = SESSION_CONFIG['bootstrap_url']
+            throttle(get_rate_limiter())
+            driver.get(bootstrap_url)
+            # 비차단 페이지 로드(경량 모드)에서도 해당 도메인으로 이동한 뒤 쿠키를 추가
+            origin = "/".join(bootstrap_url.split("/")[:3])
+            try:
+                WebDriverWait(driver, WAIT_TIMEOUTS['page_load']).until(
+                    lambda d: d.current_url.startswith(origin)
+                )
+            except TimeoutException:
+                return False
+            for cookie in data['cookies']:
+                cookie = dict(cookie)
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                try:
+                    driver.add_cookie(cookie)
+                except WebDriverException:
+                    # 다른 도메인 쿠키 등 추가할 수 없는 항목은 건너뜀
+                    continue
+            if data.get('storage'):
+                driver.execute_script(_STORAGE_RESTORE_SCRIPT, data['storage'])
+            return True
+        except WebDriverException as e:
+            self.logger.warning(f"로그인 세션 복원 실패: {str(e)}")
+            return False
+
+    def clear(self):
+        """저장된 세션 삭제"""
+        try:
+            os.remove(self.file_path)
+        except OSError:
+            pass
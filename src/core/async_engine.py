@@ -0,0 +1,293 @@
+"""
+비동기 크롤링 엔진 모듈
+asyncio로 수천 개의 (종목, 기간) 조회를 전역 동시성 상한과 호스트별 연결 제한 아래에서 스케줄링
+
+브라우저(Selenium) 작업은 전용 실행기에서, HTTP 조회는 별도 I/O 실행기에서 수행하므로
+두 방식을 섞어 사용할 수 있다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Any
+from urllib.parse import urlparse
+
+from src.core.throttle import AdaptiveThrottle
+from src.crawler.fnguide import FnGuideCrawler, build_quarter_value
+from src.crawler.http_fetcher import HttpFetcher
+from src.crawler import extractor
+from src.utils.file_utils import FileManager
+from src.utils.html_archive import get_html_archive
+from src.utils.result_cache import ResultCache, has_metrics
+from config.config import ASYNC_ENGINE_CONFIG, ITEM_DETAIL_URL
+
+# (종목코드, 연도, 분기) - 분기가 None이면 연간
+CrawlJob = Tuple[str, int, Optional[int]]
+
+
+class AsyncCrawlEngine:
+    """asyncio 기반 크롤링 엔진 클래스"""
+
+    def __init__(
+        self,
+        crawlers: List[FnGuideCrawler],
+        max_concurrency: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        logger: Optional[logging.Logger] = None,
+        result_cache: Optional[ResultCache] = None,
+        throttle: Optional[AdaptiveThrottle] = None,
+        retire_check: Optional[Callable[[FnGuideCrawler], bool]] = None,
+        force_refresh: bool = False
+    ):
+        """
+        Args:
+            crawlers: 로그인된 크롤러 목록 (브라우저 작업에 사용)
+            max_concurrency: 동시에 진행할 최대 조회 수
+            per_host_limit: 호스트별 최대 동시 연결 수
+            logger: 로거
+            result_cache: (종목코드, 기간) 결과 캐시 (적중 시 조회 생략)
+            throttle: 적응형 속도 조절 (조회마다 슬롯 사용 및 결과 기록)
+            retire_check: 브라우저 조회 후 호출해 True면 해당 크롤러 사용 중단 (계정 상태 확인)
+            force_refresh: True이면 캐시를 읽지 않고 조회 결과만 저장
+        """
+        if not crawlers:
+            raise ValueError("사용 가능한 크롤러가 없습니다.")
+        self.crawlers = crawlers
+        self.max_concurrency = max_concurrency or ASYNC_ENGINE_CONFIG['max_concurrency']
+        self.per_host_limit = per_host_limit or ASYNC_ENGINE_CONFIG['per_host_limit']
+        self.logger = logger or logging.getLogger(__name__)
+
+        # 브라우저는 인스턴스당 한 스레드, HTTP는 호스트 제한만큼의 스레드 사용
+        self._browser_executor = ThreadPoolExecutor(
+            max_workers=len(crawlers), thread_name_prefix="selenium"
+        )
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=self.per_host_limit, thread_name_prefix="http"
+        )
+        self._http_fetcher: Optional[HttpFetcher] = None
+        self._http_lock = threading.Lock()
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._html_archive = get_html_archive()
+        self.result_cache = result_cache
+        self.throttle = throttle
+        self.retire_check = retire_check
+        self.force_refresh = force_refresh
+        self._live_crawlers = len(crawlers)
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """호스트별 연결 제한 세마포어"""
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    def _throttled(self, fetch, *args) -> Optional[Dict[str, Any]]:
+        """적응형 속도 조절 슬롯 안에서 조회하고 응답 시간/결과 상태 기록"""
+        if self.throttle is None:
+            return fetch(*args)[0]
+        with self.throttle.slot():
+            started = time.monotonic()
+            status = 'error'
+            try:
+                data, status = fetch(*args)
+                return data
+            finally:
+                self.throttle.record(time.monotonic() - started, status)
+
+    def _fetch_http(self, fetcher: HttpFetcher, job: CrawlJob) -> Tuple[Optional[Dict[str, Any]], str]:
+        """HTTP 조회 (I/O 실행기에서 실행, (데이터, 결과 상태) 반환)"""
+        code, year, quarter = job
+        quarter_value = build_quarter_value(year, quarter)
+        mode = 'A' if quarter is None else 'Q'
+        html, status = fetcher.fetch(code, mode, quarter_value)
+        if html is None:
+            if status == 'login_redirect':
+                # 세션 만료: 다음 브라우저 조회 후 쿠키를 다시 복사
+                with self._http_lock:
+                    if self._http_fetcher is fetcher:
+                        self._http_fetcher = None
+            return None, status
+        # 서버가 종목코드를 무시/변경한 응답이면 브라우저 조회로 대체
+        if fetcher.form.read_code_values_html(html) != fetcher.form.code_values(code):
+            self.logger.warning(f"종목 {code} HTTP 응답의 종목이 요청과 다릅니다.")
+            return None, 'error'
+        data = extractor.parse_result_html(html, code, quarter_value)
+        if not has_metrics(data):
+            return None, 'error'
+        if self._html_archive is not None:
+            try:
+                self._html_archive.put(code, quarter_value, html, data.get('stock_name'))
+            except Exception as e:
+                self.logger.warning(f"종목 {code} HTML 보관 실패: {str(e)}")
+        return data, status
+
+    def _fetch_browser(self, crawler: FnGuideCrawler, job: CrawlJob) -> Tuple[Optional[Dict[str, Any]], str]:
+        """브라우저 조회 (브라우저 실행기에서 실행, (데이터, 결과 상태) 반환)"""
+        code, year, quarter = job
+        crawler.set_period(year, quarter)
+        crawler.last_status = None
+        data = crawler.get_item_detail(code)
+
+        # HTTP 조회 모드에서 요청 템플릿이 수집되면 HTTP 조회를 위한 공유 세션 준비
+        # (바로 이동 모드도 템플릿을 수집하므로 조회 방식을 함께 확인)
+        if (
+            has_metrics(data) and crawler.fetch_mode == 'http'
+            and crawler.item_form and self._http_fetcher is None
+        ):
+            with self._http_lock:
+                if self._http_fetcher is None:
+                    fetcher = HttpFetcher(crawler.item_form, crawler.rate_limiter, crawler.account_limiter)
+                    fetcher.sync_from_driver(crawler.driver)
+                    self._http_fetcher = fetcher
+                    self.logger.info("HTTP 조회 세션 준비 완료")
+        return data, crawler.last_status or ('ok' if has_metrics(data) else 'error')
+
+    async def _run_job(
+        self,
+        job: CrawlJob,
+        global_semaphore: asyncio.Semaphore,
+        idle_crawlers: "asyncio.Queue[Optional[FnGuideCrawler]]"
+    ) -> Tuple[CrawlJob, Optional[Dict[str, Any]]]:
+        """단일 조회 수행 (캐시 확인 후 HTTP 우선, 실패 시 브라우저, 오류는 실패로 반환)"""
+        code, year, quarter = job
+        period = build_quarter_value(year, quarter)
+        try:
+            if self.result_cache and not self.force_refresh:
+                data = self.result_cache.get(code, period)
+                if data:
+                    self.logger.info(f"종목 {code} ({period}) 캐시 사용")
+                    return job, data
+            async with global_semaphore:
+                data = await self._fetch(job, idle_crawlers)
+            if self.result_cache and has_metrics(data):
+                self.result_cache.put(code, period, data)
+            return job, data
+        except Exception as e:
+            self.logger.error(f"종목 {code} ({period}) 조회 작업 처리 중 오류 발생: {str(e)}")
+            return job, None
+
+    async def _fetch(
+        self,
+        job: CrawlJob,
+        idle_crawlers: "asyncio.Queue[Optional[FnGuideCrawler]]"
+    ) -> Optional[Dict[str, Any]]:
+        """HTTP 조회 후 실패하면 쉬는 브라우저로 조회 (사용 중단된 크롤러는 다른 크롤러로 재시도)"""
+        loop = asyncio.get_running_loop()
+        fetcher = self._http_fetcher
+        if fetcher is not None:
+            async with self._host_semaphore(fetcher.form.action):
+                data = await loop.run_in_executor(
+                    self._io_executor, self._throttled, self._fetch_http, fetcher, job
+                )
+            if has_metrics(data):
+                return data
+
+        while True:
+            crawler = await idle_crawlers.get()
+            if crawler is None:
+                # 모든 크롤러가 사용 중단됨: 대기 중인 다른 작업도 깨우도록 표시를 되돌려 놓음
+                idle_crawlers.put_nowait(None)
+                raise RuntimeError("사용 가능한 크롤러가 없습니다.")
+            retired = False
+            try:
+                async with self._host_semaphore(ITEM_DETAIL_URL):
+                    data = await loop.run_in_executor(
+                        self._browser_executor, self._throttled, self._fetch_browser, crawler, job
+                    )
+                retired = bool(self.retire_check and self.retire_check(crawler))
+            finally:
+                if not retired:
+                    idle_crawlers.put_nowait(crawler)
+                else:
+                    self._retire(crawler, idle_crawlers)
+            if data or not retired:
+                return data
+
+    def _retire(self, crawler: FnGuideCrawler, idle_crawlers: "asyncio.Queue[Optional[FnGuideCrawler]]"):
+        """크롤러를 더 이상 배정하지 않음 (마지막 크롤러면 대기 중인 작업에 종료 표시)"""
+        self.logger.warning("크롤러 계정 사용 중단 - 엔진에서 제외")
+        self._live_crawlers -= 1
+        if self._live_crawlers <= 0:
+            idle_crawlers.put_nowait(None)
+
+    async def results(
+        self, jobs: Iterable[CrawlJob]
+    ) -> AsyncIterator[Tuple[CrawlJob, Optional[Dict[str, Any]]]]:
+        """
+        조회를 동시에 수행하고 완료되는 순서대로 결과 반환
+
+        Args:
+            jobs: (종목코드, 연도, 분기) 목록
+
+        Yields:
+            (조회 작업, 데이터 또는 None)
+        """
+        global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        idle_crawlers: "asyncio.Queue[Optional[FnGuideCrawler]]" = asyncio.Queue()
+        for crawler in self.crawlers:
+            idle_crawlers.put_nowait(crawler)
+        self._live_crawlers = len(self.crawlers)
+
+        tasks = [
+            asyncio.create_task(self._run_job(job, global_semaphore, idle_crawlers))
+            for job in jobs
+        ]
+        try:
+            # _run_job은 오류를 (작업, None)으로 반환하므로 모든 작업의 결과가 전달됨
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def crawl_to_csv(
+        self,
+        jobs: Iterable[CrawlJob],
+        file_name: str,
+        columns: List[str],
+        file_manager: Optional[FileManager] = None
+    ) -> Tuple[int, int]:
+        """
+        조회 결과를 CSV 파일로 저장
+
+        Args:
+            jobs: (종목코드, 연도, 분기) 목록
+            file_name: CSV 파일명
+            columns: CSV 컬럼 리스트 ('period' 컬럼이 없으면 앞에 추가)
+            file_manager: 파일 매니저
+
+        Returns:
+            (성공 개수, 실패 개수)
+        """
+        file_manager = file_manager or FileManager()
+        columns = list(columns)
+        if 'period' not in columns:
+            columns.insert(0, 'period')
+        success_count = 0
+        failure_count = 0
+        is_first = True
+
+        async for job, data in self.results(jobs):
+            code = job[0]
+            period = build_quarter_value(job[1], job[2])
+            # 완료 순서대로 기록되므로 같은 종목의 기간을 구분할 수 있도록 기간 값 추가
+            row = dict(data) if data else {'stock_code': code}
+            row['period'] = period
+            if not has_metrics(data):
+                failure_count += 1
+                self.logger.warning(f"종목 {code} ({period}) 데이터 수집 실패")
+            else:
+                success_count += 1
+            file_manager.save_data_to_csv(row, file_name, columns, is_first)
+            is_first = False
+
+        self.logger.info(f"비동기 크롤링 완료 - 성공: {success_count}, 실패: {failure_count}")
+        return success_count, failure_count
+
+    def close(self):
+        """실행기 및 HTTP 세션 종료 (크롤러는 호출 측에서 종료)"""
+        self._browser_executor.shutdown(wait=False, cancel_futures=True)
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
+        if self._http_fetcher:
+            self._http_fetcher.close()
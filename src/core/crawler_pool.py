@@ -0,0 +1,163 @@
+"""
+크롤러 풀 모듈
+로그인된 여러 FnGuideCrawler 인스턴스가 공유 큐에서 종목코드를 받아 병렬로 처리
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
+
+from src.crawler.fnguide import FnGuideCrawler
+
+
+class CrawlerPool:
+    """로그인된 크롤러 인스턴스 풀 클래스"""
+
+    def __init__(
+        self,
+        size: int,
+        crawler_factory: Callable[[], Optional[FnGuideCrawler]],
+        crawlers: Optional[List[FnGuideCrawler]] = None,
+        logger: Optional[logging.Logger] = None,
+        retire_check: Optional[Callable[[FnGuideCrawler], bool]] = None
+    ):
+        """
+        Args:
+            size: 풀 크기 (동시에 사용할 브라우저 수)
+            crawler_factory: 로그인까지 완료된 크롤러를 생성하는 함수 (실패 시 None)
+            crawlers: 이미 로그인된 크롤러 목록 (풀에 그대로 포함됨)
+            logger: 로거
+            retire_check: 조회마다 호출되어 True를 반환하면 해당 크롤러를 작업에서 제외하는 함수
+                (데이터를 얻지 못한 종목은 다른 크롤러가 다시 처리)
+        """
+        self.size = max(1, size)
+        self.crawler_factory = crawler_factory
+        self.crawlers: List[FnGuideCrawler] = list(crawlers or [])
+        self._owned: List[FnGuideCrawler] = []
+        self.logger = logger or logging.getLogger(__name__)
+        self.retire_check = retire_check
+
+    def start(self) -> int:
+        """
+        부족한 크롤러를 병렬로 생성 및 로그인
+
+        Returns:
+            사용 가능한 크롤러 수
+        """
+        missing = self.size - len(self.crawlers)
+        if missing <= 0:
+            return len(self.crawlers)
+
+        self.logger.info(f"크롤러 풀 시작 - 추가 브라우저 {missing}개 생성")
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self._create_crawler) for _ in range(missing)]
+            for future in futures:
+                crawler = future.result()
+                if crawler:
+                    self.crawlers.append(crawler)
+                    self._owned.append(crawler)
+
+        self.logger.info(f"크롤러 풀 준비 완료 - 사용 가능 {len(self.crawlers)}/{self.size}")
+        return len(self.crawlers)
+
+    def _create_crawler(self) -> Optional[FnGuideCrawler]:
+        """크롤러 생성 (예외는 로그로 남기고 None 반환)"""
+        try:
+            return self.crawler_factory()
+        except Exception as e:
+            self.logger.error(f"풀 크롤러 생성 실패: {str(e)}")
+            return None
+
+    def run(
+        self,
+        stock_codes: List[str],
+        crawl_func: Callable[[FnGuideCrawler, str], Optional[Dict[str, Any]]]
+    ) -> Iterator[Tuple[int, str, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        공유 큐에서 종목코드를 나눠 처리하고 입력 순서대로 결과 반환
+
+        Args:
+            stock_codes: 종목코드 리스트
+            crawl_func: (크롤러, 종목코드)를 받아 데이터를 반환하는 함수
+
+        Yields:
+            (순번, 종목코드, 데이터, 예외) - 순번은 1부터 시작하며 입력 순서를 유지
+        """
+        if not self.crawlers:
+            raise ValueError("사용 가능한 크롤러가 없습니다.")
+
+        work_queue: "queue.Queue[Tuple[int, str]]" = queue.Queue()
+        for idx, code in enumerate(stock_codes, 1):
+            work_queue.put((idx, code))
+        result_queue: "queue.Queue[Tuple[int, str, Optional[Dict[str, Any]], Optional[Exception]]]" = queue.Queue()
+
+        active = [len(self.crawlers)]
+        active_lock = threading.Lock()
+
+        def finish_worker():
+            # 마지막 작업 스레드가 끝날 때 남은 종목이 있으면 (모든 크롤러 제외) 실패로 처리
+            with active_lock:
+                active[0] -= 1
+                if active[0] > 0:
+                    return
+            while True:
+                try:
+                    idx, code = work_queue.get_nowait()
+                except queue.Empty:
+                    return
+                result_queue.put((idx, code, None, RuntimeError("사용 가능한 크롤러가 없습니다.")))
+
+        def worker(crawler: FnGuideCrawler):
+            try:
+                while True:
+                    try:
+                        idx, code = work_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    crawler.last_status = None
+                    try:
+                        data = crawl_func(crawler, code)
+                    except Exception as e:
+                        result_queue.put((idx, code, None, e))
+                        continue
+                    if self.retire_check and self.retire_check(crawler):
+                        self.logger.warning("크롤러 계정 사용 중단 - 풀에서 제외")
+                        if data:
+                            result_queue.put((idx, code, data, None))
+                        else:
+                            work_queue.put((idx, code))
+                        return
+                    result_queue.put((idx, code, data, None))
+            finally:
+                finish_worker()
+
+        threads = [
+            threading.Thread(target=worker, args=(crawler,), daemon=True)
+            for crawler in self.crawlers
+        ]
+        for thread in threads:
+            thread.start()
+
+        # 완료 순서와 관계없이 입력 순서대로 내보내기 위해 버퍼링
+        pending = {}
+        next_idx = 1
+        for _ in range(len(stock_codes)):
+            item = result_queue.get()
+            pending[item[0]] = item
+            while next_idx in pending:
+                yield pending.pop(next_idx)
+                next_idx += 1
+
+        for thread in threads:
+            thread.join()
+
+    def close(self):
+        """풀에서 생성한 크롤러 종료 (외부에서 전달된 크롤러는 유지)"""
+        for crawler in self._owned:
+            try:
+                crawler.close()
+            except Exception as e:
+                self.logger.warning(f"풀 크롤러 종료 실패: {str(e)}")
+        self.crawlers = [c for c in self.crawlers if c not in self._owned]
+        self._owned = []
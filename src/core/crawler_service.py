@@ -2,16 +2,25 @@
 크롤러 서비스 모듈
 공통 크롤링 워크플로우 및 비즈니스 로직 제공
 """
+import asyncio
 import logging
+import os
 import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
-from bs4 import BeautifulSoup
 
-from src.crawler.fnguide import FnGuideCrawler
+from src.crawler.fnguide import FnGuideCrawler, build_quarter_value
+from src.crawler.extractor import empty_record
+from src.core.crawler_pool import CrawlerPool
+from src.core.async_engine import AsyncCrawlEngine
+from src.core.throttle import AdaptiveThrottle
 from src.utils.logging_utils import LoggerManager
 from src.utils.file_utils import FileManager
+from src.utils.run_journal import RunJournal, item_status
+from src.utils.result_cache import ResultCache, has_metrics
+from src.auth.account_pool import Account, AccountPool
+from config.config import CRAWLER_CONFIG, THROTTLE_CONFIG, RESULT_CACHE_CONFIG
 
 
 class CrawlingMode(Enum):
@@ -41,6 +50,12 @@ class CrawlerService:
         self.file_manager = FileManager(encoding)
         self.logger = None
         self.crawler = None
+        self.year = None
+        self.quarter = None
+        self.throttle = None
+        self.result_cache = ResultCache() if RESULT_CACHE_CONFIG['enabled'] else None
+        # 등록된 계정 (여러 계정이면 크롤러마다 계정을 나눠 로그인)
+        self.account_pool = AccountPool()
     
     def setup_logger(self, log_prefix: str = "crawler") -> logging.Logger:
         """로거 설정"""
@@ -66,25 +81,68 @@ class CrawlerService:
             초기화 성공 여부
         """
         try:
-            self.crawler = FnGuideCrawler(
-                headless=self.headless,
-                debug_mode=self.debug_mode,
-                skip_step=self.skip_step,
-                year=year,
-                quarter=quarter
-            )
+            self.year = year
+            self.quarter = quarter
+            self.crawler = self._create_crawler(self._next_account())
             return True
         except Exception as e:
             if self.logger:
                 self.logger.error(f"크롤러 초기화 실패: {str(e)}")
             return False
     
+    @property
+    def multi_account(self) -> bool:
+        """여러 계정이 등록되어 있는지 여부"""
+        return len(self.account_pool) > 1
+    
+    def _next_account(self) -> Optional[Account]:
+        """다음 크롤러에 배정할 계정 (한 계정이면 None - 기본 계정 설정 사용)"""
+        return self.account_pool.next_account() if self.multi_account else None
+    
+    def _create_crawler(self, account: Optional[Account] = None) -> FnGuideCrawler:
+        """현재 설정(연도/분기)으로 크롤러 생성"""
+        return FnGuideCrawler(
+            headless=self.headless,
+            debug_mode=self.debug_mode,
+            skip_step=self.skip_step,
+            year=self.year,
+            quarter=self.quarter,
+            account=account
+        )
+    
+    def _create_logged_in_crawler(self) -> Optional[FnGuideCrawler]:
+        """풀 작업용 크롤러 생성 및 로그인 (실패 시 None)"""
+        account = self._next_account()
+        if self.multi_account and account is None:
+            self.logger.error("사용 가능한 계정이 없습니다.")
+            return None
+        crawler = self._create_crawler(account)
+        if crawler.login():
+            return crawler
+        if account is not None:
+            account.disable("로그인 실패")
+        crawler.close()
+        return None
+    
+    def _account_retired(self, crawler: FnGuideCrawler) -> bool:
+        """
+        조회 후 크롤러 계정 상태 기록 (True면 해당 크롤러 사용 중단)
+        
+        로그인 페이지로 계속 이동되는 계정의 크롤러는 풀에서 빠지고,
+        처리하지 못한 종목은 다른 계정의 크롤러가 다시 처리한다.
+        """
+        account = crawler.account
+        if account is None:
+            return False
+        account.record(crawler.last_status)
+        return not account.enabled
+    
     def login(self, login_url: str) -> bool:
         """
         로그인 수행
         
         Args:
-            login_url: 로그인 URL
+            login_url: 로그인 URL (호환성 유지용, 실제 이동은 크롤러가 처리)
             
         Returns:
             로그인 성공 여부
@@ -95,7 +153,7 @@ class CrawlerService:
             return False
         
         try:
-            self.crawler.get_page(login_url)
+            # 저장된 세션이 유효하면 로그인 페이지 이동 없이 바로 완료됨
             success = self.crawler.login()
             
             if self.logger:
@@ -115,7 +173,11 @@ class CrawlerService:
         stock_codes: List[str],
         mode: CrawlingMode,
         csv_columns: List[str],
-        item_detail_url: Optional[str] = None
+        item_detail_url: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        run_id: Optional[str] = None,
+        resume: bool = False,
+        force_refresh: bool = False
     ) -> Tuple[str, int, int]:
         """
         종목 데이터 크롤링
@@ -125,6 +187,10 @@ class CrawlerService:
             mode: 크롤링 모드 (분기/연간)
             csv_columns: CSV 컬럼 리스트
             item_detail_url: 종목 상세 URL (연간 모드에서 필요)
+            pool_size: 동시에 사용할 브라우저 수 (None이면 CRAWLER_CONFIG['pool_size'])
+            run_id: 실행 ID (None이면 날짜/기간/시각으로 생성, resume 시 이어갈 실행)
+            resume: True이면 실행 기록에서 완료된 종목을 건너뛰고 같은 파일에 이어서 저장
+            force_refresh: True이면 결과 캐시를 무시하고 모두 다시 조회
             
         Returns:
             (파일명, 성공 개수, 실패 개수)
@@ -133,114 +199,505 @@ class CrawlerService:
             raise ValueError("크롤러 또는 로거가 초기화되지 않았습니다.")
         
         # CSV 파일명 생성
+        period = self.crawler.quarter_value
         if mode == CrawlingMode.QUARTERLY:
-            file_name = f'{datetime.now().strftime("%Y%m%d")}_{self.crawler.quarter_value}.csv'
+            file_name = f'{datetime.now().strftime("%Y%m%d")}_{period}.csv'
             log_prefix = "분기"
         else:
             file_name = f'{datetime.now().strftime("%Y%m%d")}_year.csv'
             log_prefix = "연간"
         
+        # 실행 기록 준비 (resume이면 기존 기록의 결과 파일과 완료 목록 사용)
+        journal, file_name, stock_codes = self._prepare_journal(
+            run_id, resume, period, file_name, stock_codes
+        )
+        is_first = not (resume and os.path.exists(file_name))
+        if not stock_codes:
+            self.logger.info("모든 종목이 이미 완료되었습니다.")
+            return file_name, 0, 0
+        
+        if pool_size is None:
+            pool_size = CRAWLER_CONFIG.get('pool_size', 1)
+        if self.multi_account:
+            # 계정마다 최소 한 개의 브라우저를 사용해 계정별 요청 한도를 모두 활용
+            pool_size = max(pool_size, len(self.account_pool.healthy()))
+        pool_size = min(pool_size, len(stock_codes))
+        
         self.logger.info(f"{log_prefix} 데이터 크롤링 시작")
         self.logger.info(f"총 {len(stock_codes)}개의 종목코드를 처리합니다.")
         
+        tabs = CRAWLER_CONFIG.get('tabs', 1)
+        use_tabs = pool_size == 1 and tabs > 1 and CRAWLER_CONFIG.get('fetch_mode') != 'http'
+        if THROTTLE_CONFIG['enabled']:
+            # 탭 파이프라인은 탭 수만큼 동시에 조회하므로 탭 수를 최대 동시성으로 사용
+            self.throttle = AdaptiveThrottle(
+                tabs if use_tabs else pool_size, self.crawler.rate_limiter, self.logger
+            )
+        
+        def crawl(crawler: FnGuideCrawler, code: str) -> Optional[Dict[str, Any]]:
+            if mode == CrawlingMode.ANNUAL:
+                # 연간 데이터 처리
+                return self._crawl_annual_data(code, item_detail_url, crawler)
+            # 분기 데이터 처리
+            return self._crawl_quarterly_data(code, item_detail_url, crawler)
+        
+        if self.throttle:
+            crawl = self._throttled(crawl)
+        if self.result_cache:
+            # 캐시 적중 시 속도 조절 슬롯/브라우저를 거치지 않음
+            crawl = self._cached(crawl, period, force_refresh)
+        
+        if pool_size > 1:
+            results = self._iter_pool_results(stock_codes, crawl, pool_size)
+        elif use_tabs:
+            results = self._iter_tab_results(stock_codes, period, tabs, force_refresh)
+        else:
+            results = self._iter_results(stock_codes, crawl, log_prefix)
+        
         success_count = 0
         failure_count = 0
-        is_first = True
         
-        for idx, code in enumerate(stock_codes, 1):
-            self.logger.info(f"[{idx}/{len(stock_codes)}] 종목 {code} {log_prefix} 데이터 수집 시작")
+        # 결과는 항상 입력 순서대로 도착하므로 하나의 파일에 순서대로 기록
+        for idx, code, data, error in results:
+            if error is not None:
+                failure_count += 1
+                self.logger.error(f"종목 {code} 처리 중 오류 발생: {str(error)}")
+                continue
             
-            try:
-                data = None
-                
-                if mode == CrawlingMode.ANNUAL:
-                    # 연간 데이터 처리
-                    data = self._crawl_annual_data(code, item_detail_url)
-                else:
-                    # 분기 데이터 처리
-                    data = self._crawl_quarterly_data(code, item_detail_url)
-                
-                # 데이터 저장
-                if self._save_crawled_data(data, file_name, csv_columns, is_first, code):
+            # 데이터 저장
+            if self._save_crawled_data(data, file_name, csv_columns, is_first, code):
+                success_count += 1
+                journal.record(code, period, item_status(data))
+                self.logger.info(f"[{idx}/{len(stock_codes)}] 종목 {code} 데이터 처리 완료")
+            else:
+                failure_count += 1
+                self.logger.error(f"종목 {code} 데이터 저장 실패")
+            
+            is_first = False
+        
+        self.logger.info(f"{log_prefix} 데이터 크롤링 완료 - 성공: {success_count}, 실패: {failure_count}")
+        return file_name, success_count, failure_count
+    
+    def crawl_stock_periods(
+        self,
+        stock_codes: List[str],
+        periods: List[Tuple[int, Optional[int]]],
+        csv_columns: List[str],
+        file_name: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        run_id: Optional[str] = None,
+        resume: bool = False,
+        force_refresh: bool = False
+    ) -> Tuple[str, int, int]:
+        """
+        여러 기간을 종목별 한 번의 검색으로 크롤링 ((종목, 기간)마다 한 행 저장)
+        
+        Args:
+            stock_codes: 종목코드 리스트
+            periods: (연도, 분기) 리스트 - 분기가 None이면 연간
+            csv_columns: CSV 컬럼 리스트 ('period' 컬럼이 없으면 앞에 추가)
+            file_name: CSV 파일명 (None이면 날짜와 기간 범위로 생성)
+            pool_size: 동시에 사용할 브라우저 수 (None이면 CRAWLER_CONFIG['pool_size'])
+            run_id: 실행 ID (None이면 날짜/기간/시각으로 생성, resume 시 이어갈 실행)
+            resume: True이면 실행 기록에서 완료된 (종목, 기간)을 건너뛰고 같은 파일에 이어서 저장
+            force_refresh: True이면 결과 캐시를 무시하고 모두 다시 조회
+            
+        Returns:
+            (파일명, 성공 개수, 실패 개수) - 개수는 (종목, 기간) 행 단위
+        """
+        if not self.crawler or not self.logger:
+            raise ValueError("크롤러 또는 로거가 초기화되지 않았습니다.")
+        if not periods:
+            raise ValueError("조회할 기간이 없습니다.")
+        
+        period_values = [build_quarter_value(year, quarter) for year, quarter in periods]
+        period_label = f"{period_values[0]}-{period_values[-1]}"
+        if file_name is None:
+            file_name = f'{datetime.now().strftime("%Y%m%d")}_{period_label}.csv'
+        columns = list(csv_columns)
+        if 'period' not in columns:
+            columns.insert(0, 'period')
+        
+        journal, file_name, stock_codes = self._prepare_journal(
+            run_id, resume, period_label, file_name, stock_codes, item_periods=period_values
+        )
+        is_first = not (resume and os.path.exists(file_name))
+        if not stock_codes:
+            self.logger.info("모든 종목/기간이 이미 완료되었습니다.")
+            return file_name, 0, 0
+        done = journal.completed()
+        
+        if pool_size is None:
+            pool_size = CRAWLER_CONFIG.get('pool_size', 1)
+        if self.multi_account:
+            # 계정마다 최소 한 개의 브라우저를 사용해 계정별 요청 한도를 모두 활용
+            pool_size = max(pool_size, len(self.account_pool.healthy()))
+        pool_size = min(pool_size, len(stock_codes))
+        
+        self.logger.info(f"다기간 크롤링 시작 - 종목 {len(stock_codes)}개, 기간 {len(periods)}개 ({period_label})")
+        
+        if THROTTLE_CONFIG['enabled']:
+            self.throttle = AdaptiveThrottle(pool_size, self.crawler.rate_limiter, self.logger)
+        
+        def crawl(crawler: FnGuideCrawler, code: str) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+            pending = [
+                period for period, value in zip(periods, period_values)
+                if (code, value) not in done
+            ]
+            return self._crawl_periods(crawler, code, pending, force_refresh)
+        
+        if self.throttle:
+            crawl = self._throttled(crawl)
+        
+        if pool_size > 1:
+            results = self._iter_pool_results(stock_codes, crawl, pool_size)
+        else:
+            results = self._iter_results(stock_codes, crawl, "다기간")
+        
+        success_count = 0
+        failure_count = 0
+        
+        for idx, code, rows, error in results:
+            if error is not None:
+                failure_count += 1
+                self.logger.error(f"종목 {code} 처리 중 오류 발생: {str(error)}")
+                continue
+            
+            for period, data in rows:
+                row = dict(data) if data else {'stock_code': code}
+                row['period'] = period
+                if self._save_crawled_data(row, file_name, columns, is_first, code):
                     success_count += 1
-                    self.logger.info(f"종목 {code} 데이터 처리 완료")
+                    journal.record(code, period, item_status(data))
                 else:
                     failure_count += 1
-                    self.logger.error(f"종목 {code} 데이터 저장 실패")
-                
+                    self.logger.error(f"종목 {code} ({period}) 데이터 저장 실패")
                 is_first = False
-                
+            self.logger.info(f"[{idx}/{len(stock_codes)}] 종목 {code} {len(rows)}개 기간 처리 완료")
+        
+        self.logger.info(f"다기간 크롤링 완료 - 성공: {success_count}, 실패: {failure_count}")
+        return file_name, success_count, failure_count
+    
+    def _crawl_periods(
+        self,
+        crawler: FnGuideCrawler,
+        code: str,
+        periods: List[Tuple[int, Optional[int]]],
+        force_refresh: bool = False
+    ) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        한 종목의 여러 기간 조회 (캐시된 기간은 브라우저 조회에서 제외)
+        
+        Returns:
+            (기간 값, 데이터 또는 None) 리스트 (입력 순서)
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        pending = []
+        for year, quarter in periods:
+            period = build_quarter_value(year, quarter)
+            data = None
+            if self.result_cache and not force_refresh:
+                data = self.result_cache.get(code, period)
+            if data:
+                results[period] = data
+            else:
+                pending.append((year, quarter))
+        if len(results) < len(periods):
+            self.logger.info(f"종목 {code} 캐시 사용 {len(results)}개, 조회 {len(pending)}개 기간")
+        
+        if pending:
+            for period, data in crawler.get_item_detail_periods(code, pending):
+                results[period] = data
+                if self.result_cache and has_metrics(data):
+                    self.result_cache.put(code, period, data)
+        
+        return [
+            (build_quarter_value(year, quarter), results.get(build_quarter_value(year, quarter)))
+            for year, quarter in periods
+        ]
+    
+    def _prepare_journal(
+        self,
+        run_id: Optional[str],
+        resume: bool,
+        period: str,
+        file_name: str,
+        stock_codes: List[str],
+        item_periods: Optional[List[str]] = None
+    ) -> Tuple[RunJournal, str, List[str]]:
+        """
+        실행 기록 준비
+        
+        Args:
+            item_periods: 종목마다 처리할 기간 값 리스트 (None이면 [period])
+        
+        Returns:
+            (실행 기록, 결과 파일명, 처리할 종목코드 리스트)
+        """
+        journal = None
+        if resume:
+            journal = RunJournal(run_id) if run_id else RunJournal.latest(period)
+            if journal is None or not journal.exists():
+                self.logger.warning("이어서 진행할 실행 기록이 없어 새로 시작합니다.")
+                journal = None
+        
+        if journal is None:
+            run_id = run_id or f'{datetime.now().strftime("%Y%m%d_%H%M%S")}_{period}'
+            journal = RunJournal(run_id)
+            journal.start(file_name, period=period)
+            self.logger.info(f"실행 ID: {journal.run_id}")
+            return journal, file_name, stock_codes
+        
+        file_name = journal.output_file() or file_name
+        done = journal.completed()
+        # 다시 조회할 항목의 빈 행은 결과 파일에서 지워 이어서 진행해도 행이 중복되지 않도록 함
+        retry = journal.failed()
+        if item_periods is None:
+            removed = self.file_manager.remove_rows(
+                file_name, ['stock_code'], {(code,) for code, item_period in retry if item_period == period}
+            )
+        else:
+            removed = self.file_manager.remove_rows(file_name, ['stock_code', 'period'], retry)
+        if removed:
+            self.logger.info(f"다시 조회할 항목의 빈 행 {removed}개를 결과 파일에서 삭제")
+        item_periods = item_periods or [period]
+        remaining = [
+            code for code in stock_codes
+            if any((code, item_period) not in done for item_period in item_periods)
+        ]
+        self.logger.info(
+            f"실행 {journal.run_id} 이어서 진행 - 완료 {len(stock_codes) - len(remaining)}개 건너뜀, "
+            f"남은 종목 {len(remaining)}개, 파일: {file_name}"
+        )
+        return journal, file_name, remaining
+    
+    def _cached(self, crawl, period: str, force_refresh: bool = False):
+        """(종목코드, 기간) 결과 캐시를 먼저 확인하고, 조회한 결과는 캐시에 저장하는 래퍼"""
+        def wrapper(crawler: FnGuideCrawler, code: str) -> Optional[Dict[str, Any]]:
+            if not force_refresh:
+                data = self.result_cache.get(code, period)
+                if data:
+                    self.logger.info(f"종목 {code} ({period}) 캐시 사용")
+                    return data
+            data = crawl(crawler, code)
+            if has_metrics(data):
+                self.result_cache.put(code, period, data)
+            return data
+        return wrapper
+    
+    def _throttled(self, crawl):
+        """적응형 속도 조절 슬롯 안에서 실행하고 응답 시간/결과 상태를 기록하는 래퍼"""
+        def wrapper(crawler: FnGuideCrawler, code: str) -> Optional[Dict[str, Any]]:
+            with self.throttle.slot():
+                crawler.last_status = None
+                started = time.monotonic()
+                data = None
+                try:
+                    data = crawl(crawler, code)
+                    return data
+                finally:
+                    status = crawler.last_status or ('ok' if data else 'error')
+                    self.throttle.record(time.monotonic() - started, status)
+        return wrapper
+    
+    def get_throttle_status(self) -> Optional[Dict[str, Any]]:
+        """현재 동시성/요청 속도 한도와 변경 사유 (속도 조절 비활성 시 None)"""
+        return self.throttle.status() if self.throttle else None
+    
+    def _iter_results(self, stock_codes: List[str], crawl, log_prefix: str):
+        """단일 크롤러로 종목을 순차 처리하며 (순번, 종목코드, 데이터, 예외) 반환"""
+        for idx, code in enumerate(stock_codes, 1):
+            self.logger.info(f"[{idx}/{len(stock_codes)}] 종목 {code} {log_prefix} 데이터 수집 시작")
+            try:
+                yield idx, code, crawl(self.crawler, code), None
             except Exception as e:
-                failure_count += 1
-                self.logger.error(f"종목 {code} 처리 중 오류 발생: {str(e)}")
-                continue
+                yield idx, code, None, e
+    
+    def _iter_tab_results(self, stock_codes: List[str], period: str, tabs: int, force_refresh: bool = False):
+        """
+        기본 크롤러의 여러 탭으로 조회를 겹쳐 처리하며 입력 순서대로 결과 반환
+        
+        캐시 적중 종목은 탭 파이프라인에 넣지 않는다. 적응형 속도 조절을 사용하면 동시에
+        조회하는 탭 수를 현재 동시성 한도 이하로 유지하고 종목별 결과를 기록해
+        시간 초과/오류 시 속도를 낮춘다.
+        """
+        cached = {}
+        if self.result_cache and not force_refresh:
+            for code in stock_codes:
+                data = self.result_cache.get(code, period)
+                if data:
+                    cached[code] = data
+        
+        fetched = self.crawler.iter_item_details_pipelined(
+            [code for code in stock_codes if code not in cached], tabs, self.throttle
+        )
+        try:
+            for idx, code in enumerate(stock_codes, 1):
+                if code in cached:
+                    self.logger.info(f"종목 {code} ({period}) 캐시 사용")
+                    yield idx, code, cached[code], None
+                    continue
+                # 파이프라인은 입력 순서대로 결과를 반환
+                _, data, error = next(fetched)
+                if error is None and self.result_cache and has_metrics(data):
+                    self.result_cache.put(code, period, data)
+                yield idx, code, data, error
+        finally:
+            fetched.close()
+    
+    def _iter_pool_results(self, stock_codes: List[str], crawl, pool_size: int):
+        """크롤러 풀로 종목을 병렬 처리하며 입력 순서대로 결과 반환"""
+        pool = CrawlerPool(
+            size=pool_size,
+            crawler_factory=self._create_logged_in_crawler,
+            crawlers=[self.crawler],
+            logger=self.logger,
+            retire_check=self._account_retired if self.multi_account else None
+        )
+        try:
+            pool.start()
+            yield from pool.run(stock_codes, crawl)
+        finally:
+            pool.close()
+    
+    def crawl_with_engine(
+        self,
+        stock_codes: List[str],
+        periods: List[Tuple[int, Optional[int]]],
+        csv_columns: List[str],
+        file_name: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        force_refresh: bool = False
+    ) -> Tuple[str, int, int]:
+        """
+        비동기 엔진으로 (종목, 기간) 조합을 동시에 크롤링
+        
+        결과 캐시, 적응형 속도 조절, 계정 상태 확인은 다른 크롤링 방식과 같이 적용된다.
+        결과가 완료 순서대로 기록되므로 실행 기록(저널)을 남기지 않으며 --resume을
+        지원하지 않는다 (중단 후 다시 실행하면 캐시된 결과는 조회하지 않음).
+        
+        Args:
+            stock_codes: 종목코드 리스트
+            periods: (연도, 분기) 리스트 - 분기가 None이면 연간
+            csv_columns: CSV 컬럼 리스트
+            file_name: CSV 파일명 (None이면 날짜로 생성)
+            pool_size: 브라우저 수 (None이면 CRAWLER_CONFIG['pool_size'])
+            force_refresh: True이면 결과 캐시를 무시하고 모두 다시 조회
+            
+        Returns:
+            (파일명, 성공 개수, 실패 개수)
+        """
+        if not self.crawler or not self.logger:
+            raise ValueError("크롤러 또는 로거가 초기화되지 않았습니다.")
+        
+        if file_name is None:
+            file_name = f'{datetime.now().strftime("%Y%m%d")}_engine.csv'
+        if pool_size is None:
+            pool_size = CRAWLER_CONFIG.get('pool_size', 1)
+        if self.multi_account:
+            # 계정마다 최소 한 개의 브라우저를 사용해 계정별 요청 한도를 모두 활용
+            pool_size = max(pool_size, len(self.account_pool.healthy()))
+        
+        jobs = [(code, year, quarter) for code in stock_codes for year, quarter in periods]
+        self.logger.info(f"비동기 크롤링 시작 - 조회 {len(jobs)}건, 브라우저 {pool_size}개")
+        
+        if THROTTLE_CONFIG['enabled']:
+            self.throttle = AdaptiveThrottle(pool_size, self.crawler.rate_limiter, self.logger)
+        
+        pool = CrawlerPool(
+            size=pool_size,
+            crawler_factory=self._create_logged_in_crawler,
+            crawlers=[self.crawler],
+            logger=self.logger
+        )
+        engine = None
+        try:
+            pool.start()
+            engine = AsyncCrawlEngine(
+                pool.crawlers,
+                logger=self.logger,
+                result_cache=self.result_cache,
+                force_refresh=force_refresh,
+                throttle=self.throttle,
+                retire_check=self._account_retired if self.multi_account else None
+            )
+            success_count, failure_count = asyncio.run(
+                engine.crawl_to_csv(jobs, file_name, csv_columns, self.file_manager)
+            )
+        finally:
+            if engine:
+                engine.close()
+            pool.close()
         
-        self.logger.info(f"{log_prefix} 데이터 크롤링 완료 - 성공: {success_count}, 실패: {failure_count}")
         return file_name, success_count, failure_count
     
-    def _crawl_annual_data(self, code: str, item_detail_url: str) -> Optional[Dict[str, Any]]:
-        """연간 데이터 크롤링"""
+    def _crawl_annual_data(
+        self,
+        code: str,
+        item_detail_url: str,
+        crawler: Optional[FnGuideCrawler] = None
+    ) -> Optional[Dict[str, Any]]:
+        """연간 데이터 크롤링 (crawler가 없으면 기본 크롤러 사용)"""
+        crawler = crawler or self.crawler
         try:
             self.logger.info(f"종목 {code} 연간 데이터 크롤링 시작")
             
+            # HTTP 조회 모드: 먼저 직접 요청하고 실패 시 아래 브라우저 조회로 대체
+            data = self._fetch_via_http(code, crawler)
+            if data:
+                return data
+            
+            # 바로 이동 모드: 조회 파라미터로 결과 페이지를 한 번에 로드하고 실패 시 화면 조작으로 대체
+            data = crawler.fetch_item_detail_direct(code)
+            if data:
+                return data
+            
             # 1. 검색창 페이지로 이동
             self.logger.info(f"검색 페이지로 이동: {item_detail_url}")
-            if not self.crawler.get_page(item_detail_url):
+            if not crawler.get_page(item_detail_url):
                 self.logger.error(f"종목 {code} 검색 페이지 이동 실패")
                 return None
             
-            # 페이지 로딩 대기
-            time.sleep(2)
+            # 세션 만료로 로그인 페이지로 이동된 경우 재로그인
+            if "login" in crawler.driver.current_url.lower():
+                crawler.last_status = 'login_redirect'
+                self.logger.warning(f"종목 {code} 조회 중 로그인 페이지로 이동됨. 재로그인 시도")
+                if not crawler.login(force=True):
+                    return None
             
-            # 2. 종목코드 검색
+            # 2. 종목코드 검색 (검색 결과 반영까지 내부에서 대기)
             self.logger.info(f"종목 {code} 검색 시작")
-            search_input = self.crawler._search_stock(code)
+            search_input = crawler._search_stock(code)
             if not search_input:
                 self.logger.error(f"종목 {code} 검색 실패")
                 return None
             
-            # 검색 결과 로딩 대기
-            time.sleep(1)
-            
             # 3. 연간 데이터 선택 및 조회
             self.logger.info(f"종목 {code} 연간 데이터 선택")
-            if not self.crawler.select_annual_data():
+            if not crawler.select_annual_data():
                 self.logger.error(f"종목 {code} 연간 데이터 선택 실패")
-                return {
-                    'stock_code': code,
-                    'stock_name': None,
-                    'sales': None,
-                    'operating_profit': None
-                }
-            
-            # 연간 데이터 조회 결과 로딩 대기
-            time.sleep(2)
+                return None
             
             # 4. 콘텐츠 로딩 대기
             self.logger.info(f"종목 {code} 데이터 로딩 대기")
-            if not self.crawler._wait_for_content_load():
+            if not crawler._wait_for_content_load():
                 self.logger.error(f"종목 {code} 콘텐츠 로딩 실패")
                 return None
             
             # 5. 데이터 추출 (get_item_detail 대신 직접 추출)
             self.logger.info(f"종목 {code} 데이터 추출 시작")
-            soup = BeautifulSoup(self.crawler.driver.page_source, 'lxml')
-            stock_name = search_input.get_attribute('value') if search_input else code
-            
-            # 데이터 추출
-            data = self.crawler._extract_stock_data(soup, code, stock_name)
+            data = crawler.extract_current_page(code)
+            stock_name = data.get('stock_name') if data else code
             
             if data:
                 self.logger.info(f"종목 {code} 연간 데이터 추출 성공: {data}")
+                # 계정 상태 기록용 (재로그인 후 성공한 경우는 로그인 페이지 이동으로 유지)
+                crawler.last_status = crawler.last_status or 'ok'
+                crawler.capture_item_form(code)
             else:
                 self.logger.warning(f"종목 {code} 연간 데이터 추출 실패 또는 데이터 없음")
                 # 데이터가 없어도 기본 구조는 반환
-                data = {
-                    'stock_code': code,
-                    'stock_name': stock_name,
-                    'sales': None,
-                    'operating_profit': None
-                }
+                data = empty_record(code, stock_name)
             
             return data
             
@@ -248,25 +705,34 @@ class CrawlerService:
             self.logger.error(f"종목 {code} 연간 데이터 크롤링 중 오류: {str(e)}")
             return None
     
-    def _crawl_quarterly_data(self, code: str, item_detail_url: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """분기 데이터 크롤링"""
+    def _crawl_quarterly_data(
+        self,
+        code: str,
+        item_detail_url: Optional[str] = None,
+        crawler: Optional[FnGuideCrawler] = None
+    ) -> Optional[Dict[str, Any]]:
+        """분기 데이터 크롤링 (crawler가 없으면 기본 크롤러 사용)"""
+        crawler = crawler or self.crawler
         try:
             self.logger.info(f"종목 {code} 분기 데이터 크롤링 시작")
             
-            # 분기 데이터의 경우 각 종목마다 검색 페이지로 이동
-            if item_detail_url:
+            # HTTP 조회 모드: 먼저 직접 요청하고 실패 시 아래 브라우저 조회로 대체
+            data = self._fetch_via_http(code, crawler)
+            if data:
+                return data
+            
+            # 분기 데이터의 경우 각 종목마다 검색 페이지로 이동 (바로 이동 가능하면 get_item_detail에서 처리)
+            if item_detail_url and not crawler.can_navigate_direct():
                 self.logger.info(f"검색 페이지로 이동: {item_detail_url}")
-                if not self.crawler.get_page(item_detail_url):
+                if not crawler.get_page(item_detail_url):
                     self.logger.error(f"종목 {code} 검색 페이지 이동 실패")
                     return None
                 
-                # 페이지 로딩 대기
-                time.sleep(1)
                 self.logger.info(f"검색 페이지 로딩 완료")
             
             # 기존 get_item_detail 메서드 사용 (내부적으로 검색 및 분기 선택 처리)
             self.logger.info(f"종목 {code} 데이터 추출 시작")
-            data = self.crawler.get_item_detail(code)
+            data = crawler.get_item_detail(code)
             
             if data:
                 self.logger.info(f"종목 {code} 데이터 추출 성공: {data}")
@@ -279,6 +745,20 @@ class CrawlerService:
             self.logger.error(f"종목 {code} 분기 데이터 크롤링 중 오류: {str(e)}")
             return None
     
+    def _fetch_via_http(self, code: str, crawler: FnGuideCrawler) -> Optional[Dict[str, Any]]:
+        """HTTP 조회 모드에서 브라우저 없이 데이터 조회 (실패 또는 비활성 시 None)"""
+        if crawler.fetch_mode != 'http':
+            return None
+        try:
+            data = crawler.fetch_item_detail_http(code)
+        except Exception as e:
+            self.logger.warning(f"종목 {code} HTTP 조회 중 오류, 브라우저로 대체: {str(e)}")
+            return None
+        if not has_metrics(data):
+            return None
+        self.logger.info(f"종목 {code} HTTP 조회 성공: {data}")
+        return data
+    
     def _save_crawled_data(
         self,
         data: Optional[Dict[str, Any]],
@@ -291,12 +771,7 @@ class CrawlerService:
         try:
             if not data:
                 # 데이터가 없는 경우 기본값으로 저장
-                data = {
-                    'stock_code': stock_code,
-                    'stock_name': None,
-                    'sales': None,
-                    'operating_profit': None
-                }
+                data = empty_record(stock_code, None)
             
             return self.file_manager.save_data_to_csv(
                 data, file_name, csv_columns, is_first
@@ -0,0 +1,171 @@
+"""
+분산 작업 큐 워커 모듈
+작업 큐에서 (종목코드, 기간) 항목을 받아 크롤링하고 결과를 큐에 기록
+"""
+import logging
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.crawler_service import CrawlerService
+from src.utils.result_cache import has_metrics
+from config.config import WORK_QUEUE_CONFIG
+
+
+def default_worker_id() -> str:
+    """머신/프로세스별 워커 ID"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class QueueWorker:
+    """작업 큐 워커 클래스"""
+
+    def __init__(
+        self,
+        service: CrawlerService,
+        queue,
+        job_id: str,
+        worker_id: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            service: 크롤러 서비스 (크롤러는 첫 항목을 받을 때 생성/로그인)
+            queue: WorkQueue 또는 RemoteWorkQueue
+            job_id: 작업 ID
+            worker_id: 워커 ID (None이면 호스트명-PID)
+            batch_size: 한 번에 가져올 항목 수
+            logger: 로거
+        """
+        self.service = service
+        self.queue = queue
+        self.job_id = job_id
+        self.worker_id = worker_id or default_worker_id()
+        self.batch_size = batch_size or WORK_QUEUE_CONFIG['batch_size']
+        self.logger = logger or logging.getLogger(__name__)
+        self._stop = threading.Event()
+
+    def stop(self):
+        """현재 항목 처리 후 중지"""
+        self._stop.set()
+
+    def run(self) -> Tuple[int, int]:
+        """
+        처리할 항목이 없을 때까지 가져와 처리
+
+        다른 워커가 처리 중인 항목이 남아 있으면 리스 만료로 재배정될 수 있으므로
+        모두 끝날 때까지 기다린다.
+
+        Returns:
+            (완료 수, 반환 수)
+        """
+        completed = released = 0
+        self.logger.info(f"워커 {self.worker_id} 시작 - 작업 {self.job_id}")
+        while not self._stop.is_set():
+            items = self.queue.claim(self.job_id, self.worker_id, self.batch_size)
+            if not items:
+                progress = self.queue.progress(self.job_id)
+                if not progress['pending'] and not progress['leased']:
+                    break
+                self._stop.wait(WORK_QUEUE_CONFIG['idle_poll_seconds'])
+                continue
+
+            with self._heartbeat():
+                # claim은 (종목코드, 기간) 순서이므로 같은 종목은 연속됨
+                for code, group in groupby(items, key=lambda item: item['code']):
+                    done, failed = self._process(code, list(group))
+                    completed += done
+                    released += failed
+            self.logger.info(f"작업 {self.job_id} 진행 상황: {self.queue.progress(self.job_id)}")
+
+        self.logger.info(f"워커 {self.worker_id} 종료 - 완료: {completed}, 반환: {released}")
+        return completed, released
+
+    @contextmanager
+    def _heartbeat(self):
+        """항목을 처리하는 동안 주기적으로 리스 연장"""
+        finished = threading.Event()
+
+        def beat():
+            while not finished.wait(WORK_QUEUE_CONFIG['heartbeat_seconds']):
+                try:
+                    self.queue.heartbeat(self.job_id, self.worker_id)
+                except Exception as e:
+                    self.logger.warning(f"하트비트 실패: {str(e)}")
+
+        thread = threading.Thread(target=beat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            finished.set()
+            thread.join()
+
+    def _ensure_crawler(self, item: Dict[str, Any]) -> bool:
+        """첫 항목의 기간으로 크롤러 생성 및 로그인"""
+        if self.service.crawler is not None:
+            return True
+        if not self.service.initialize_crawler(item['year'], item['quarter']):
+            return False
+        return self.service.crawler.login()
+
+    def _process(self, code: str, items: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        한 종목의 여러 기간 처리 (캐시에 없는 기간만 한 번의 검색으로 조회)
+
+        Returns:
+            (완료 수, 반환 수)
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        error = None
+        cache = self.service.result_cache
+        pending = []
+        for item in items:
+            data = cache.get(code, item['period']) if cache else None
+            if has_metrics(data):
+                results[item['period']] = data
+            else:
+                pending.append(item)
+
+        if pending and not self._ensure_crawler(pending[0]):
+            # 로그인할 수 없는 워커가 항목의 시도 횟수를 소진하지 않도록 중지
+            error = "크롤러 초기화 또는 로그인 실패"
+            self.logger.error(f"워커 {self.worker_id} {error} - 중지")
+            self.stop()
+            pending = []
+        if pending:
+            try:
+                fetched = self.service.crawler.get_item_detail_periods(
+                    code, [(item['year'], item['quarter']) for item in pending]
+                )
+                for item, (_, data) in zip(pending, fetched):
+                    results[item['period']] = data
+                    if cache and has_metrics(data):
+                        cache.put(code, item['period'], data)
+            except Exception as e:
+                error = str(e)
+                self.logger.error(f"종목 {code} 처리 중 오류 발생: {error}")
+
+        completed = released = 0
+        for item in items:
+            data = results.get(item['period'])
+            if has_metrics(data):
+                self.queue.complete(self.job_id, self.worker_id, code, item['period'], data)
+                completed += 1
+            elif data is not None and error is None:
+                # 조회는 성공했지만 사이트에 데이터가 없으면 빈 결과로 완료 (다시 검색하지 않음)
+                self.queue.complete(
+                    self.job_id, self.worker_id, code, item['period'], {**data, 'empty': True}
+                )
+                completed += 1
+            else:
+                # 조회 실패(오류, 검색/대기 실패 등)만 반환해 다시 시도
+                self.queue.release(
+                    self.job_id, self.worker_id, code, item['period'], error or "조회 실패"
+                )
+                released += 1
+        return completed, released
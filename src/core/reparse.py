@@ -0,0 +1,93 @@
+"""
+오프라인 재파싱 모듈
+보관된 결과 페이지 HTML을 브라우저 없이 모든 CPU 코어로 다시 파싱하여 CSV로 저장
+(파서 수정이나 지표 추가 시 전체 재수집 대신 사용)
+"""
+import gzip
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.crawler import extractor
+from src.utils.file_utils import FileManager
+from src.utils.html_archive import HtmlArchive
+from config.config import HTML_ARCHIVE_CONFIG, CSV_CONFIG
+
+# (압축 파일 경로, 종목코드, 기간 값, 종목명)
+ReparseTask = Tuple[str, str, str, Optional[str]]
+
+
+def _parse_archived(task: ReparseTask) -> Dict[str, Any]:
+    """보관된 HTML 한 건 파싱 (작업 프로세스에서 실행)"""
+    path, code, period, stock_name = task
+    data = None
+    try:
+        with open(path, "rb") as f:
+            html = gzip.decompress(f.read()).decode("utf-8")
+        # 보관 시점에 기간 확인을 마쳤으므로 선택 기간은 다시 확인하지 않음
+        data = extractor.parse_result_html(html, code)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"종목 {code} ({period}) 재파싱 실패: {str(e)}")
+    data = data or {'stock_code': code, 'stock_name': stock_name}
+    if stock_name:
+        # 페이지 소스에는 입력한 종목명(value 속성)이 남지 않으므로 보관 시점의 종목명 사용
+        data['stock_name'] = stock_name
+    data['period'] = period
+    return data
+
+
+def reparse_archive(
+    period: Optional[str] = None,
+    file_name: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    archive: Optional[HtmlArchive] = None,
+    logger: Optional[logging.Logger] = None
+) -> Tuple[Optional[str], int]:
+    """
+    보관된 HTML을 다시 파싱하여 CSV로 저장
+
+    Args:
+        period: 이 기간만 재파싱 (None이면 전체 기간, 'period' 컬럼 추가)
+        file_name: CSV 파일명 (None이면 자동 생성)
+        columns: CSV 컬럼 리스트 (None이면 CSV_CONFIG['columns'])
+        workers: 작업 프로세스 수 (None이면 설정값 또는 CPU 코어 수)
+        archive: HTML 보관소
+        logger: 로거
+
+    Returns:
+        (CSV 파일명, 저장한 행 수) - 보관된 HTML이 없으면 (None, 0)
+    """
+    logger = logger or logging.getLogger(__name__)
+    archive = archive or HtmlArchive()
+    workers = workers or HTML_ARCHIVE_CONFIG['reparse_workers'] or os.cpu_count() or 1
+    columns = list(columns or CSV_CONFIG['columns'])
+    if period is None and 'period' not in columns:
+        columns.insert(0, 'period')
+
+    tasks: List[ReparseTask] = [
+        (archive.object_path(entry['sha256']), entry['code'], entry['period'], entry['stock_name'])
+        for entry in archive.entries(period)
+    ]
+    if not tasks:
+        logger.warning("재파싱할 보관 HTML이 없습니다.")
+        return None, 0
+
+    if file_name is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        file_name = f"reparse_{period or 'all'}_{timestamp}.csv"
+
+    logger.info(f"재파싱 시작 - {len(tasks)}건, 프로세스 {workers}개")
+    file_manager = FileManager(CSV_CONFIG['encoding'])
+    chunksize = max(1, len(tasks) // (workers * 4))
+    count = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map은 입력 순서(기간, 종목코드)대로 결과를 반환
+        for data in executor.map(_parse_archived, tasks, chunksize=chunksize):
+            file_manager.save_data_to_csv(data, file_name, columns, count == 0)
+            count += 1
+
+    logger.info(f"재파싱 완료 - 파일: {file_name}, {count}건")
+    return file_name, count
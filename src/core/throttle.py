@@ -0,0 +1,142 @@
+"""
+적응형 속도 조절 모듈
+관찰된 페이지 응답 시간과 오류를 바탕으로 동시성/요청 속도를 AIMD 방식으로 조절
+
+- 정상 구간: 동시성 +1, 요청 속도 +rate_step (가산 증가)
+- 오류 증가: 동시성/요청 속도 x decrease_factor (승산 감소)
+"""
+import logging
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, List, Optional
+
+from src.utils.rate_limiter import TokenBucketRateLimiter
+from config.config import THROTTLE_CONFIG
+
+# 속도를 낮춰야 하는 결과 상태
+ERROR_STATUSES = ('timeout', 'login_redirect', 'http_error', 'error')
+
+
+class AdaptiveThrottle:
+    """AIMD 기반 동시성/요청 속도 조절 클래스"""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            max_concurrency: 최대 동시성 (풀 크기)
+            rate_limiter: 요청 속도를 조절할 토큰 버킷 (None이면 동시성만 조절)
+            logger: 로거
+        """
+        self.config = THROTTLE_CONFIG
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = min(self.config['min_concurrency'], self.max_concurrency)
+        self.rate_limiter = rate_limiter
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.limit = max(self.min_concurrency, min(self.config['initial_concurrency'], self.max_concurrency))
+        self.rate = rate_limiter.rate if rate_limiter else None
+
+        self._active = 0
+        self._condition = threading.Condition()
+        self._samples: List[Dict[str, Any]] = []
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=self.config['history_size'])
+
+    @contextmanager
+    def slot(self):
+        """현재 동시성 한도 안에서 작업 슬롯 획득"""
+        with self._condition:
+            while self._active >= self.limit:
+                self._condition.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def record(self, latency: float, status: str):
+        """
+        작업 결과 기록 (window 개수만큼 쌓이면 한도 재계산)
+
+        Args:
+            latency: 종목 처리 시간(초)
+            status: 'ok', 'timeout', 'login_redirect', 'http_error', 'error'
+        """
+        with self._condition:
+            self._samples.append({'latency': latency, 'status': status})
+            if len(self._samples) >= self.config['window']:
+                self._evaluate()
+                self._samples = []
+
+    def _evaluate(self):
+        """표본을 평가해 한도 조정 (잠금 보유 상태에서 호출)"""
+        statuses = Counter(sample['status'] for sample in self._samples)
+        errors = sum(statuses[status] for status in ERROR_STATUSES)
+        error_rate = errors / len(self._samples)
+        latencies = sorted(sample['latency'] for sample in self._samples)
+        p90 = latencies[int(len(latencies) * 0.9) - 1] if len(latencies) >= 10 else latencies[-1]
+
+        if error_rate > self.config['max_error_rate']:
+            detail = ", ".join(f"{status} {statuses[status]}" for status in ERROR_STATUSES if statuses[status])
+            self._apply(
+                max(self.min_concurrency, int(self.limit * self.config['decrease_factor'])),
+                self._bounded_rate(self.rate * self.config['decrease_factor']) if self.rate else None,
+                f"감소: 오류율 {error_rate:.0%} ({detail})"
+            )
+        elif p90 > self.config['target_latency']:
+            self._record_history(f"유지: p90 응답 {p90:.1f}초 > 목표 {self.config['target_latency']}초")
+        else:
+            self._apply(
+                min(self.max_concurrency, self.limit + 1),
+                self._bounded_rate(self.rate + self.config['rate_step']) if self.rate else None,
+                f"증가: 오류율 {error_rate:.0%}, p90 응답 {p90:.1f}초"
+            )
+
+    def _bounded_rate(self, rate: float) -> float:
+        """요청 속도 상/하한 적용 (버킷에 설정된 속도를 넘지 않음)"""
+        max_rate = self.config['max_rate']
+        if self.rate_limiter:
+            max_rate = min(max_rate, self.rate_limiter.base_rate)
+        return min(max_rate, max(self.config['min_rate'], rate))
+
+    def _apply(self, limit: int, rate: Optional[float], reason: str):
+        """새 한도 적용"""
+        changed = limit != self.limit or rate != self.rate
+        self.limit = limit
+        self.rate = rate
+        if rate and self.rate_limiter:
+            self.rate_limiter.set_rate(rate)
+        self._condition.notify_all()
+        if changed:
+            self._record_history(reason)
+
+    def _record_history(self, reason: str):
+        """한도 변경 이력 기록"""
+        entry = {
+            'time': time.time(),
+            'limit': self.limit,
+            'rate': self.rate,
+            'reason': reason,
+        }
+        self.history.append(entry)
+        rate_text = f"{self.rate:.2f}/초" if self.rate else "-"
+        self.logger.info(f"[속도 조절] 동시성 {self.limit}, 요청 속도 {rate_text} - {reason}")
+
+    def status(self) -> Dict[str, Any]:
+        """현재 한도와 최근 변경 사유"""
+        with self._condition:
+            return {
+                'limit': self.limit,
+                'rate': self.rate,
+                'active': self._active,
+                'last_reason': self.history[-1]['reason'] if self.history else None,
+                'history': list(self.history),
+            }
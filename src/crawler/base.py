@@ -1,31 +1,61 @@
 import logging
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
-from config.config import WEBDRIVER_TIMEOUT, IMPLICIT_WAIT, REQUEST_DELAY
+from config.config import (
+    WEBDRIVER_TIMEOUT,
+    IMPLICIT_WAIT,
+    WAIT_TIMEOUTS,
+    CRAWLER_CONFIG,
+    LEAN_MODE_CONFIG,
+    NETWORK_CAPTURE_CONFIG
+)
+from . import waits
+from . import network_capture
+from .driver_factory import create_driver, release_driver
+from src.utils.rate_limiter import get_rate_limiter, throttle
 
 class BaseCrawler:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, lean_mode=None, capture_network=None):
         """
         기본 크롤러 초기화
         
         Args:
             headless (bool): 브라우저 화면 표시 여부 (True: 화면 없음, False: 화면 표시)
+            lean_mode (bool, optional): 이미지/폰트/CSS/외부 스크립트 차단 모드
+                (None이면 CRAWLER_CONFIG['lean_mode'] 사용)
+            capture_network (bool, optional): CDP 네트워크 이벤트로 결과 응답 본문 캡처
+                (None이면 NETWORK_CAPTURE_CONFIG['enabled'] 사용)
         """
         self.logger = self._setup_logger()
+        # 외부로 나가는 페이지 이동/제출만 토큰을 소비하는 공유 속도 제한기
+        self.rate_limiter = get_rate_limiter()
+        if lean_mode is None:
+            lean_mode = CRAWLER_CONFIG.get('lean_mode', False)
+        self.lean_mode = lean_mode
+        if capture_network is None:
+            capture_network = NETWORK_CAPTURE_CONFIG.get('enabled', False)
+        self.capture_network = capture_network
+        # 마지막 조회 결과 상태 ('ok', 'timeout', 'login_redirect', 'http_error', 'error')
+        self.last_status = None
+        self.driver_endpoint = None  # 원격 WebDriver 주소 (로컬 크롬이면 None)
         self.driver = self._setup_driver(headless)
         self.wait = WebDriverWait(self.driver, WEBDRIVER_TIMEOUT)
+        # 명령을 보내는 탭 (탭 파이프라인에서 전환, 매 명령마다 조회하지 않도록 직접 추적)
+        self.current_tab = self.driver.current_window_handle
+        # 결과 응답 캡처기 (사용하지 않거나 CDP를 쓸 수 없으면 None)
+        self.network_capture = self._setup_network_capture() if capture_network else None
         
     def _setup_logger(self):
         """로깅 설정 초기화"""
         logger = logging.getLogger(__name__)
         logger.setLevel(logging.INFO)
         
+        # 여러 인스턴스(크롤러 풀)가 같은 로거를 공유하므로 핸들러는 한 번만 추가
+        if logger.handlers:
+            return logger
+        
         # 로그 핸들러 생성
         c_handler = logging.StreamHandler()
         f_handler = logging.FileHandler('logs/crawler.log')
@@ -55,13 +85,47 @@ class BaseCrawler:
             chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
+        if self.lean_mode:
+            # 페이지 로드 완료를 기다리지 않고, 준비 여부는 get_page의 조건 대기로 판단
+            chrome_options.page_load_strategy = LEAN_MODE_CONFIG['page_load_strategy']
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+            })
+        if self.capture_network:
+            network_capture.chrome_options(chrome_options)
         
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        # 원격 주소가 설정되어 있으면 부하가 가장 적은 주소에, 없으면 로컬 크롬으로 생성
+        driver, self.driver_endpoint = create_driver(chrome_options)
         driver.implicitly_wait(IMPLICIT_WAIT)
+        if self.lean_mode:
+            self._block_resources(driver)
         
         return driver
         
+    def _block_resources(self, driver):
+        """
+        CDP로 불필요한 리소스(이미지, 폰트, CSS, 광고/분석 스크립트) 요청 차단
+        
+        Args:
+            driver: 크롬 웹드라이버
+        """
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                'urls': LEAN_MODE_CONFIG['blocked_url_patterns']
+            })
+            self.logger.info("경량 모드: 불필요한 리소스 차단 활성화")
+        except (AttributeError, WebDriverException) as e:
+            self.logger.warning(f"경량 모드 리소스 차단 설정 실패: {str(e)}")
+        
+    def _setup_network_capture(self):
+        """CDP 네트워크 캡처 시작 (실패 시 None - 화면 추출 사용)"""
+        capture = network_capture.NetworkCapture(self.driver)
+        if not capture.start():
+            return None
+        self.logger.info("네트워크 캡처: 결과 응답 본문 수집 활성화")
+        return capture
+        
     def get_page(self, url):
         """
         웹 페이지 안전하게 로드
@@ -73,10 +137,22 @@ class BaseCrawler:
             bool: 성공 여부
         """
         try:
-            self.driver.get(url)
-            time.sleep(REQUEST_DELAY)  # 요청 간격 준수
+            self.throttle()
+            if self.lean_mode:
+                # 페이지 로드를 기다리지 않으므로 이전 문서와 구분할 표시를 남김
+                waits.mark_document(self.driver)
+                self.driver.get(url)
+                self.wait_until(waits.new_document_interactive, WAIT_TIMEOUTS['page_load'], "페이지 로딩")
+            else:
+                self.driver.get(url)
+                self.wait_until(waits.document_ready, WAIT_TIMEOUTS['page_load'], "페이지 로딩")
             return True
+        except TimeoutException as e:
+            self.last_status = 'timeout'
+            self.logger.error(f"페이지 로드 시간 초과 {url}: {str(e)}")
+            return False
         except WebDriverException as e:
+            self.last_status = 'error'
             self.logger.error(f"페이지 로드 실패 {url}: {str(e)}")
             return False
             
@@ -96,13 +172,93 @@ class BaseCrawler:
             wait = WebDriverWait(self.driver, timeout or WEBDRIVER_TIMEOUT)
             return wait.until(EC.presence_of_element_located((by, value)))
         except TimeoutException:
+            self.last_status = 'timeout'
             self.logger.warning(f"요소 대기 시간 초과 {by}={value}")
             return None
             
+    def open_tabs(self, count):
+        """
+        한 브라우저 안에 탭을 count개까지 준비 (로그인 쿠키는 모든 탭이 공유)
+        
+        Args:
+            count (int): 필요한 탭 수 (현재 탭 포함)
+            
+        Returns:
+            list: 탭 핸들 목록 (첫 번째는 기존 탭)
+        """
+        handles = [self.current_tab] + [
+            handle for handle in self.driver.window_handles if handle != self.current_tab
+        ]
+        while len(handles) < count:
+            self.driver.switch_to.new_window('tab')
+            handles.append(self.driver.current_window_handle)
+        self.driver.switch_to.window(self.current_tab)
+        return handles[:max(count, 1)]
+        
+    def switch_tab(self, handle):
+        """
+        명령을 보낼 탭 전환 (이미 선택된 탭이면 무시)
+        
+        Args:
+            handle (str): 탭 핸들
+        """
+        if handle == self.current_tab:
+            return
+        self.driver.switch_to.window(handle)
+        self.current_tab = handle
+        
+    def close_tabs(self, keep):
+        """
+        keep 탭만 남기고 나머지 탭 닫기
+        
+        Args:
+            keep (str): 남길 탭 핸들
+        """
+        for handle in self.driver.window_handles:
+            if handle != keep:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(keep)
+        self.current_tab = keep
+            
+    def throttle(self):
+        """외부 요청(페이지 이동/제출) 전에 공유 속도 제한 토큰 획득"""
+        throttle(self.rate_limiter)
+            
+    def wait_until(self, condition, timeout, description=None):
+        """
+        조건이 충족될 때까지만 대기
+        
+        고정 sleep을 대체하기 위한 메서드로, timeout은 상한값이며
+        시간이 초과되어도 예외를 던지지 않고 False를 반환한다.
+        
+        Args:
+            condition: driver를 인자로 받는 조건 함수 (src.crawler.waits 참고)
+            timeout (float): 최대 대기 시간(초)
+            description (str, optional): 시간 초과 시 로그에 남길 설명
+            
+        Returns:
+            bool: 조건 충족 여부
+        """
+        try:
+            wait = WebDriverWait(
+                self.driver, timeout, poll_frequency=WAIT_TIMEOUTS['poll_interval']
+            )
+            wait.until(condition)
+            return True
+        except TimeoutException:
+            if description:
+                self.logger.debug(f"대기 조건 미충족 ({timeout}초): {description}")
+            return False
+            
     def close(self):
         """브라우저 종료 및 자원 정리"""
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            finally:
+                release_driver(self.driver_endpoint)
+                self.driver_endpoint = None
             
     def __enter__(self):
         return self
@@ -0,0 +1,153 @@
+"""
+크롬드라이버 경로 캐시 모듈
+ChromeDriverManager().install()의 네트워크 조회를 피하기 위해
+확인된 드라이버 경로와 크롬 버전을 로컬에 저장하고 재사용
+"""
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+from webdriver_manager.chrome import ChromeDriverManager
+from config.config import DRIVER_CACHE_CONFIG
+
+# 프로세스 내 캐시 (풀 워커들이 파일을 반복해서 읽지 않도록)
+_resolved_path: Optional[str] = None
+_lock = threading.Lock()
+
+_VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+\.\d+")
+
+
+def _run_version_command(command) -> Optional[str]:
+    """버전 확인 명령 실행 후 버전 문자열 반환"""
+    try:
+        output = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            timeout=5,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION_PATTERN.search(output or "")
+    return match.group(0) if match else None
+
+
+def detect_chrome_version() -> Optional[str]:
+    """
+    설치된 크롬 버전 확인 (네트워크 사용 없음)
+
+    Returns:
+        크롬 버전 문자열 (예: 126.0.6478.127) 또는 확인 실패 시 None
+    """
+    if sys.platform.startswith("win"):
+        # 윈도우에서는 chrome.exe --version이 브라우저를 띄우므로 레지스트리 조회
+        for root in ("HKEY_CURRENT_USER", "HKEY_LOCAL_MACHINE"):
+            version = _run_version_command(
+                ["reg", "query", rf"{root}\Software\Google\Chrome\BLBeacon", "/v", "version"]
+            )
+            if version:
+                return version
+        return None
+
+    if sys.platform == "darwin":
+        candidates = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+    else:
+        candidates = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+
+    for binary in candidates:
+        version = _run_version_command([binary, "--version"])
+        if version:
+            return version
+    return None
+
+
+def _major(version: Optional[str]) -> Optional[str]:
+    """버전 문자열에서 메이저 버전 추출"""
+    return version.split(".")[0] if version else None
+
+
+class DriverCache:
+    """크롬드라이버 경로 캐시 클래스"""
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self.cache_file = cache_file or DRIVER_CACHE_CONFIG['cache_file']
+        self.logger = logging.getLogger(__name__)
+
+    def load(self) -> Dict[str, Any]:
+        """캐시 파일 읽기"""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, driver_path: str, chrome_version: Optional[str]):
+        """캐시 파일 저장"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump({
+                    'driver_path': driver_path,
+                    'chrome_version': chrome_version,
+                    'chrome_major': _major(chrome_version),
+                    'resolved_at': datetime.now().isoformat()
+                }, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            self.logger.warning(f"드라이버 캐시 저장 실패: {str(e)}")
+
+    def resolve(self) -> Optional[str]:
+        """
+        사용할 크롬드라이버 경로 결정
+
+        크롬 메이저 버전이 캐시와 같고 드라이버 파일이 존재하면 네트워크 없이 재사용하고,
+        버전이 바뀐 경우에만 ChromeDriverManager로 다시 설치한다.
+        설치가 실패하면(오프라인 등) 기존 캐시 경로를 사용하며, 그것도 없으면 None을 반환해
+        Selenium Manager가 드라이버를 찾도록 한다.
+
+        Returns:
+            드라이버 경로 또는 None
+        """
+        cached = self.load()
+        cached_path = cached.get('driver_path')
+        cached_exists = bool(cached_path) and os.path.exists(cached_path)
+        chrome_version = detect_chrome_version()
+
+        if cached_exists and (
+            chrome_version is None or _major(chrome_version) == cached.get('chrome_major')
+        ):
+            self.logger.info(f"캐시된 크롬드라이버 사용: {cached_path}")
+            return cached_path
+
+        self.logger.info(
+            f"크롬드라이버 확인 필요 (크롬: {chrome_version}, 캐시: {cached.get('chrome_version')})"
+        )
+        try:
+            driver_path = ChromeDriverManager().install()
+            self.save(driver_path, chrome_version)
+            return driver_path
+        except Exception as e:
+            self.logger.warning(f"크롬드라이버 설치 실패 (오프라인?): {str(e)}")
+
+        if cached_exists:
+            self.logger.info(f"기존 캐시 드라이버로 대체: {cached_path}")
+            return cached_path
+        return None
+
+
+def resolve_driver_path() -> Optional[str]:
+    """프로세스 내에서 한 번만 드라이버 경로를 결정하고 재사용"""
+    global _resolved_path
+    if not DRIVER_CACHE_CONFIG['enabled']:
+        return ChromeDriverManager().install()
+
+    with _lock:
+        if _resolved_path is None or not os.path.exists(_resolved_path):
+            _resolved_path = DriverCache().resolve()
+        return _resolved_path
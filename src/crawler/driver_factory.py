@@ -0,0 +1,174 @@
+"""
+WebDriver 생성 모듈
+원격 WebDriver 주소(Selenium standalone/grid)가 설정되어 있으면 부하가 가장 적은 주소에
+세션을 만들고, 없으면 로컬 크롬을 실행함
+
+원격 세션에서는 CDP 명령(execute_cdp_cmd)을 쓸 수 없으므로 리소스 차단/네트워크 캡처는
+각 기능에서 실패를 확인하고 사용하지 않는다.
+"""
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+
+from config.config import REMOTE_DRIVER_CONFIG
+from .driver_cache import resolve_driver_path
+
+logger = logging.getLogger(__name__)
+
+
+def endpoint_status(endpoint: str, timeout: Optional[float] = None) -> Optional[Dict[str, int]]:
+    """
+    원격 주소의 /status에서 준비 상태와 슬롯 사용 현황 확인
+
+    Args:
+        endpoint: 원격 WebDriver 주소
+        timeout: 응답 대기 시간(초)
+
+    Returns:
+        {'slots', 'busy'} (슬롯 정보가 없으면 0), 응답이 없거나 준비되지 않았으면 None
+    """
+    timeout = timeout or REMOTE_DRIVER_CONFIG['status_timeout']
+    try:
+        response = requests.get(f"{endpoint.rstrip('/')}/status", timeout=timeout)
+        value = response.json().get('value', {})
+    except (requests.RequestException, ValueError, AttributeError):
+        return None
+    if not value.get('ready', False):
+        return None
+
+    slots = busy = 0
+    for node in value.get('nodes', []):
+        for slot in node.get('slots', []):
+            slots += 1
+            if slot.get('session'):
+                busy += 1
+    return {'slots': slots, 'busy': busy}
+
+
+class EndpointBalancer:
+    """원격 WebDriver 주소별 세션 수 관리 클래스"""
+
+    def __init__(self, endpoints: List[str]):
+        """
+        Args:
+            endpoints: 원격 WebDriver 주소 목록
+        """
+        self.endpoints = list(endpoints)
+        self._sessions: Dict[str, int] = {endpoint: 0 for endpoint in self.endpoints}
+        self._lock = threading.Lock()
+
+    def _candidates(self) -> List[Tuple[float, int, str]]:
+        """(부하율, 세션 수, 주소) 목록 - 준비되지 않았거나 가득 찬 주소 제외"""
+        max_sessions = REMOTE_DRIVER_CONFIG['max_sessions_per_endpoint']
+        candidates = []
+        for endpoint in self.endpoints:
+            local = self._sessions[endpoint]
+            capacity = max_sessions
+            busy = local
+            if REMOTE_DRIVER_CONFIG['check_status']:
+                status = endpoint_status(endpoint)
+                if status is None:
+                    logger.warning(f"원격 WebDriver 응답 없음: {endpoint}")
+                    continue
+                if status['slots']:
+                    # 다른 코디네이터가 만든 세션도 반영되도록 서버가 알려준 사용량 사용
+                    capacity = status['slots'] if capacity is None else min(capacity, status['slots'])
+                    busy = max(status['busy'], local)
+            if capacity is not None and busy >= capacity:
+                continue
+            candidates.append((busy / capacity if capacity else busy, local, endpoint))
+        return candidates
+
+    def acquire(self) -> Optional[str]:
+        """
+        부하가 가장 적은 주소를 골라 세션 수 증가
+
+        Returns:
+            주소 또는 사용 가능한 주소가 없으면 None
+        """
+        candidates = self._candidates()
+        if not candidates:
+            return None
+        with self._lock:
+            _, _, endpoint = min(
+                candidates, key=lambda item: (item[0], self._sessions[item[2]])
+            )
+            self._sessions[endpoint] += 1
+            return endpoint
+
+    def release(self, endpoint: Optional[str]):
+        """세션 종료 시 세션 수 감소"""
+        if endpoint is None:
+            return
+        with self._lock:
+            if self._sessions.get(endpoint, 0) > 0:
+                self._sessions[endpoint] -= 1
+
+    def status(self) -> Dict[str, int]:
+        """주소별 이 프로세스의 세션 수"""
+        with self._lock:
+            return dict(self._sessions)
+
+
+_balancer: Optional[EndpointBalancer] = None
+_balancer_lock = threading.Lock()
+
+
+def get_endpoint_balancer() -> Optional[EndpointBalancer]:
+    """
+    프로세스 공유 원격 주소 분배기 반환
+
+    Returns:
+        EndpointBalancer 또는 원격 주소가 없으면 None
+    """
+    global _balancer
+    if not REMOTE_DRIVER_CONFIG['endpoints']:
+        return None
+    with _balancer_lock:
+        if _balancer is None:
+            _balancer = EndpointBalancer(REMOTE_DRIVER_CONFIG['endpoints'])
+        return _balancer
+
+
+def create_driver(options) -> Tuple[webdriver.Remote, Optional[str]]:
+    """
+    크롬 WebDriver 생성
+
+    Args:
+        options: selenium ChromeOptions
+
+    Returns:
+        (드라이버, 원격 주소 또는 로컬이면 None)
+
+    Raises:
+        WebDriverException: 사용 가능한 원격 주소가 없거나 세션 생성 실패
+    """
+    balancer = get_endpoint_balancer()
+    if balancer is None:
+        # 캐시된 드라이버 경로 사용 (없으면 Selenium Manager가 자동 탐색)
+        driver_path = resolve_driver_path()
+        service = Service(driver_path) if driver_path else Service()
+        return webdriver.Chrome(service=service, options=options), None
+
+    endpoint = balancer.acquire()
+    if endpoint is None:
+        raise WebDriverException("사용 가능한 원격 WebDriver가 없습니다.")
+    try:
+        driver = webdriver.Remote(command_executor=endpoint, options=options)
+    except Exception:
+        balancer.release(endpoint)
+        raise
+    logger.info(f"원격 WebDriver 세션 생성: {endpoint} (세션 수 {balancer.status()})")
+    return driver, endpoint
+
+
+def release_driver(endpoint: Optional[str]):
+    """원격 세션 종료 후 분배기에 반영 (로컬 드라이버면 무시)"""
+    balancer = get_endpoint_balancer()
+    if balancer is not None:
+        balancer.release(endpoint)
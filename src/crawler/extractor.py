@@ -0,0 +1,410 @@
+"""
+결과 페이지 데이터 추출 모듈
+브라우저 없이 HTML만으로 종목 데이터를 추출 (크롤러와 오프라인 재파싱이 함께 사용)
+
+브라우저에서는 전체 page_source 대신 #contents 테이블 조각만 가져와
+미리 컴파일한 lxml XPath로 파싱하고, config.FIELD_SPECS에 정의된 모든 항목을
+테이블 한 번의 순회로 추출한다. 네트워크 캡처로 받은 응답 본문(HTML 또는 JSON)도
+같은 항목 정의로 추출한다.
+"""
+import html as html_lib
+import json
+import logging
+import re
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from config.config import SELECTORS, FIELD_SPECS
+
+logger = logging.getLogger(__name__)
+
+# 테이블 요소 기준 머리글 행과 본문 행
+_HEADER_ROWS_XPATH = etree.XPath("./thead/tr")
+_BODY_ROWS_XPATH = etree.XPath("./tbody/*")
+_CELLS_XPATH = etree.XPath("./*[self::td or self::th]")
+_CONTENTS_TABLE_XPATH = etree.XPath("//*[@id='contents']/table")
+_SELECTED_PERIOD_XPATH = etree.XPath(
+    "//*[@id=$select_id]/option[@selected]/@value"
+)
+_SEARCH_INPUT_VALUE_XPATH = etree.XPath("//*[@id=$input_id]/@value")
+
+# 브라우저에서 테이블 조각과 종목명만 가져오는 스크립트
+TABLE_FRAGMENT_SCRIPT = """
+var table = document.querySelector('#contents > table');
+var input = document.querySelector(arguments[0]);
+return {
+    table: table ? table.outerHTML : null,
+    stock_name: input ? input.value : null
+};
+"""
+
+
+def convert_to_number(value_str: Optional[str]) -> Optional[float]:
+    """쉼표를 제거하고 숫자로 변환 (변환할 수 없으면 None)"""
+    if not value_str:
+        return None
+    try:
+        return float(value_str.replace(',', ''))
+    except ValueError:
+        return None
+
+
+def _normalize(text: Optional[str]) -> str:
+    """머리글 비교용 텍스트 정규화 (공백 제거)"""
+    return re.sub(r"\s+", "", text or "")
+
+
+def _labels(value) -> FrozenSet[str]:
+    """머리글 정의(문자열 또는 목록)를 정규화된 집합으로 변환"""
+    if not value:
+        return frozenset()
+    if isinstance(value, str):
+        value = [value]
+    return frozenset(_normalize(label) for label in value)
+
+
+class FieldSpec:
+    """컴파일된 추출 항목 정의 클래스"""
+
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        Args:
+            spec: FIELD_SPECS 항목 ({'name', 'row', 'column', 'row_index', 'col_index'})
+        """
+        self.name = spec['name']
+        self.row_labels = _labels(spec.get('row'))
+        self.column_labels = _labels(spec.get('column'))
+        self.row_index = spec.get('row_index')
+        self.col_index = spec.get('col_index')
+
+
+def compile_field_specs(specs: List[Dict[str, Any]]) -> List[FieldSpec]:
+    """추출 항목 정의 컴파일"""
+    return [FieldSpec(spec) for spec in specs]
+
+
+# 모듈 로드 시 한 번만 컴파일
+_FIELD_SPECS = compile_field_specs(FIELD_SPECS)
+
+
+def _span(cell, attribute: str) -> int:
+    """colspan/rowspan 값 (잘못된 값은 1)"""
+    try:
+        return max(1, int(cell.get(attribute) or 1))
+    except ValueError:
+        return 1
+
+
+def _header_columns(header_rows) -> Dict[str, int]:
+    """
+    머리글 행에서 머리글 텍스트 -> 열 위치(0부터) 매핑 (rowspan/colspan 반영)
+
+    같은 텍스트가 여러 열에 있으면 가장 왼쪽 열을 사용한다.
+    """
+    columns: Dict[str, int] = {}
+    pending: Dict[int, int] = {}  # 열 위치 -> rowspan으로 남은 행 수
+    for tr in header_rows:
+        col = 0
+        for cell in _CELLS_XPATH(tr):
+            while pending.get(col, 0) > 0:
+                pending[col] -= 1
+                col += 1
+            colspan, rowspan = _span(cell, 'colspan'), _span(cell, 'rowspan')
+            columns.setdefault(_normalize(cell.text_content()), col)
+            for c in range(col, col + colspan):
+                if rowspan > 1:
+                    pending[c] = rowspan - 1
+            col += colspan
+        for c in pending:
+            if c >= col and pending[c] > 0:
+                pending[c] -= 1
+    return columns
+
+
+def _grid_cells(cells) -> Dict[int, Any]:
+    """행의 셀을 열 위치(0부터, colspan 반영) -> 셀로 매핑"""
+    grid = {}
+    col = 0
+    for cell in cells:
+        grid[col] = cell
+        col += _span(cell, 'colspan')
+    return grid
+
+
+def _cell_value(cell) -> Optional[float]:
+    """셀 텍스트를 숫자로 변환"""
+    return convert_to_number(cell.text_content().strip()) if cell is not None else None
+
+
+def extract_table_values(table, specs: Optional[List[FieldSpec]] = None) -> Dict[str, Optional[float]]:
+    """
+    테이블 요소에서 정의된 모든 항목 추출 (테이블 한 번 순회)
+
+    Args:
+        table: #contents > table lxml 요소
+        specs: 컴파일된 추출 항목 정의 (None이면 FIELD_SPECS)
+
+    Returns:
+        {항목명: 값} - 찾지 못한 항목은 None
+    """
+    specs = specs if specs is not None else _FIELD_SPECS
+    values: Dict[str, Optional[float]] = {spec.name: None for spec in specs}
+    try:
+        header_rows = list(_HEADER_ROWS_XPATH(table))
+        # thead가 없으면 본문 앞쪽의 th로만 이루어진 행들을 머리글로 사용
+        leading_headers = not header_rows
+        body_rows = []  # (tr 여부, 셀 목록) - tbody 자식 위치 순서 유지
+        row_by_label: Dict[str, int] = {}
+        for position, row in enumerate(_BODY_ROWS_XPATH(table)):
+            cells = _CELLS_XPATH(row) if row.tag == 'tr' else []
+            label = _normalize(cells[0].text_content()) if cells else ""
+            if leading_headers and cells and all(cell.tag == 'th' for cell in cells):
+                header_rows.append(row)
+            else:
+                leading_headers = False
+            if label:
+                row_by_label.setdefault(label, position)
+            body_rows.append((row.tag == 'tr', cells))
+        header_columns = _header_columns(header_rows)
+
+        for spec in specs:
+            row_position = next(
+                (row_by_label[label] for label in spec.row_labels if label in row_by_label), None
+            )
+            if row_position is None and spec.row_index:
+                row_position = spec.row_index - 1
+            if row_position is None or not (0 <= row_position < len(body_rows)):
+                continue
+            is_tr, cells = body_rows[row_position]
+            if not is_tr:
+                continue
+
+            column = next(
+                (header_columns[label] for label in spec.column_labels if label in header_columns), None
+            )
+            if column is not None:
+                values[spec.name] = _cell_value(_grid_cells(cells).get(column))
+            elif spec.col_index and spec.col_index <= len(cells):
+                # 위치 지정은 td:nth-child(n)과 같이 셀 요소 순서 기준
+                cell = cells[spec.col_index - 1]
+                values[spec.name] = _cell_value(cell) if cell.tag == 'td' else None
+    except Exception as e:
+        logger.warning(f"항목 추출 실패: {str(e)}")
+    return values
+
+
+def _build_record(table, stock_code: str, stock_name: Optional[str]) -> Optional[Dict[str, Any]]:
+    """테이블 요소에서 종목 데이터 딕셔너리 생성 (종목코드/종목명 + 항목별 값)"""
+    try:
+        return {
+            'stock_code': stock_code,
+            'stock_name': stock_name,
+            **extract_table_values(table)
+        }
+    except Exception as e:
+        logger.error(f"데이터 추출 실패: {str(e)}")
+        return None
+
+
+def extract_from_table_html(table_html: str, stock_code: str, stock_name: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    #contents 테이블 조각(outerHTML)에서 데이터 추출
+
+    Args:
+        table_html: 테이블 outerHTML
+        stock_code: 종목 코드
+        stock_name: 종목명
+
+    Returns:
+        추출된 데이터 또는 테이블이 아니면 None
+    """
+    if not table_html:
+        return None
+    try:
+        table = lxml_html.fragment_fromstring(table_html)
+    except (etree.ParserError, ValueError) as e:
+        logger.error(f"테이블 조각 파싱 실패: {str(e)}")
+        return None
+    if table.tag != 'table':
+        return None
+    return _build_record(table, stock_code, stock_name)
+
+
+def empty_record(stock_code: str, stock_name: Optional[str]) -> Dict[str, Any]:
+    """값이 없는 종목 데이터 (테이블이 없는 경우)"""
+    return {
+        'stock_code': stock_code,
+        'stock_name': stock_name,
+        **{spec.name: None for spec in _FIELD_SPECS}
+    }
+
+
+def wrap_table_fragment(table_html: str, stock_name: Optional[str]) -> str:
+    """
+    테이블 조각을 parse_result_html로 다시 읽을 수 있는 최소 문서로 감싸기 (HTML 보관용)
+
+    Args:
+        table_html: 테이블 outerHTML
+        stock_name: 종목명
+    """
+    name = html_lib.escape(stock_name or "", quote=True)
+    search_id = SELECTORS['search']['input'].lstrip('#')
+    return (
+        f'<html><body><input id="{search_id}" value="{name}">'
+        f'<div id="contents">{table_html}</div></body></html>'
+    )
+
+
+def parse_result_html(html: str, stock_code: str, quarter_value: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    결과 페이지 HTML에서 데이터 추출
+
+    Args:
+        html: 종목 상세 결과 페이지 HTML
+        stock_code: 종목 코드
+        quarter_value: 요청한 기간 값 (None이면 선택된 기간을 확인하지 않음)
+
+    Returns:
+        추출된 데이터 또는 요청한 결과 페이지가 아니면 None
+    """
+    try:
+        document = lxml_html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+    tables = _CONTENTS_TABLE_XPATH(document)
+    if not tables:
+        return None
+
+    # 요청한 기간이 선택된 결과인지 확인 (선택 정보가 있는 경우에만)
+    if quarter_value is not None:
+        selected = _SELECTED_PERIOD_XPATH(
+            document, select_id=SELECTORS['branch']['selector'].lstrip('#')
+        )
+        if selected and selected[0] != quarter_value:
+            logger.warning(
+                f"종목 {stock_code} 응답 기간 불일치: {selected[0]} != {quarter_value}"
+            )
+            return None
+
+    names = _SEARCH_INPUT_VALUE_XPATH(document, input_id=SELECTORS['search']['input'].lstrip('#'))
+    stock_name = (names[0] if names else None) or stock_code
+    return _build_record(tables[0], stock_code, stock_name)
+
+
+def _payload_number(value) -> Optional[float]:
+    """JSON 값을 숫자로 변환 (숫자 또는 숫자 문자열)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return convert_to_number(value.strip())
+    return None
+
+
+def _period_nodes(payload: Any, quarter_value: str) -> List[Any]:
+    """
+    JSON 응답에서 요청한 기간의 노드 목록
+
+    기간 값을 키로 갖는 값({'202412D': {...}}) 또는 기간 값을 필드로 갖는 객체
+    ({'period': '202412D', ...})를 해당 기간의 노드로 본다.
+    """
+    nodes = []
+    stack = [payload]
+    while stack:
+        node = stack.pop(0)
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if str(key).strip() == quarter_value:
+                    nodes.append(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+                elif str(value).strip() == quarter_value and node not in nodes:
+                    nodes.append(node)
+        elif isinstance(node, list):
+            stack.extend(node)
+    return nodes
+
+
+def extract_payload_values(
+    payload: Any,
+    specs: Optional[List[FieldSpec]] = None,
+    quarter_value: Optional[str] = None
+) -> Dict[str, Optional[float]]:
+    """
+    JSON 응답에서 정의된 항목 추출
+
+    키가 항목명 또는 열/행 머리글(예: '매출액')과 같은 첫 번째 숫자 값을 사용한다.
+    여러 기간이 담긴 응답에서 다른 기간의 값을 쓰지 않도록, 기간 값이 주어지면 해당 기간의
+    노드 안에서만 찾고 기간 노드를 찾지 못하면 모든 항목을 None으로 반환한다(화면 추출 사용).
+
+    Args:
+        payload: json.loads 결과
+        specs: 컴파일된 추출 항목 정의 (None이면 FIELD_SPECS)
+        quarter_value: 요청한 기간 값 (None이면 기간을 구분하지 않음)
+    """
+    specs = specs if specs is not None else _FIELD_SPECS
+    keys = {
+        spec.name: {_normalize(spec.name)} | spec.column_labels | spec.row_labels
+        for spec in specs
+    }
+    values: Dict[str, Optional[float]] = {spec.name: None for spec in specs}
+    if quarter_value is None:
+        stack = [payload]
+    else:
+        stack = _period_nodes(payload, quarter_value)
+        if not stack:
+            logger.debug(f"JSON 응답에서 기간 {quarter_value} 노드를 찾지 못함")
+    while stack:
+        node = stack.pop(0)
+        if isinstance(node, dict):
+            for key, value in node.items():
+                label = _normalize(str(key))
+                for name, labels in keys.items():
+                    if values[name] is None and label in labels:
+                        values[name] = _payload_number(value)
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(node)
+    return values
+
+
+def parse_captured_body(
+    body: str,
+    is_json: bool,
+    stock_code: str,
+    stock_name: Optional[str] = None,
+    quarter_value: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    네트워크 캡처로 받은 결과 응답 본문에서 데이터 추출
+
+    Args:
+        body: 응답 본문
+        is_json: JSON 응답 여부 (아니면 HTML 문서 또는 테이블 조각)
+        stock_code: 종목 코드
+        stock_name: 종목명 (None이면 HTML의 검색창 값, JSON이면 None 그대로)
+        quarter_value: 요청한 기간 값 (JSON은 해당 기간의 값만 사용, HTML은 선택된 기간이 있으면 확인)
+
+    Returns:
+        추출된 데이터 또는 결과 데이터가 아니면 None
+    """
+    if is_json:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return None
+        values = extract_payload_values(payload, quarter_value=quarter_value)
+        if all(value is None for value in values.values()):
+            return None
+        return {'stock_code': stock_code, 'stock_name': stock_name, **values}
+
+    data = parse_result_html(body, stock_code, quarter_value)
+    if data is None and body.lstrip().lower().startswith('<table'):
+        data = extract_from_table_html(body, stock_code, stock_name or stock_code)
+    elif data is not None and stock_name:
+        data['stock_name'] = stock_name
+    return data
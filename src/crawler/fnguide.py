@@ -1,11 +1,23 @@
 import os
+import time
+from collections import deque
 import pandas as pd
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import WebDriverException
 from .base import BaseCrawler
+from . import waits
+from . import extractor
+from . import query_macro
+from .item_form import ItemDetailForm
+from .http_fetcher import HttpFetcher
+from src.auth.session_store import SessionStore
+from src.utils.html_archive import get_html_archive
+from src.utils.result_cache import has_metrics
+from .stock_resolver import get_stock_resolution_cache
+from .page_state import PageState, read_dom_state
 from config.config import (
     ITEM_DETAIL_URL, 
     DATA_DIR, 
@@ -14,14 +26,58 @@ from config.config import (
     USERNAME, 
     PASSWORD,
     SELECTORS,
-    REQUEST_DELAY,
-    QUARTER_CONFIG
+    QUARTER_CONFIG,
+    WAIT_TIMEOUTS,
+    SESSION_CONFIG,
+    CRAWLER_CONFIG
 )
-import time
 # from auth import login
 
+
+def build_quarter_value(year, quarter=None):
+    """
+    연도/분기로 기간 선택 value 값 생성
+    
+    Args:
+        year (int): 연도
+        quarter (int, optional): 분기 (None이면 연간)
+        
+    Returns:
+        str: 연간은 yyyy12D, 분기는 yyyymmn 형식 (예: 202412D, 2024093)
+    """
+    # 연간 데이터인 경우
+    if quarter is None:
+        return f"{year}12D"  # 연간 데이터는 12월 + D 접미사
+    # 분기 데이터인 경우: yyyymmn 형식
+    month_map = {1: '03', 2: '06', 3: '09', 4: '12'}
+    month = month_map.get(quarter, '01')
+    return f"{year}{month}{quarter}"
+
+
+def period_range(start, end):
+    """
+    시작~끝 기간 목록 생성
+    
+    Args:
+        start (tuple): 시작 (연도, 분기) - 분기가 None이면 연간
+        end (tuple): 끝 (연도, 분기)
+        
+    Returns:
+        list: (연도, 분기) 리스트 (연간은 연도별, 분기는 분기별, 오래된 기간부터)
+    """
+    (start_year, start_quarter), (end_year, end_quarter) = start, end
+    if start_quarter is None:
+        return [(year, None) for year in range(start_year, end_year + 1)]
+    periods = []
+    year, quarter = start_year, start_quarter
+    while (year, quarter) <= (end_year, end_quarter):
+        periods.append((year, quarter))
+        year, quarter = (year + 1, 1) if quarter == 4 else (year, quarter + 1)
+    return periods
+
+
 class FnGuideCrawler(BaseCrawler):
-    def __init__(self, headless=True, debug_mode=False, skip_step=0, year=None, quarter=None):
+    def __init__(self, headless=True, debug_mode=False, skip_step=0, year=None, quarter=None, account=None):
         """
         FnGuide 크롤러 초기화
         
@@ -31,13 +87,35 @@ class FnGuideCrawler(BaseCrawler):
             skip_step (int): 디버그 모드에서 스킵할 단계
             year (int): 조회할 연도 (None인 경우 사용자 입력)
             quarter (int): 조회할 분기 (None인 경우 사용자 입력)
+            account (Account): 사용할 계정 (None이면 FNGUIDE_USERNAME/FNGUIDE_PASSWORD)
         """
+        self.page_state = PageState()
         super().__init__(headless)
         self.debug_mode = debug_mode
         self.skip_step = skip_step
         self.year = year
         self.quarter = quarter
         self.quarter_value = self._get_quarter_value()
+        # 계정별 로그인 정보, 세션 파일, 요청 속도 제한
+        self.account = account
+        self.username = account.username if account else USERNAME
+        self.password = account.password if account else PASSWORD
+        self.session_store = SessionStore(self.username)
+        # 'selenium': 브라우저로 조회, 'http': 로그인 세션으로 결과 페이지 직접 요청 (실패 시 브라우저)
+        self.fetch_mode = CRAWLER_CONFIG.get('fetch_mode', 'selenium')
+        # 'ui': 화면 조작으로 조회, 'direct': 조회 파라미터로 결과 페이지 바로 로드 (실패 시 화면 조작)
+        self.navigation_mode = CRAWLER_CONFIG.get('navigation_mode', 'ui')
+        # 조회 조작과 테이블 추출을 한 번의 비동기 스크립트로 실행할지 여부
+        self.query_macro = CRAWLER_CONFIG.get('query_macro', False)
+        # (종목코드, 구분, 기간, 종류, 내용) - 조회 중 미리 받은 결과
+        # 종류 'fragment': 조회 매크로가 추출한 테이블 조각, 'record': 캡처한 응답에서 추출한 데이터
+        self._pending_result = None
+        # 다른 탭의 (페이지 상태, 미리 받은 결과) - 탭 파이프라인에서 탭 전환 시 교체
+        self._tab_states = {}
+        self.item_form = None
+        self.http_fetcher = None
+        self.html_archive = get_html_archive()
+        self.stock_resolver = get_stock_resolution_cache()
         
     def _wait_debug_step(self, step_name, step=1):
         """디버그 모드에서 사용자 입력 대기"""
@@ -98,21 +176,137 @@ class FnGuideCrawler(BaseCrawler):
             year, quarter = self._get_user_input()
         
         self.logger.info(f"연도/분기 설정 - 연도: {year}, 분기: {quarter}")
-        
-        # 연간 데이터인 경우
-        if quarter is None:
-            quarter_value = f"{year}12D"  # 연간 데이터는 12월 + D 접미사
-        else:
-            # 분기 데이터인 경우: yyyymmn 형식
-            month_map = {1: '03', 2: '06', 3: '09', 4: '12'}
-            month = month_map.get(quarter, '01')
-            quarter_value = f"{year}{month}{quarter}"
-        
+        quarter_value = build_quarter_value(year, quarter)
         self.logger.info(f"생성된 quarter_value: {quarter_value}")
         return quarter_value
         
+    def set_period(self, year, quarter=None):
+        """
+        조회 기간 변경
+        
+        Args:
+            year (int): 연도
+            quarter (int, optional): 분기 (None이면 연간)
+        """
+        self.year = year
+        self.quarter = quarter
+        self.quarter_value = build_quarter_value(year, quarter)
+        
     def _search_stock(self, stock_code):
-        """종목 검색 수행 (페이지 이동 없이 검색만)"""
+        """
+        종목 검색 수행
+        
+        해석 캐시에 종목코드 필드값(조회 요청 템플릿 사용) 또는 결과 페이지 URL이 있으면
+        자동완성 없이 바로 이동하고, 없거나 이동에 실패하면 검색창으로 검색한다.
+        """
+        # 이미 이 종목의 결과가 표시되어 있으면 검색 생략
+        if self.page_state.shows(stock_code):
+            return self.wait_for_element(By.ID, "txtSearchWd")
+        
+        search_input = self._open_resolved_stock(stock_code) or self._search_stock_ui(stock_code)
+        if search_input:
+            self._sync_page_state(stock_code)
+        return search_input
+        
+    def _sync_page_state(self, stock_code):
+        """검색 후 표시된 결과의 구분/기간을 페이지 상태에 반영"""
+        state = read_dom_state(self.driver, SELECTORS)
+        if state.get('has_table'):
+            self.page_state.update(stock_code, state.get('mode'), state.get('period'))
+        else:
+            self.page_state.update(stock_code, None, None)
+            
+    def get_page(self, url):
+        """페이지 이동 (표시 내용이 바뀌므로 페이지 상태 초기화)"""
+        self.page_state.reset()
+        return super().get_page(url)
+        
+    def _open_resolved_stock(self, stock_code):
+        """
+        해석 캐시의 종목 정보로 결과 페이지에 바로 이동
+        
+        수집한 조회 요청 템플릿과 캐시된 종목코드 필드값으로 조회를 제출하고,
+        템플릿이 없으면 캐시된 결과 페이지 URL(종목코드가 URL에 드러나는 경우)로 이동한다.
+        
+        Args:
+            stock_code (str): 종목 코드
+            
+        Returns:
+            WebElement: 검색창 요소 또는 캐시가 없거나 이동 실패 시 None
+        """
+        if self.stock_resolver is None:
+            return None
+        entry = self.stock_resolver.get(stock_code)
+        if not entry:
+            return None
+        
+        code_values = entry.get('code_values')
+        if code_values and self.item_form is not None:
+            params = self.item_form.build(stock_code, self._period_mode(), self._get_quarter_value(), code_values)
+            check = lambda driver: self.item_form.read_code_values(driver) == code_values
+            try:
+                opened = self._open_item_form(params)
+            except Exception as e:
+                self.logger.warning(f"종목 {stock_code} 조회 요청 제출 실패: {str(e)}")
+                opened = False
+        elif entry.get('url') and entry.get('stock_name'):
+            check = waits.input_value_is(SELECTORS['search']['input'], entry['stock_name'])
+            opened = self.get_page(entry['url'])
+        else:
+            return None
+        
+        if opened:
+            if "login" in self.driver.current_url.lower():
+                # 세션 만료는 캐시 문제가 아니므로 항목을 유지하고 재로그인 후 검색으로 진행
+                self.last_status = 'login_redirect'
+                self.login(force=True)
+                return None
+            if self.wait_until(check, WAIT_TIMEOUTS['search_result'], "캐시된 종목 페이지 확인"):
+                self.logger.info(f"종목 {stock_code} 캐시된 종목 정보로 바로 이동")
+                return self.wait_for_element(By.ID, "txtSearchWd")
+        
+        self.logger.info(f"종목 {stock_code} 캐시된 종목 정보로 이동 실패. 캐시 삭제 후 검색으로 대체")
+        self.stock_resolver.invalidate(stock_code)
+        self.get_page(ITEM_DETAIL_URL)
+        return None
+        
+    def _open_item_form(self, params):
+        """
+        조회 요청 템플릿으로 결과 페이지 로드 (GET은 URL 이동, POST는 숨김 폼 제출)
+        
+        Args:
+            params (list): ItemDetailForm.build()로 만든 요청 파라미터
+            
+        Returns:
+            bool: 새 문서 로딩 여부
+        """
+        if self.item_form.method != 'post':
+            return self.get_page(self.item_form.url(params))
+        self.page_state.reset()
+        self.throttle()
+        waits.mark_document(self.driver)
+        self.item_form.submit(self.driver, params)
+        return self.wait_until(
+            waits.new_document_interactive, WAIT_TIMEOUTS['page_load'], "조회 결과 로딩"
+        )
+        
+    def _remember_resolved_stock(self, stock_code, search_input):
+        """검색으로 찾은 종목의 결과 페이지 URL과 종목명을 해석 캐시에 저장"""
+        if self.stock_resolver is None:
+            return
+        try:
+            stock_name = search_input.get_attribute('value')
+            current_url = self.driver.current_url
+        except Exception:
+            return
+        if not stock_name:
+            return
+        # 종목코드가 URL에 드러나는 경우에만 바로 이동에 사용할 수 있음
+        url = current_url if stock_code in current_url else None
+        self.stock_resolver.put(stock_code, stock_name=stock_name, url=url)
+        
+    def _search_stock_ui(self, stock_code):
+        """검색창 자동완성으로 종목 검색 (페이지 이동 없이 검색만)"""
         try:
             # 페이지 이동 제거 - 이미 올바른 페이지에 있다고 가정
             search_input = self.wait_for_element(By.ID, "txtSearchWd")
@@ -122,11 +316,26 @@ class FnGuideCrawler(BaseCrawler):
             
             search_input.clear()
             search_input.send_keys(stock_code)
-            time.sleep(1.5)  # 종목코드 입력 후 1.5초 대기 (자동완성 처리 시간 확보)
+            # 자동완성 목록이 표시될 때까지 대기
+            self.wait_until(
+                waits.element_visible(SELECTORS['search']['autocomplete_item']),
+                WAIT_TIMEOUTS['autocomplete'],
+                "자동완성 목록 표시"
+            )
             search_input.send_keys(Keys.ARROW_DOWN)  # 아래 방향키로 자동완성 첫 번째 항목 선택
-            time.sleep(0.2)  # 방향키 처리 대기
+            before = waits.page_signature(self.driver)
+            self.throttle()
             search_input.send_keys(Keys.RETURN)
-            time.sleep(REQUEST_DELAY)
+            # 검색 결과가 페이지에 반영될 때까지 대기 (반영되지 않으면 이전 종목이 표시된 상태)
+            if not self.wait_until(
+                waits.content_changed(before),
+                WAIT_TIMEOUTS['search_result'],
+                "검색 결과 반영"
+            ):
+                self.logger.warning(f"종목 {stock_code} 검색 결과가 페이지에 반영되지 않았습니다.")
+                self.last_status = 'timeout'
+                return None
+            self._remember_resolved_stock(stock_code, search_input)
             
             return search_input
         except Exception as e:
@@ -145,107 +354,86 @@ class FnGuideCrawler(BaseCrawler):
             self.logger.error(f"콘텐츠 로딩 대기 실패: {str(e)}")
             return False
             
-    def _extract_stock_data(self, soup, stock_code, stock_name):
-        """주식 데이터 추출"""
-        try:
-            sales, profit = self._extract_sales_and_operating_profit(soup)
-
-            return {
-                'stock_code': stock_code,
-                'stock_name': stock_name,
-                'sales': sales,
-                'operating_profit': profit
-            }
-        except Exception as e:
-            self.logger.error(f"데이터 추출 실패: {str(e)}")
-            return None
+    def extract_current_page(self, stock_code, stock_name=None):
+        """
+        현재 페이지의 #contents 테이블 조각만 가져와 데이터 추출
+        
+        전체 page_source 대신 테이블 outerHTML과 검색창 값만 한 번의 스크립트로 받아
+        미리 컴파일한 XPath로 파싱한다. 조회 매크로나 네트워크 캡처로 같은 결과를
+        이미 받았으면 스크립트 호출 없이 그 결과를 사용한다.
+        
+        Args:
+            stock_code (str): 종목 코드
+            stock_name (str): 종목명 (None이면 검색창 값 사용)
             
-    def _extract_sales_and_operating_profit(self, soup):
-        """매출액과 영업이익 추출"""
+        Returns:
+            dict: 추출된 데이터 (테이블이 없으면 값이 비어 있는 데이터) 또는 실패 시 None
+        """
+        pending = self._take_pending_result(stock_code)
+        if pending is not None and pending[0] == 'record':
+            return self._use_captured_record(stock_code, stock_name, pending[1])
+        
+        fragment = pending[1] if pending is not None else None
+        if fragment is None:
+            try:
+                fragment = self.driver.execute_script(
+                    extractor.TABLE_FRAGMENT_SCRIPT, SELECTORS['search']['input']
+                ) or {}
+            except WebDriverException as e:
+                self.logger.error(f"데이터 추출 실패: {str(e)}")
+                return None
+        
+        stock_name = stock_name or fragment.get('stock_name')
+        table_html = fragment.get('table')
+        if not table_html:
+            self.logger.warning(f"종목 {stock_code} 데이터 테이블이 없습니다.")
+            return extractor.empty_record(stock_code, stock_name)
+        
+        data = extractor.extract_from_table_html(table_html, stock_code, stock_name)
+        if data and self.html_archive is not None:
+            # 재파싱에 필요한 테이블과 종목명만 최소 문서로 보관
+            self.archive_html(stock_code, extractor.wrap_table_fragment(table_html, stock_name), stock_name)
+        return data
+        
+    def _use_captured_record(self, stock_code, stock_name, captured):
+        """
+        네트워크 캡처 응답에서 추출한 데이터 사용
+        
+        Args:
+            stock_code (str): 종목 코드
+            stock_name (str): 종목명 (None이면 응답 또는 검색창 값 사용)
+            captured (dict): {'data': 추출 데이터, 'html': 문서 응답 본문 또는 None}
+        """
+        data = dict(captured['data'])
+        if stock_name:
+            data['stock_name'] = stock_name
+        elif not data.get('stock_name'):
+            data['stock_name'] = waits.input_value(self.driver, SELECTORS['search']['input']) or stock_code
+        if captured.get('html'):
+            self.archive_html(stock_code, captured['html'], data['stock_name'])
+        return data
+        
+    def archive_html(self, stock_code, html, stock_name=None):
+        """
+        결과 페이지 HTML 보관 (보관 설정이 꺼져 있으면 무시)
+        
+        Args:
+            stock_code (str): 종목 코드
+            html (str): 결과 페이지 HTML
+            stock_name (str): 종목명
+        """
+        if self.html_archive is None:
+            return
         try:
-            sales = soup.select_one('#contents > table > tbody > tr:nth-child(4) > td:nth-child(2)')
-            operating_profit = soup.select_one('#contents > table > tbody > tr:nth-child(4) > td:nth-child(3)')
-            
-            def convert_to_number(value_str):
-                if not value_str:
-                    return None
-                # 쉼표 제거 후 숫자로 변환
-                try:
-                    return float(value_str.replace(',', ''))
-                except ValueError:
-                    return None
-            
-            sales_value = convert_to_number(sales.text.strip() if sales else None)
-            operating_profit_value = convert_to_number(operating_profit.text.strip() if operating_profit else None)
-            
-            return (sales_value, operating_profit_value)
+            self.html_archive.put(stock_code, self.quarter_value, html, stock_name)
         except Exception as e:
-            self.logger.warning(f"매출액/영업이익 추출 실패: {str(e)}")
-            return (None, None)
+            self.logger.warning(f"종목 {stock_code} HTML 보관 실패: {str(e)}")
             
     def select_annual_data(self):
-        """연간 데이터 선택 및 조회"""
+        """연간 데이터 선택 및 조회 (이미 연간 결과가 표시되어 있으면 조작 생략)"""
         try:
-            # 1. 연간/분기 선택 드롭다운 찾기
-            annual_selector = self.wait_for_element(
-                By.ID,
-                "selAqGb"
-            )
-            if not annual_selector:
-                self.logger.error("연간/분기 선택 드롭다운을 찾을 수 없습니다.")
+            if not self._ensure_query(mode='A'):
                 return False
-                
-            # 2. 연간/분기 선택 드롭다운 클릭
-            annual_selector.click()
-            
-            # 3. 연간 옵션 선택
-            annual_option = self.wait_for_element(
-                By.CSS_SELECTOR,
-                "#selAqGb > option[value='A']"
-            )
-            if not annual_option:
-                self.logger.error("연간 옵션을 찾을 수 없습니다.")
-                return False
-                
-            # 4. 옵션 선택
-            annual_option.click()
-            
-            # 5. 드롭다운 닫기 (다른 요소 클릭)
-            self.driver.find_element(By.TAG_NAME, "body").click()
-            time.sleep(0.5)  # 드롭다운 닫힘 대기
-            
-            # 6. 조회 버튼 클릭
-            submit_button = self.wait_for_element(
-                By.CSS_SELECTOR,
-                "#btnSubmit"
-            )
-            if not submit_button:
-                self.logger.error("조회 버튼을 찾을 수 없습니다.")
-                return False
-                
-            submit_button.click()
-            
-            # 7. 데이터 테이블 또는 '데이터 없음' 메시지 대기
-            # try:
-            #     # 먼저 '데이터 없음' 메시지 확인
-            #     no_data = self.wait_for_element(
-            #         By.CSS_SELECTOR,
-            #         "td.nodata[colspan='8']",
-            #         timeout=3  # 짧은 타임아웃으로 빠르게 확인
-            #     )
-            #     if no_data and "데이터가 없습니다" in no_data.text:
-            #         self.logger.info("해당 기간의 데이터가 없습니다.")
-            #         return False
-            # except:
-            #     # '데이터 없음' 메시지가 없으면 정상적인 데이터 테이블 확인
-            #     data_element = self.wait_for_element(
-            #         By.CSS_SELECTOR,
-            #         "#contents > table > tbody > tr:nth-child(4) > td:nth-child(2)"
-            #     )
-            #     if not data_element:
-            #         self.logger.error("데이터 테이블 로딩 실패")
-            #         return False
-            
             self.logger.info("연간 데이터 선택 및 조회 완료")
             return True
             
@@ -254,61 +442,11 @@ class FnGuideCrawler(BaseCrawler):
             return False
             
     def select_quarter_data(self):
-        """분기 데이터 선택 및 조회"""
+        """분기 데이터 선택 및 조회 (이미 같은 분기 결과가 표시되어 있으면 조작 생략)"""
         try:
-            # 1. 연간/분기 선택 드롭다운 찾기
-            quarter_selector = self.wait_for_element(
-                By.ID,
-                "selAqGb"
-            )
-            if not quarter_selector:
-                self.logger.error("연간/분기 선택 드롭다운을 찾을 수 없습니다.")
-                return False
-                
-            # 2. 연간/분기 선택 드롭다운 클릭
-            quarter_selector.click()
-            
-            # 3. 분기 옵션 선택
-            quarter_option = self.wait_for_element(
-                By.CSS_SELECTOR,
-                "#selAqGb > option[value='Q']"
-            )
-            if not quarter_option:
-                self.logger.error("분기 옵션을 찾을 수 없습니다.")
-                return False
-                
-            # 4. 옵션 선택
-            quarter_option.click()
-            
-            # 5. 드롭다운 닫기 (다른 요소 클릭)
-            self.driver.find_element(By.TAG_NAME, "body").click()
-            time.sleep(0.5)  # 드롭다운 닫힘 대기
-            
-            # 6. 분기 선택
-            if not self._check_branch():
+            self.quarter_value = self._get_quarter_value()
+            if not self._ensure_query(mode='Q', period=self.quarter_value):
                 return False
-                
-            # 7. 데이터 테이블 또는 '데이터 없음' 메시지 대기
-            # try:
-            #     # 먼저 '데이터 없음' 메시지 확인
-            #     no_data = self.wait_for_element(
-            #         By.CSS_SELECTOR,
-            #         "td.nodata",
-            #         timeout=3  # 짧은 타임아웃으로 빠르게 확인
-            #     )
-            #     if no_data and "데이터가 없습니다" in no_data.text:
-            #         self.logger.info("해당 기간의 데이터가 없습니다.")
-            #         return False
-            # except:
-            #     # '데이터 없음' 메시지가 없으면 정상적인 데이터 테이블 확인
-            #     data_element = self.wait_for_element(
-            #         By.CSS_SELECTOR,
-            #         "#contents > table > tbody > tr:nth-child(4) > td:nth-child(2)"
-            #     )
-            #     if not data_element:
-            #         self.logger.error("데이터 테이블 로딩 실패")
-            #         return False
-                
             self.logger.info("분기 데이터 선택 및 조회 완료")
             return True
             
@@ -316,6 +454,359 @@ class FnGuideCrawler(BaseCrawler):
             self.logger.error(f"분기 데이터 선택 중 오류 발생: {str(e)}")
             return False
             
+    def _ensure_query(self, mode=None, period=None):
+        """
+        현재 페이지를 목표 구분/기간으로 맞추고 필요한 경우에만 조회 버튼 클릭
+        
+        드롭다운 선택값을 한 번의 스크립트로 읽어 다른 항목만 선택하고,
+        선택 결과가 이미 표시된 결과(page_state)와 같으면 조회도 생략한다.
+        
+        Args:
+            mode (str): 'A' 또는 'Q' (None이면 현재 구분 유지)
+            period (str): 기간 값 (None이면 현재 기간 유지)
+            
+        Returns:
+            bool: 목표 상태의 결과가 표시되었는지 여부
+        """
+        self._pending_result = None
+        if self.query_macro and self._run_query_macro(mode, period):
+            return True
+        
+        state, needs_submit = self._prepare_query(mode, period)
+        if state is None:
+            return False
+        if not needs_submit:
+            return True
+        
+        captured = self._submit_query(period=state.get('period'))
+        if not captured:
+            return False
+        self.page_state.update(self.page_state.code, state.get('mode'), state.get('period'))
+        if isinstance(captured, dict):
+            self._pending_result = (
+                self.page_state.code, state.get('mode'), state.get('period'), 'record', captured
+            )
+        return True
+        
+    def _prepare_query(self, mode=None, period=None):
+        """
+        드롭다운을 목표 구분/기간으로 맞추기 (조회 버튼은 누르지 않음)
+        
+        Args:
+            mode (str): 'A' 또는 'Q' (None이면 현재 구분 유지)
+            period (str): 기간 값 (None이면 현재 기간 유지)
+            
+        Returns:
+            tuple: (선택 후 드롭다운 상태, 조회 필요 여부) - 선택 실패 시 (None, False)
+        """
+        state = read_dom_state(self.driver, SELECTORS)
+        changed = False
+        if mode and state.get('mode') != mode:
+            if not self._select_mode_option(mode):
+                return None, False
+            changed = True
+        # 구분이 바뀌면 기간 옵션이 다시 채워지므로 기간도 다시 선택
+        if period and (changed or state.get('period') != period):
+            if not self._select_period_option(period):
+                return None, False
+            changed = True
+        if changed:
+            state = read_dom_state(self.driver, SELECTORS)
+        
+        if (
+            state.get('has_table')
+            and self.page_state.code is not None
+            and self.page_state.mode == state.get('mode')
+            and self.page_state.period == state.get('period')
+        ):
+            self.logger.info(f"이미 표시된 결과 사용 - {self.page_state}")
+            return state, False
+        return state, True
+        
+    def _run_query_macro(self, mode, period):
+        """
+        구분 선택, 기간 선택, 조회 버튼 클릭, 테이블 추출을 한 번의 execute_async_script로 실행
+        
+        조회 버튼이 페이지 이동을 일으켜 스크립트가 중단되면 새 문서 로딩을 기다린 뒤
+        테이블 추출 스크립트만 실행한다. 추출한 조각은 extract_current_page에서 사용한다.
+        
+        Args:
+            mode (str): 'A' 또는 'Q' (None이면 현재 구분 유지)
+            period (str): 기간 값 (None이면 현재 기간 유지)
+            
+        Returns:
+            bool: 목표 상태의 결과가 표시되었는지 여부 (False면 화면 조작으로 다시 시도)
+        """
+        shown = self.page_state.code is not None
+        args = query_macro.build_macro_args(
+            mode,
+            period,
+            self.page_state.mode if shown else None,
+            self.page_state.period if shown else None
+        )
+        # 이미 목표 결과가 표시되어 있으면 조회하지 않으므로 속도 제한 토큰도 쓰지 않음
+        if not self.page_state.shows(self.page_state.code, mode, period):
+            self.throttle()
+        
+        try:
+            self.driver.set_script_timeout(query_macro.script_timeout())
+            result = self.driver.execute_async_script(query_macro.QUERY_MACRO_SCRIPT, args) or {}
+        except WebDriverException:
+            # 페이지 이동으로 스크립트 컨텍스트가 사라진 경우
+            self.logger.info("조회 스크립트 중단, 새 문서에서 추출")
+            result = self._extract_after_navigation()
+        
+        if not result.get('ok'):
+            self.logger.warning(f"조회 스크립트 실패 ({result.get('reason')}), 화면 조작으로 재시도")
+            return False
+        if (mode and result.get('mode') != mode) or (period and result.get('period') != period):
+            self.logger.warning(
+                f"조회 스크립트 결과 불일치: {result.get('mode')}/{result.get('period')} != {mode}/{period}"
+            )
+            return False
+        
+        self.page_state.update(self.page_state.code, result.get('mode'), result.get('period'))
+        self._pending_result = (
+            self.page_state.code,
+            result.get('mode'),
+            result.get('period'),
+            'fragment',
+            {'table': result.get('table'), 'stock_name': result.get('stock_name')}
+        )
+        self.logger.info(
+            f"조회 스크립트 완료 (조회 {'실행' if result.get('submitted') else '생략'}, "
+            f"소요(ms): {result.get('timings')})"
+        )
+        return True
+        
+    def _extract_after_navigation(self):
+        """
+        조회 버튼으로 페이지가 이동한 경우 새 문서 로딩 후 상태와 테이블 조각 읽기
+        
+        Returns:
+            dict: 조회 매크로와 같은 형식의 결과 ({'ok': False, ...}면 실패)
+        """
+        started = time.time()
+        if not self.wait_until(waits.new_document_interactive, WAIT_TIMEOUTS['page_load'], "조회 후 새 문서 로딩"):
+            return {'ok': False, 'reason': 'navigation'}
+        state = read_dom_state(self.driver, SELECTORS)
+        if not state:
+            return {'ok': False, 'reason': 'state'}
+        try:
+            fragment = self.driver.execute_script(
+                extractor.TABLE_FRAGMENT_SCRIPT, SELECTORS['search']['input']
+            ) or {}
+        except WebDriverException:
+            return {'ok': False, 'reason': 'extract'}
+        return {
+            'ok': True,
+            'submitted': True,
+            'mode': state.get('mode'),
+            'period': state.get('period'),
+            'table': fragment.get('table'),
+            'stock_name': fragment.get('stock_name'),
+            'timings': {'navigation': int((time.time() - started) * 1000)}
+        }
+        
+    def _take_pending_result(self, stock_code):
+        """
+        조회 중 미리 받은 결과 (현재 표시된 결과와 같을 때만, 한 번 사용 후 삭제)
+        
+        Returns:
+            tuple: (종류, 내용) 또는 없으면 None
+        """
+        cached, self._pending_result = self._pending_result, None
+        if cached is None:
+            return None
+        code, mode, period, kind, payload = cached
+        if code != stock_code or not self.page_state.shows(code, mode, period):
+            return None
+        return kind, payload
+        
+    def _select_mode_option(self, mode):
+        """
+        연간/분기 드롭다운에서 구분 선택 (조회 버튼은 누르지 않음)
+        
+        Args:
+            mode (str): 'A' (연간) 또는 'Q' (분기)
+        """
+        label = "연간" if mode == 'A' else "분기"
+        # 1. 연간/분기 선택 드롭다운 찾기
+        mode_selector = self.wait_for_element(By.ID, "selAqGb")
+        if not mode_selector:
+            self.logger.error("연간/분기 선택 드롭다운을 찾을 수 없습니다.")
+            return False
+            
+        # 2. 연간/분기 선택 드롭다운 클릭
+        mode_selector.click()
+        
+        # 3. 옵션 찾기
+        mode_option = self.wait_for_element(
+            By.CSS_SELECTOR,
+            f"#selAqGb > option[value='{mode}']"
+        )
+        if not mode_option:
+            self.logger.error(f"{label} 옵션을 찾을 수 없습니다.")
+            return False
+            
+        # 4. 옵션 선택
+        mode_option.click()
+        
+        # 5. 드롭다운 닫기 (다른 요소 클릭) 후 선택값 반영 대기
+        self.driver.find_element(By.TAG_NAME, "body").click()
+        self.wait_until(
+            waits.select_value_is(SELECTORS['annual']['selector'], mode),
+            WAIT_TIMEOUTS['dropdown'],
+            f"{label} 옵션 선택 반영"
+        )
+        return True
+        
+    def _select_period_option(self, period):
+        """
+        기간 드롭다운에서 기간 선택 (조회 버튼은 누르지 않음)
+        
+        Args:
+            period (str): 기간 값 (예: 202412D, 2024093)
+        """
+        self.logger.info(f"선택할 기간: {period}")
+        
+        # 분기 선택 드롭다운 찾기
+        branch_selector = self.wait_for_element(
+            By.CSS_SELECTOR,
+            SELECTORS['branch']['selector']
+        )
+        if not branch_selector:
+            self.logger.error("분기 선택 드롭다운을 찾을 수 없습니다.")
+            return False
+            
+        # 분기 선택 드롭다운 클릭 후 대상 옵션이 채워질 때까지 대기
+        branch_selector.click()
+        self.wait_until(
+            waits.select_has_value(SELECTORS['branch']['selector'], period),
+            WAIT_TIMEOUTS['dropdown'],
+            "기간 옵션 채움"
+        )
+        
+        # 해당 value를 가진 옵션 선택
+        option_selector = f"#selGsYm > option[value='{period}']"
+        self.logger.info(f"옵션 선택자: {option_selector}")
+        
+        target_option = self.wait_for_element(
+            By.CSS_SELECTOR,
+            option_selector,
+            timeout=5
+        )
+        if not target_option:
+            # 사용 가능한 옵션들을 확인
+            available_options = self.driver.find_elements(
+                By.CSS_SELECTOR,
+                "#selGsYm > option"
+            )
+            available_values = [opt.get_attribute('value') for opt in available_options]
+            self.logger.error(f"기간 옵션을 찾을 수 없습니다. (value: {period})")
+            self.logger.error(f"사용 가능한 옵션들: {available_values}")
+            return False
+            
+        # 옵션 선택 후 선택값 반영 대기
+        target_option.click()
+        self.wait_until(
+            waits.select_value_is(SELECTORS['branch']['selector'], period),
+            WAIT_TIMEOUTS['dropdown'],
+            "기간 옵션 선택 반영"
+        )
+        
+        # 드롭다운 닫기 (다른 요소 클릭)
+        self.driver.find_element(By.TAG_NAME, "body").click()
+        return True
+        
+    def _submit_query(self, period=None):
+        """
+        조회 버튼 클릭 후 결과 테이블 갱신 대기
+        
+        네트워크 캡처를 사용하면 결과 응답이 도착하는 즉시 본문에서 추출하고
+        화면 렌더링은 기다리지 않는다.
+        
+        Args:
+            period (str): 조회하는 기간 값 (캡처한 문서 응답의 기간 확인용)
+            
+        Returns:
+            dict | bool: 캡처 응답에서 추출한 결과 ({'data', 'html'}), 화면 갱신 시 True, 실패 시 False
+        """
+        capture = self.network_capture
+        before = self._click_submit(capture)
+        if before is None:
+            return False
+        if capture is not None:
+            captured = self._read_captured_result(capture, period)
+            if captured is not None:
+                return captured
+        if not self.wait_until(
+            waits.content_changed(before),
+            WAIT_TIMEOUTS['table_refresh'],
+            "데이터 테이블 갱신"
+        ):
+            # 이전 종목/기간의 테이블을 요청한 결과로 추출하지 않도록 실패 처리
+            self.logger.warning("조회 후 데이터 테이블이 갱신되지 않았습니다.")
+            self.last_status = 'timeout'
+            return False
+        return True
+            
+    def _click_submit(self, capture=None):
+        """
+        조회 버튼 클릭 (결과 갱신은 기다리지 않음)
+        
+        Args:
+            capture: 클릭 전에 이전 이벤트를 비울 NetworkCapture (None이면 사용 안 함)
+            
+        Returns:
+            tuple: 클릭 전 페이지 서명 (waits.content_changed에 전달) 또는 실패 시 None
+        """
+        submit_button = self.wait_for_element(
+            By.CSS_SELECTOR,
+            SELECTORS['login']['quarter_submit']
+        )
+        if not submit_button:
+            self.logger.error("조회 버튼을 찾을 수 없습니다.")
+            return None
+            
+        before = waits.page_signature(self.driver) or ()
+        if capture is not None:
+            capture.clear()
+            waits.mark_document(self.driver)
+        self.throttle()
+        submit_button.click()
+        return before
+        
+    def _read_captured_result(self, capture, period):
+        """
+        조회 버튼 클릭 후 도착한 결과 응답 본문에서 데이터 추출
+        
+        Args:
+            capture: NetworkCapture
+            period (str): 조회하는 기간 값
+            
+        Returns:
+            dict: {'data', 'html'} 또는 캡처/추출 실패 시 None (화면 추출 사용)
+        """
+        response = capture.wait_for_response(WAIT_TIMEOUTS['table_refresh'])
+        if response is None:
+            self.logger.debug("결과 응답을 캡처하지 못해 화면에서 추출")
+            return None
+        data = extractor.parse_captured_body(
+            response.body,
+            response.is_json,
+            self.page_state.code,
+            quarter_value=period
+        )
+        if data is None:
+            self.logger.debug(f"캡처한 응답에서 데이터를 찾지 못함: {response}")
+            return None
+        if response.is_document:
+            # 다음 조작이 새 문서에서 이루어지도록 로딩 시작만 확인 (렌더링 완료는 기다리지 않음)
+            self.wait_until(waits.new_document_interactive, WAIT_TIMEOUTS['page_load'], "조회 후 새 문서 로딩")
+        self.logger.info(f"결과 응답 캡처로 추출: {response}")
+        return {'data': data, 'html': response.body if response.is_document else None}
+        
     def get_item_detail(self, stock_code: str, year: int = None, quarter: int = None):
         """
         특정 종목의 상세 정보 조회
@@ -333,6 +824,7 @@ class FnGuideCrawler(BaseCrawler):
             self.year = year
         if quarter is not None:
             self.quarter = quarter
+        self.last_status = None
         if self.debug_mode:
             self.logger.info(f"[디버그 모드] 종목 {stock_code} 상세정보 조회 시작")
         
@@ -342,17 +834,23 @@ class FnGuideCrawler(BaseCrawler):
         current_url = self.driver.current_url
         self.logger.info(f"현재 페이지: {current_url}")
         
-        # 로그인 페이지로 돌아간 경우 재로그인
+        # 로그인 페이지로 돌아간 경우 재로그인 (저장된 세션은 만료된 것이므로 폼 로그인)
         if current_url == "https://www.fnguide.com/home/login":
             self.logger.info("로그인 페이지로 이동. 로그인 프로세스 재시작.")
-            if not self.login():
+            self.last_status = 'login_redirect'
+            if not self.login(force=True):
                 self.logger.error("로그인 실패. 프로세스 종료.")
                 return None
+        
+        # 바로 이동 모드: 조회 파라미터로 결과 페이지를 한 번에 로드 (실패 시 아래 화면 조작으로 대체)
+        data = self.fetch_item_detail_direct(stock_code)
+        if data:
+            return data
+        
         # 올바른 검색 페이지가 아닌 경우 이동
-        elif ITEM_DETAIL_URL not in current_url:
+        if ITEM_DETAIL_URL not in self.driver.current_url:
             self.logger.info(f"검색 페이지가 아닙니다. 올바른 페이지로 이동 중...")
             self.get_page(ITEM_DETAIL_URL)
-            time.sleep(2)  # 페이지 로딩 대기
                 
         try:
             # 1. 종목 검색
@@ -361,16 +859,9 @@ class FnGuideCrawler(BaseCrawler):
             if not search_input:
                 return None
             
-            # 2. 데이터 선택 (연간/분기) - 먼저 연간/분기 선택
-            if self.quarter is None:
-                if not self.select_annual_data():
-                    return None
-            else:
-                if not self.select_quarter_data():
-                    return None
-            
-            # 3. 연도/분기 선택 - 연간/분기 선택 후 연도 선택
-            if not self._check_branch():
+            # 2. 연간/분기 및 연도/분기 선택 후 조회 (이미 표시된 항목은 조작 생략)
+            self.quarter_value = self._get_quarter_value()
+            if not self._ensure_query(mode=self._period_mode(), period=self.quarter_value):
                 self.logger.error("연도/분기 선택 실패")
                 return None
             
@@ -381,14 +872,14 @@ class FnGuideCrawler(BaseCrawler):
                 
             # 4. 데이터 추출
             self._wait_debug_step("데이터 추출", 2)
-            soup = BeautifulSoup(self.driver.page_source, 'lxml')
-            stock_name = search_input.get_attribute('value')
             # 5. 데이터 저장
             self._wait_debug_step("데이터 저장", 2)
-            data = self._extract_stock_data(soup, stock_code, stock_name)
-            print("stock_name: ", stock_name)
+            data = self.extract_current_page(stock_code)
+            print("stock_name: ", data.get('stock_name') if data else None)
             print(f"data: {data}")
             if data:
+                self.last_status = self.last_status or 'ok'
+                self.capture_item_form(stock_code)
                 return data
             return None
 
@@ -396,15 +887,239 @@ class FnGuideCrawler(BaseCrawler):
             self.logger.error(f"종목 {stock_code} 데이터 추출 실패: {str(e)}")
             return None
             
-    def login(self):
+    @property
+    def account_limiter(self):
+        """계정별 요청 속도 제한기 (계정을 지정하지 않았으면 None)"""
+        return self.account.rate_limiter if self.account else None
+        
+    def throttle(self):
+        """공유 속도 제한 토큰과 계정별 토큰을 모두 획득"""
+        super().throttle()
+        if self.account is not None:
+            self.account.acquire()
+        
+    def switch_tab(self, handle):
+        """탭 전환 (페이지 상태와 미리 받은 결과를 탭별로 교체)"""
+        if handle == self.current_tab:
+            return
+        self._tab_states[self.current_tab] = (self.page_state, self._pending_result)
+        super().switch_tab(handle)
+        self.page_state, self._pending_result = self._tab_states.pop(handle, (PageState(), None))
+        
+    def close_tabs(self, keep):
+        """keep 탭만 남기고 닫기 (닫힌 탭의 상태도 삭제)"""
+        self.switch_tab(keep)
+        super().close_tabs(keep)
+        self._tab_states.clear()
+        
+    def iter_item_details_pipelined(self, stock_codes, tabs=None, throttle=None):
+        """
+        한 브라우저의 여러 탭에서 종목 조회를 겹쳐 실행
+        
+        한 탭에서 조회 버튼을 누른 뒤 결과를 기다리는 동안 다른 탭에서 다음 종목의
+        검색과 기간 선택을 진행하고, 가장 먼저 조회한 탭부터 차례로 결과를 추출한다.
+        조회 매크로/네트워크 캡처/바로 이동은 한 탭을 점유하므로 사용하지 않는다.
+        끝나거나 중단되면 파이프라인용으로 연 탭을 닫는다.
+        
+        Args:
+            stock_codes (list): 종목코드 목록
+            tabs (int): 사용할 탭 수 (None이면 CRAWLER_CONFIG['tabs'])
+            throttle (AdaptiveThrottle): 적응형 속도 조절 (동시에 조회하는 탭 수를 현재 동시성
+                한도 이하로 유지하고 종목별 응답 시간/결과 상태를 기록, None이면 사용 안 함)
+            
+        Yields:
+            tuple: (종목코드, 데이터 또는 None, 예외 또는 None) - 입력 순서
+        """
+        tabs = tabs or CRAWLER_CONFIG.get('tabs', 1)
+        home = self.current_tab
+        idle = deque(self.open_tabs(tabs))
+        inflight = deque()
+        self.logger.info(f"탭 {len(idle)}개로 조회 파이프라인 시작")
+        try:
+            for stock_code in stock_codes:
+                while inflight and (not idle or (throttle and len(inflight) >= throttle.limit)):
+                    ticket = inflight.popleft()
+                    result = self._finish_tab_query(ticket, throttle)
+                    idle.append(ticket['tab'])
+                    yield result
+                inflight.append(self._start_tab_query(idle.popleft(), stock_code))
+            while inflight:
+                yield self._finish_tab_query(inflight.popleft(), throttle)
+        finally:
+            self.close_tabs(home)
+            
+    def _start_tab_query(self, tab, stock_code):
+        """
+        탭에서 종목 검색, 구분/기간 선택 후 조회 버튼만 누르고 결과는 기다리지 않음
+        
+        조회 버튼 클릭은 _click_submit에서 속도 제한 토큰(throttle)을 얻은 뒤 이루어진다.
+        
+        Returns:
+            dict: 조회 진행 정보 (_finish_tab_query에 전달)
+        """
+        ticket = {
+            'tab': tab, 'code': stock_code, 'state': None, 'before': None, 'error': None,
+            'status': None, 'started': time.monotonic()
+        }
+        self.switch_tab(tab)
+        self.last_status = None
+        try:
+            self.quarter_value = self._get_quarter_value()
+            if ITEM_DETAIL_URL not in self.driver.current_url:
+                self.get_page(ITEM_DETAIL_URL)
+            if "login" in self.driver.current_url.lower():
+                self.last_status = 'login_redirect'
+                if not self.login(force=True) or not self.get_page(ITEM_DETAIL_URL):
+                    return ticket
+            if not self._search_stock(stock_code):
+                return ticket
+            
+            state, needs_submit = self._prepare_query(mode=self._period_mode(), period=self.quarter_value)
+            if state is None:
+                return ticket
+            if needs_submit:
+                ticket['before'] = self._click_submit()
+                if ticket['before'] is None:
+                    return ticket
+            ticket['state'] = state
+        except Exception as e:
+            ticket['error'] = e
+        finally:
+            ticket['status'] = self.last_status
+        return ticket
+        
+    def _finish_tab_query(self, ticket, throttle=None):
+        """
+        조회한 탭으로 돌아가 결과 갱신을 기다린 뒤 추출
+        
+        Args:
+            ticket (dict): _start_tab_query가 반환한 조회 진행 정보
+            throttle (AdaptiveThrottle): 응답 시간/결과 상태를 기록할 속도 조절 (None이면 기록 안 함)
+        
+        Returns:
+            tuple: (종목코드, 데이터 또는 None, 예외 또는 None)
+        """
+        stock_code = ticket['code']
+        data, error, status = None, ticket['error'], ticket['status']
+        if error is None and ticket['state'] is not None:
+            self.switch_tab(ticket['tab'])
+            try:
+                state = ticket['state']
+                if ticket['before'] is not None:
+                    if not self.wait_until(
+                        waits.content_changed(ticket['before']),
+                        WAIT_TIMEOUTS['table_refresh'],
+                        "데이터 테이블 갱신"
+                    ):
+                        # 이전 종목/기간의 테이블을 이 종목의 결과로 추출하지 않음
+                        self.logger.warning(f"종목 {stock_code} 조회 후 데이터 테이블이 갱신되지 않았습니다.")
+                        status = 'timeout'
+                        state = None
+                    else:
+                        self.page_state.update(stock_code, state.get('mode'), state.get('period'))
+                if state is not None:
+                    data = self.extract_current_page(stock_code)
+            except Exception as e:
+                error = e
+        if data:
+            status = status or 'ok'
+            self.last_status = status
+        if throttle is not None:
+            throttle.record(time.monotonic() - ticket['started'], status or 'error')
+        return stock_code, data, error
+        
+    def get_item_detail_periods(self, stock_code, periods):
+        """
+        한 번 검색한 종목에 대해 여러 기간을 같은 페이지에서 차례로 조회
+        
+        첫 기간만 get_item_detail로 검색/조회하고, 이후 기간은 연간/분기 구분과
+        기간 드롭다운만 바꿔 조회한다. 페이지 내 조회가 실패한 기간은 전체 조회로 대체한다.
+        
+        Args:
+            stock_code (str): 조회할 종목 코드
+            periods (list): (연도, 분기) 리스트 - 분기가 None이면 연간
+            
+        Returns:
+            list: (기간 값, 데이터 또는 None) 리스트 (입력 순서)
+        """
+        results = []
+        loaded = False
+        for year, quarter in periods:
+            self.set_period(year, quarter)
+            data = self._select_period_on_page(stock_code) if loaded else None
+            if data is None:
+                data = self.get_item_detail(stock_code)
+            loaded = data is not None
+            results.append((self.quarter_value, data))
+        return results
+        
+    def _select_period_on_page(self, stock_code):
+        """
+        현재 종목이 표시된 페이지에서 기간만 바꿔 조회
+        
+        Args:
+            stock_code (str): 현재 페이지에 표시된 종목 코드
+            
+        Returns:
+            dict: 추출된 데이터 또는 실패 시 None
+        """
+        self.last_status = None
+        if not self.page_state.shows(stock_code):
+            return None
+        if not self._ensure_query(mode=self._period_mode(), period=self.quarter_value):
+            return None
+        
+        # 요청한 기간이 선택된 상태인지 확인 후 추출
+        if not waits.select_value_is(SELECTORS['branch']['selector'], self.quarter_value)(self.driver):
+            self.logger.warning(f"종목 {stock_code} 기간 {self.quarter_value} 선택 확인 실패")
+            return None
+        data = self.extract_current_page(stock_code)
+        if data:
+            self.last_status = self.last_status or 'ok'
+        return data
+        
+    def _restore_session(self):
+        """
+        저장된 로그인 세션 복원 후 유효성 확인
+        
+        인증이 필요한 검색 페이지를 한 번 요청해 로그인 페이지로 돌아가지 않으면 유효한 것으로 본다.
+        
+        Returns:
+            bool: 복원된 세션으로 로그인 상태인지 여부
+        """
+        if not self.session_store.restore(self.driver):
+            return False
+        
+        self.logger.info("저장된 로그인 세션 확인 중...")
+        if not self.get_page(ITEM_DETAIL_URL):
+            return False
+        
+        if "login" in self.driver.current_url.lower() or not self._wait_for_content_load():
+            self.logger.info("저장된 로그인 세션이 만료되어 폼 로그인을 진행합니다.")
+            self.session_store.clear()
+            return False
+        
+        self.logger.info("저장된 로그인 세션으로 로그인 완료")
+        return True
+        
+    def login(self, force=False):
         """
         FnGuide 웹사이트 로그인
         
+        Args:
+            force (bool): True이면 저장된 세션을 무시하고 로그인 폼 사용
+            
         Returns:
             bool: 로그인 성공 여부
         """
         if self.debug_mode:
             self.logger.info("[디버그 모드] 로그인 프로세스 시작")
+        self.page_state.reset()
+        
+        if force:
+            self.session_store.clear()
+        elif SESSION_CONFIG['enabled'] and not self.debug_mode and self._restore_session():
+            return True
         
         def login_process():
             try:
@@ -414,10 +1129,7 @@ class FnGuideCrawler(BaseCrawler):
                     self.logger.error("로그인 페이지 이동 실패")
                     return False
                 
-                # 2. 페이지 로딩 대기
-                time.sleep(2)
-                
-                # 3. ID 입력 필드 찾기
+                # 2~3. ID 입력 필드가 나타날 때까지 대기
                 self.logger.info("ID 입력 필드 찾는 중...")
                 id_field = self.wait_for_element(
                     By.CSS_SELECTOR,
@@ -430,7 +1142,7 @@ class FnGuideCrawler(BaseCrawler):
                 
                 self._wait_debug_step("ID 입력")
                 # id_field.clear()
-                id_field.send_keys(str(USERNAME))
+                id_field.send_keys(str(self.username))
                 
                 # 4. 비밀번호 입력 필드 찾기
                 self.logger.info("비밀번호 입력 필드 찾는 중...")
@@ -445,7 +1157,8 @@ class FnGuideCrawler(BaseCrawler):
                 
                 self._wait_debug_step("비밀번호 입력")
                 pw_field.clear()
-                pw_field.send_keys(PASSWORD + Keys.RETURN)  # 비밀번호 입력 후 Enter 키 입력
+                self.throttle()
+                pw_field.send_keys(self.password + Keys.RETURN)  # 비밀번호 입력 후 Enter 키 입력
                 
                 # 5. 로그인 버튼 클릭
                 self.logger.info("로그인 버튼 찾는 중...")
@@ -461,9 +1174,13 @@ class FnGuideCrawler(BaseCrawler):
                 self._wait_debug_step("로그인 버튼 클릭")
                 submit_button.click()
                 
-                # 6. 로그인 완료 대기
+                # 6. 로그인 완료 대기 (로그인 페이지를 벗어나는 즉시 진행)
                 self.logger.info("로그인 처리 대기 중...")
-                time.sleep(5)  # 로그인 처리 대기 시간 증가
+                self.wait_until(
+                    waits.url_not_contains("login"),
+                    WAIT_TIMEOUTS['login'],
+                    "로그인 페이지 이탈"
+                )
                 
                 # 7. 로그인 성공 확인
                 current_url = self.driver.current_url
@@ -475,13 +1192,14 @@ class FnGuideCrawler(BaseCrawler):
                     return False
                 
                 self.logger.info("로그인 성공 확인됨")
+                if SESSION_CONFIG['enabled']:
+                    self.session_store.save(self.driver)
                 
                 # 8. 로그인 후 검색 페이지로 이동
                 self.logger.info("검색 페이지로 이동 중...")
                 if not self.get_page(ITEM_DETAIL_URL):
                     self.logger.error("검색 페이지 이동 실패")
                     return False
-                time.sleep(2)  # 페이지 로딩 대기
                 
                 return True
                 
@@ -495,64 +1213,12 @@ class FnGuideCrawler(BaseCrawler):
         return result
             
     def _check_branch(self):
-        """분기 선택 확인 및 처리"""
+        """분기 선택 확인 및 처리 (이미 선택/표시된 기간이면 조작 생략)"""
         try:
             # 설정된 분기 value 값 가져오기
             self.quarter_value = self._get_quarter_value()
-            self.logger.info(f"선택할 기간: {self.quarter_value}")
-            
-            # 분기 선택 드롭다운 찾기
-            branch_selector = self.wait_for_element(
-                By.CSS_SELECTOR,
-                SELECTORS['branch']['selector']
-            )
-            if not branch_selector:
-                self.logger.error("분기 선택 드롭다운을 찾을 수 없습니다.")
+            if not self._ensure_query(period=self.quarter_value):
                 return False
-                
-            # 분기 선택 드롭다운 클릭
-            branch_selector.click()
-            time.sleep(0.5)  # 드롭다운 열림 대기
-            
-            # 해당 value를 가진 옵션 선택
-            option_selector = f"#selGsYm > option[value='{self.quarter_value}']"
-            self.logger.info(f"옵션 선택자: {option_selector}")
-            
-            target_option = self.wait_for_element(
-                By.CSS_SELECTOR,
-                option_selector,
-                timeout=5
-            )
-            if not target_option:
-                # 사용 가능한 옵션들을 확인
-                available_options = self.driver.find_elements(
-                    By.CSS_SELECTOR,
-                    "#selGsYm > option"
-                )
-                available_values = [opt.get_attribute('value') for opt in available_options]
-                self.logger.error(f"기간 옵션을 찾을 수 없습니다. (value: {self.quarter_value})")
-                self.logger.error(f"사용 가능한 옵션들: {available_values}")
-                return False
-                
-            # 옵션 선택
-            target_option.click()
-            time.sleep(0.5)  # 옵션 선택 대기
-            
-            # 드롭다운 닫기 (다른 요소 클릭)
-            self.driver.find_element(By.TAG_NAME, "body").click()
-            time.sleep(0.5)  # 드롭다운 닫힘 대기
-            
-            # 조회 버튼 클릭
-            quarter_submit = self.wait_for_element(
-                By.CSS_SELECTOR,
-                SELECTORS['login']['quarter_submit']
-            )
-            if not quarter_submit:
-                self.logger.error("조회 버튼을 찾을 수 없습니다.")
-                return False
-                
-            quarter_submit.click()
-            time.sleep(REQUEST_DELAY)  # 페이지 로딩 대기
             
             self.logger.info(f"기간 선택 완료: {self.quarter_value}")
             return True
@@ -561,6 +1227,175 @@ class FnGuideCrawler(BaseCrawler):
             self.logger.error(f"기간 선택 중 오류 발생: {str(e)}")
             return False
 
+    def _period_mode(self):
+        """현재 설정의 연간/분기 구분값 ('A' 또는 'Q')"""
+        return 'A' if self.quarter is None else 'Q'
+        
+    def capture_item_form(self, stock_code):
+        """
+        조회가 끝난 페이지에서 요청 템플릿을 한 번만 수집 (HTTP 조회/바로 이동/종목코드 해석 캐시용)
+        
+        Args:
+            stock_code (str): 현재 페이지에 표시된 종목코드
+        """
+        if self.fetch_mode != 'http' and self.navigation_mode != 'direct' and self.stock_resolver is None:
+            return
+        if self.item_form is None:
+            self.item_form = ItemDetailForm.capture(self.driver, stock_code, SELECTORS)
+            if self.item_form:
+                self.logger.info(
+                    f"조회 요청 템플릿 수집 완료: {self.item_form.method.upper()} {self.item_form.action}"
+                )
+            else:
+                self.logger.warning("조회 요청 템플릿을 수집하지 못했습니다. 브라우저 조회를 계속 사용합니다.")
+                return
+        self._remember_code_values(stock_code)
+        
+    def _remember_code_values(self, stock_code):
+        """현재 페이지의 실제 종목코드 필드값을 해석 캐시에 저장 (다음 조회 시 자동완성 생략)"""
+        if self.stock_resolver is None:
+            return
+        entry = self.stock_resolver.get(stock_code)
+        if entry and entry.get('code_values'):
+            return
+        code_values = self.item_form.read_code_values(self.driver)
+        if code_values:
+            self.stock_resolver.put(stock_code, code_values=code_values)
+            
+    def can_navigate_direct(self):
+        """바로 이동 조회 가능 여부 (바로 이동 모드이고 요청 템플릿이 수집된 경우)"""
+        return self.navigation_mode == 'direct' and self.item_form is not None
+        
+    def fetch_item_detail_direct(self, stock_code):
+        """
+        조회 파라미터로 결과 페이지를 한 번에 로드하여 데이터 조회
+        
+        검색/연간·분기 선택/기간 선택/조회 버튼 클릭을 거치지 않고 요청 템플릿으로
+        GET URL을 열거나 POST 폼을 제출한다. 표시된 종목/구분/기간이 요청과 다르면
+        None을 반환하므로 호출 측은 화면 조작 조회로 대체한다.
+        
+        Args:
+            stock_code (str): 조회할 종목 코드
+            
+        Returns:
+            dict: 추출된 데이터 또는 실패 시 None
+        """
+        if not self.can_navigate_direct():
+            return None
+        
+        self.quarter_value = self._get_quarter_value()
+        mode = self._period_mode()
+        entry = self.stock_resolver.get(stock_code) if self.stock_resolver else None
+        cached_code_values = (entry or {}).get('code_values')
+        code_values = cached_code_values or self.item_form.code_values(stock_code)
+        params = self.item_form.build(stock_code, mode, self.quarter_value, code_values)
+        
+        try:
+            loaded = self._open_item_form(params)
+        except Exception as e:
+            self.logger.warning(f"종목 {stock_code} 바로 이동 실패: {str(e)}")
+            return None
+        if not loaded:
+            return None
+        
+        if "login" in self.driver.current_url.lower():
+            self.last_status = 'login_redirect'
+            self.logger.warning(f"종목 {stock_code} 바로 이동 중 로그인 페이지로 이동됨. 재로그인 시도")
+            self.login(force=True)
+            return None
+        
+        # 요청한 종목/구분/기간이 표시되었는지 확인
+        checks = [
+            waits.element_present('#contents > table'),
+            waits.select_value_is(SELECTORS['branch']['selector'], self.quarter_value),
+            lambda driver: self.item_form.read_code_values(driver) == code_values,
+        ]
+        if self.item_form.mode_field:
+            checks.append(waits.select_value_is(SELECTORS['annual']['selector'], mode))
+        if not self.wait_until(
+            lambda driver: all(check(driver) for check in checks),
+            WAIT_TIMEOUTS['table_refresh'],
+            "바로 이동 결과 확인"
+        ):
+            self.logger.info(f"종목 {stock_code} 바로 이동 결과가 요청과 다릅니다. 화면 조작 조회로 대체")
+            if cached_code_values and self.stock_resolver:
+                self.stock_resolver.invalidate(stock_code)
+            return None
+        
+        self.page_state.update(stock_code, mode, self.quarter_value)
+        data = self.extract_current_page(stock_code)
+        if data:
+            self.last_status = self.last_status or 'ok'
+        return data
+        
+    def fetch_item_detail_http(self, stock_code):
+        """
+        브라우저 없이 HTTP로 종목 상세 데이터 조회
+        
+        Selenium 로그인 세션의 쿠키를 사용하며, 요청 템플릿이 아직 없거나
+        요청/파싱에 실패하면 None을 반환하므로 호출 측은 브라우저 조회로 대체한다.
+        
+        Args:
+            stock_code (str): 조회할 종목 코드
+            
+        Returns:
+            dict: 추출된 데이터 또는 실패 시 None
+        """
+        if self.fetch_mode != 'http' or self.item_form is None:
+            return None
+        
+        if self.http_fetcher is None:
+            self.http_fetcher = HttpFetcher(self.item_form, self.rate_limiter, self.account_limiter)
+            self.http_fetcher.sync_from_driver(self.driver)
+        
+        self.quarter_value = self._get_quarter_value()
+        entry = self.stock_resolver.get(stock_code) if self.stock_resolver else None
+        code_values = (entry or {}).get('code_values') or self.item_form.code_values(stock_code)
+        html = self.http_fetcher.fetch_html(stock_code, self._period_mode(), self.quarter_value, code_values)
+        self.last_status = self.http_fetcher.last_status
+        if html is None:
+            if self.http_fetcher.last_status == 'login_redirect':
+                # 세션 만료: 브라우저 재로그인 후 쿠키를 다시 복사하도록 초기화
+                self.http_fetcher.close()
+                self.http_fetcher = None
+            return None
+        
+        # 서버가 종목코드를 무시/변경한 응답을 이 종목으로 저장하지 않도록 표시된 종목 확인
+        if self.item_form.read_code_values_html(html) != code_values:
+            self.logger.warning(f"종목 {stock_code} HTTP 응답의 종목이 요청과 다릅니다. 브라우저 조회로 대체")
+            self.last_status = 'error'
+            return None
+        
+        data = self._parse_result_html(html, stock_code, self.quarter_value)
+        if not has_metrics(data):
+            self.logger.warning(f"종목 {stock_code} HTTP 응답에 결과 데이터가 없습니다. 브라우저 조회로 대체")
+            return None
+        self.archive_html(stock_code, html, data.get('stock_name'))
+        return data
+        
+    def _parse_result_html(self, html, stock_code, quarter_value):
+        """
+        결과 페이지 HTML에서 데이터 추출 (크롤러 상태를 바꾸지 않음)
+        
+        Args:
+            html (str): 종목 상세 결과 페이지 HTML
+            stock_code (str): 종목 코드
+            quarter_value (str): 요청한 기간 값
+            
+        Returns:
+            dict: 추출된 데이터 또는 요청한 결과 페이지가 아니면 None
+        """
+        return extractor.parse_result_html(html, stock_code, quarter_value)
+        
+    def close(self):
+        """HTTP 세션과 브라우저 종료 (종목코드 해석 캐시의 남은 변경 기록)"""
+        if self.http_fetcher:
+            self.http_fetcher.close()
+            self.http_fetcher = None
+        if self.stock_resolver:
+            self.stock_resolver.flush()
+        super().close()
+
     def _save_to_csv(self, data, stock_code):
         """
         추출된 데이터를 CSV 파일로 저장
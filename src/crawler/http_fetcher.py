@@ -0,0 +1,121 @@
+"""
+HTTP 조회 모듈
+Selenium으로 로그인한 세션의 쿠키를 keep-alive requests.Session으로 옮겨
+종목 상세 결과 페이지를 브라우저 없이 직접 요청
+"""
+import logging
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.config import REQUEST_TIMEOUT, ITEM_DETAIL_URL, HTTP_CONFIG
+from .item_form import ItemDetailForm
+from src.utils.rate_limiter import get_rate_limiter, throttle
+
+
+class HttpFetcher:
+    """로그인 세션을 공유하는 HTTP 조회 클래스"""
+
+    def __init__(self, form: ItemDetailForm, rate_limiter=None, account_limiter=None):
+        """
+        Args:
+            form: 브라우저에서 수집한 종목 상세 조회 요청 템플릿
+            rate_limiter: 요청 전 토큰을 얻을 속도 제한기 (None이면 공유 기본값)
+            account_limiter: 세션 계정의 속도 제한기 (None이면 사용 안 함)
+        """
+        self.form = form
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.account_limiter = account_limiter
+        self.logger = logging.getLogger(__name__)
+        # 마지막 요청 결과 ('ok', 'login_redirect', 'http_error', 'error')
+        self.last_status = None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_CONFIG['pool_connections'],
+            pool_maxsize=HTTP_CONFIG['pool_maxsize'],
+            max_retries=Retry(
+                total=HTTP_CONFIG['retries'],
+                backoff_factor=HTTP_CONFIG['backoff_factor'],
+                status_forcelist=(502, 503, 504),
+                allowed_methods=None
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def sync_from_driver(self, driver):
+        """
+        브라우저의 쿠키와 User-Agent를 세션에 복사
+
+        Args:
+            driver: 로그인된 WebDriver
+        """
+        self.session.cookies.clear()
+        for cookie in driver.get_cookies():
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+        self.session.headers.update({
+            'User-Agent': driver.execute_script("return navigator.userAgent;"),
+            'Referer': ITEM_DETAIL_URL,
+        })
+
+    def fetch(
+        self,
+        stock_code: str,
+        mode: str,
+        quarter_value: str,
+        code_values=None
+    ) -> Tuple[Optional[str], str]:
+        """
+        종목 상세 결과 페이지 HTML 요청 (여러 스레드에서 동시에 호출 가능)
+
+        Args:
+            stock_code: 종목코드
+            mode: 'A' (연간) 또는 'Q' (분기)
+            quarter_value: 기간 값
+            code_values: 이미 확인된 종목코드 필드값
+
+        Returns:
+            (HTML 문자열 또는 None, 상태 'ok'/'login_redirect'/'http_error'/'error')
+        """
+        params = self.form.build(stock_code, mode, quarter_value, code_values)
+        throttle(self.rate_limiter)
+        throttle(self.account_limiter)
+        try:
+            if self.form.method == "post":
+                response = self.session.post(self.form.action, data=params, timeout=REQUEST_TIMEOUT)
+            else:
+                response = self.session.get(self.form.action, params=params, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            self.logger.warning(f"종목 {stock_code} HTTP 요청 실패: {str(e)}")
+            return None, 'error'
+
+        if "login" in response.url.lower():
+            self.logger.warning(f"종목 {stock_code} HTTP 요청이 로그인 페이지로 이동됨")
+            return None, 'login_redirect'
+        if response.status_code >= 400:
+            self.logger.warning(f"종목 {stock_code} HTTP 오류: {response.status_code}")
+            return None, 'http_error'
+
+        return response.text, 'ok'
+
+    def fetch_html(self, stock_code: str, mode: str, quarter_value: str, code_values=None) -> Optional[str]:
+        """
+        종목 상세 결과 페이지 HTML 요청
+
+        Returns:
+            HTML 문자열 또는 실패 시 None (원인은 last_status)
+        """
+        html, self.last_status = self.fetch(stock_code, mode, quarter_value, code_values)
+        return html
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
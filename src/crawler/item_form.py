@@ -0,0 +1,233 @@
+"""
+종목 상세(ItemDetail) 조회 폼 모듈
+#selAqGb / #selGsYm / #btnSubmit 으로 제출되는 조회 파라미터를 브라우저에서 수집하고,
+다른 종목/기간에 대한 요청 파라미터를 재구성
+"""
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from lxml import etree
+from lxml import html as lxml_html
+from selenium.common.exceptions import WebDriverException
+
+_CAPTURE_SCRIPT = """
+var submit = document.querySelector(arguments[0]);
+var modeSelect = document.querySelector(arguments[1]);
+var periodSelect = document.querySelector(arguments[2]);
+var form = (submit && (submit.form || submit.closest('form'))) ||
+           (periodSelect && periodSelect.form) || null;
+var fields = [];
+var action, method;
+if (form) {
+    for (var i = 0; i < form.elements.length; i++) {
+        var el = form.elements[i];
+        if (!el.name || el.disabled) continue;
+        if ((el.type === 'checkbox' || el.type === 'radio') && !el.checked) continue;
+        if (el.type === 'submit' || el.type === 'button') continue;
+        fields.push([el.name, el.value]);
+    }
+    action = form.action || location.href;
+    method = (form.getAttribute('method') || 'get').toLowerCase();
+} else {
+    // 폼이 없으면 조회 후 URL의 쿼리 파라미터를 템플릿으로 사용
+    new URLSearchParams(location.search).forEach(function(v, k) { fields.push([k, v]); });
+    action = location.origin + location.pathname;
+    method = 'get';
+}
+return {
+    action: action,
+    method: method,
+    fields: fields,
+    mode_field: modeSelect ? modeSelect.name : null,
+    period_field: periodSelect ? periodSelect.name : null
+};
+"""
+
+_SUBMIT_SCRIPT = """
+var form = document.createElement('form');
+form.method = 'post';
+form.action = arguments[0];
+form.style.display = 'none';
+arguments[1].forEach(function(pair) {
+    var input = document.createElement('input');
+    input.type = 'hidden';
+    input.name = pair[0];
+    input.value = pair[1];
+    form.appendChild(input);
+});
+document.body.appendChild(form);
+form.submit();
+"""
+
+_READ_FIELDS_SCRIPT = """
+var params = new URLSearchParams(location.search);
+var result = {};
+arguments[0].forEach(function(name) {
+    var el = document.getElementsByName(name)[0];
+    var value = el ? el.value : params.get(name);
+    if (value) result[name] = value;
+});
+return result;
+"""
+
+
+class ItemDetailForm:
+    """종목 상세 조회 요청 템플릿 클래스"""
+
+    def __init__(
+        self,
+        action: str,
+        method: str,
+        fields: List[Tuple[str, str]],
+        stock_code: str,
+        mode_field: Optional[str] = None,
+        period_field: Optional[str] = None
+    ):
+        """
+        Args:
+            action: 요청 URL
+            method: 'get' 또는 'post'
+            fields: 템플릿 캡처 시점의 (이름, 값) 목록
+            stock_code: 템플릿 캡처 시점의 종목코드
+            mode_field: 연간/분기 구분 필드명
+            period_field: 기간 필드명
+        """
+        self.action = action
+        self.method = method
+        self.fields = [tuple(field) for field in fields]
+        self.stock_code = stock_code
+        self.mode_field = mode_field
+        self.period_field = period_field
+        # 값에 종목코드가 들어있는 필드 (예: gicode=A005930)
+        self.code_fields = [name for name, value in self.fields if stock_code in (value or "")]
+
+    @classmethod
+    def capture(cls, driver, stock_code: str, selectors: Dict[str, Dict[str, str]]) -> Optional["ItemDetailForm"]:
+        """
+        조회가 끝난 페이지에서 요청 템플릿 수집
+
+        Args:
+            driver: 조회 결과가 표시된 WebDriver
+            stock_code: 현재 표시된 종목코드
+            selectors: config.SELECTORS
+
+        Returns:
+            ItemDetailForm 또는 종목코드 필드를 찾지 못한 경우 None
+        """
+        try:
+            raw = driver.execute_script(
+                _CAPTURE_SCRIPT,
+                selectors['login']['quarter_submit'],
+                selectors['annual']['selector'],
+                selectors['branch']['selector']
+            )
+        except WebDriverException:
+            return None
+        if not raw:
+            return None
+
+        form = cls(
+            action=raw['action'],
+            method=raw['method'],
+            fields=raw['fields'],
+            stock_code=stock_code,
+            mode_field=raw.get('mode_field'),
+            period_field=raw.get('period_field')
+        )
+        if not form.code_fields or not form.period_field:
+            return None
+        return form
+
+    def code_values(self, stock_code: str) -> Dict[str, str]:
+        """템플릿의 종목코드 부분을 치환해 다른 종목의 코드 필드값 생성"""
+        values = dict(self.fields)
+        return {
+            name: values[name].replace(self.stock_code, stock_code)
+            for name in self.code_fields
+        }
+
+    def build(
+        self,
+        stock_code: str,
+        mode: str,
+        quarter_value: str,
+        code_values: Optional[Dict[str, str]] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        요청 파라미터 생성
+
+        Args:
+            stock_code: 종목코드
+            mode: 'A' (연간) 또는 'Q' (분기)
+            quarter_value: 기간 값 (예: 202412D, 2024093)
+            code_values: 이미 확인된 종목코드 필드값 (없으면 템플릿에서 치환)
+
+        Returns:
+            (이름, 값) 목록
+        """
+        overrides = dict(code_values or self.code_values(stock_code))
+        if self.mode_field:
+            overrides[self.mode_field] = mode
+        overrides[self.period_field] = quarter_value
+
+        params = []
+        for name, value in self.fields:
+            params.append((name, overrides.pop(name, value)))
+        params.extend(overrides.items())
+        return params
+
+    def url(self, params: List[Tuple[str, str]]) -> str:
+        """GET 요청 URL 생성"""
+        separator = '&' if '?' in self.action else '?'
+        return f"{self.action}{separator}{urlencode(params)}"
+
+    def submit(self, driver, params: List[Tuple[str, str]]):
+        """
+        브라우저에서 POST 요청 제출 (숨김 폼 생성 후 submit)
+
+        Args:
+            driver: 로그인된 WebDriver
+            params: build()로 만든 요청 파라미터
+        """
+        driver.execute_script(_SUBMIT_SCRIPT, self.action, [list(param) for param in params])
+
+    def read_code_values(self, driver) -> Dict[str, str]:
+        """
+        현재 페이지에 표시된 종목의 실제 코드 필드값 읽기
+
+        Args:
+            driver: 조회 결과가 표시된 WebDriver
+
+        Returns:
+            {필드명: 값} (모든 코드 필드를 읽지 못하면 빈 딕셔너리)
+        """
+        try:
+            values = driver.execute_script(_READ_FIELDS_SCRIPT, self.code_fields) or {}
+        except WebDriverException:
+            return {}
+        return values if len(values) == len(self.code_fields) else {}
+
+    def read_code_values_html(self, html: str) -> Dict[str, str]:
+        """
+        결과 페이지 HTML(HTTP 응답)에 표시된 종목의 실제 코드 필드값 읽기
+
+        Args:
+            html: 종목 상세 결과 페이지 HTML
+
+        Returns:
+            {필드명: 값} (모든 코드 필드를 읽지 못하면 빈 딕셔너리)
+        """
+        try:
+            document = lxml_html.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            return {}
+        values = {}
+        for name in self.code_fields:
+            elements = document.xpath("//*[@name=$name]", name=name)
+            if not elements:
+                continue
+            # 브라우저의 element.value와 같게 select는 선택된(없으면 첫) 옵션 값 사용
+            value = elements[0].value if elements[0].tag in ('input', 'select', 'textarea') else None
+            if value:
+                values[name] = value
+        return values if len(values) == len(self.code_fields) else {}
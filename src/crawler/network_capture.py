@@ -0,0 +1,176 @@
+"""
+네트워크 응답 캡처 모듈
+Chrome 성능 로그(CDP Network 이벤트)에서 결과 데이터 응답을 찾아
+Network.getResponseBody로 본문을 읽어, 화면 렌더링을 기다리지 않고 추출할 수 있도록 함
+
+드라이버 생성 시 goog:loggingPrefs로 성능 로그를 켜야 한다 (chrome_options 참고).
+"""
+import base64
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from config.config import NETWORK_CAPTURE_CONFIG, WAIT_TIMEOUTS
+
+
+def chrome_options(options):
+    """
+    성능 로그(네트워크 이벤트만) 수집 옵션 추가
+
+    Args:
+        options: selenium ChromeOptions
+    """
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {
+        'enableNetwork': True,
+        'enablePage': False,
+    })
+    return options
+
+
+class CapturedResponse:
+    """캡처된 응답 클래스"""
+
+    def __init__(self, url: str, status: int, mime_type: str, resource_type: str, body: str):
+        self.url = url
+        self.status = status
+        self.mime_type = mime_type
+        self.resource_type = resource_type
+        self.body = body
+
+    @property
+    def is_document(self) -> bool:
+        """페이지 이동(문서) 응답 여부"""
+        return self.resource_type == 'Document'
+
+    @property
+    def is_json(self) -> bool:
+        """JSON 응답 여부"""
+        return 'json' in (self.mime_type or '')
+
+    def __repr__(self):
+        return f"CapturedResponse({self.status} {self.resource_type} {self.mime_type} {self.url})"
+
+
+class NetworkCapture:
+    """CDP 네트워크 이벤트 기반 결과 응답 캡처 클래스"""
+
+    def __init__(
+        self,
+        driver,
+        url_patterns: Optional[List[str]] = None,
+        resource_types: Optional[List[str]] = None,
+        mime_types: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            driver: 성능 로그가 켜진 크롬 웹드라이버
+            url_patterns: 결과 응답으로 볼 URL 부분 문자열
+            resource_types: 대상 요청 유형 (Document, XHR, Fetch 등)
+            mime_types: 파싱할 응답 형식
+        """
+        self.driver = driver
+        self.url_patterns = url_patterns or NETWORK_CAPTURE_CONFIG['url_patterns']
+        self.resource_types = set(resource_types or NETWORK_CAPTURE_CONFIG['resource_types'])
+        self.mime_types = mime_types or NETWORK_CAPTURE_CONFIG['mime_types']
+        self.logger = logging.getLogger(__name__)
+        self._responses: Dict[str, Dict[str, Any]] = {}  # requestId -> 응답 정보
+        self._finished: List[str] = []  # 본문 수신이 끝난 대상 requestId (순서 유지)
+
+    def start(self) -> bool:
+        """Network 도메인 활성화 (실패하면 캡처를 사용할 수 없음)"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.clear()
+            return True
+        except (AttributeError, WebDriverException) as e:
+            self.logger.warning(f"네트워크 캡처 시작 실패: {str(e)}")
+            return False
+
+    def _matches(self, response: Dict[str, Any], resource_type: Optional[str]) -> bool:
+        """결과 데이터 응답인지 여부"""
+        if resource_type not in self.resource_types:
+            return False
+        url = response.get('url', '')
+        mime_type = response.get('mimeType', '')
+        return (
+            any(pattern in url for pattern in self.url_patterns)
+            and any(mime_type.startswith(allowed) for allowed in self.mime_types)
+        )
+
+    def _drain(self):
+        """쌓인 성능 로그를 읽어 대상 응답과 수신 완료 이벤트 기록"""
+        try:
+            entries = self.driver.get_log('performance')
+        except WebDriverException as e:
+            self.logger.debug(f"성능 로그 읽기 실패: {str(e)}")
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            request_id = params.get('requestId')
+            if method == 'Network.responseReceived':
+                response = params.get('response', {})
+                if self._matches(response, params.get('type')):
+                    self._responses[request_id] = {
+                        'url': response.get('url', ''),
+                        'status': response.get('status', 0),
+                        'mime_type': response.get('mimeType', ''),
+                        'resource_type': params.get('type'),
+                    }
+            elif method == 'Network.loadingFinished' and request_id in self._responses:
+                self._finished.append(request_id)
+            elif method == 'Network.loadingFailed':
+                self._responses.pop(request_id, None)
+
+    def clear(self):
+        """이전 요청의 이벤트 버리기 (조회 버튼 클릭 직전에 호출)"""
+        self._drain()
+        self._responses.clear()
+        self._finished.clear()
+
+    def _read_body(self, request_id: str) -> Optional[str]:
+        """Network.getResponseBody로 응답 본문 읽기"""
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except WebDriverException as e:
+            # 페이지 이동으로 이전 문서의 본문이 사라진 경우 등
+            self.logger.debug(f"응답 본문 읽기 실패 ({request_id}): {str(e)}")
+            return None
+        body = result.get('body', '')
+        if result.get('base64Encoded'):
+            body = base64.b64decode(body).decode('utf-8', errors='replace')
+        return body
+
+    def wait_for_response(self, timeout: Optional[float] = None) -> Optional[CapturedResponse]:
+        """
+        clear() 이후 도착한 결과 데이터 응답을 기다려 본문과 함께 반환
+
+        Args:
+            timeout: 최대 대기 시간(초) (None이면 WAIT_TIMEOUTS['table_refresh'])
+
+        Returns:
+            CapturedResponse 또는 시간 초과/본문 읽기 실패 시 None
+        """
+        timeout = WAIT_TIMEOUTS['table_refresh'] if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            self._drain()
+            while self._finished:
+                request_id = self._finished.pop(0)
+                info = self._responses.pop(request_id, None)
+                if info is None or info['status'] >= 400:
+                    continue
+                body = self._read_body(request_id)
+                if body:
+                    return CapturedResponse(body=body, **info)
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(WAIT_TIMEOUTS['poll_interval'])
@@ -0,0 +1,83 @@
+"""
+페이지 상태 모듈
+종목 상세 페이지에 현재 표시된 결과(종목, 연간/분기 구분, 기간)를 추적하여
+목표 상태에 도달하는 데 필요한 조작만 수행할 수 있도록 함
+"""
+from typing import Any, Dict, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+_READ_STATE_SCRIPT = """
+var value = function(selector) {
+    var el = document.querySelector(selector);
+    return el ? el.value : null;
+};
+return {
+    mode: value(arguments[0]),
+    period: value(arguments[1]),
+    stock_name: value(arguments[2]),
+    has_table: document.querySelector('#contents > table') !== null
+};
+"""
+
+
+def read_dom_state(driver, selectors: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+    """
+    드롭다운 선택값과 검색창 값을 한 번의 스크립트 호출로 읽기
+
+    Args:
+        driver: WebDriver
+        selectors: config.SELECTORS
+
+    Returns:
+        {'mode', 'period', 'stock_name', 'has_table'} (읽기 실패 시 빈 딕셔너리)
+    """
+    try:
+        return driver.execute_script(
+            _READ_STATE_SCRIPT,
+            selectors['annual']['selector'],
+            selectors['branch']['selector'],
+            selectors['search']['input']
+        ) or {}
+    except WebDriverException:
+        return {}
+
+
+class PageState:
+    """현재 표시된 조회 결과 상태 클래스"""
+
+    def __init__(self):
+        self.code: Optional[str] = None
+        self.mode: Optional[str] = None
+        self.period: Optional[str] = None
+
+    def reset(self):
+        """상태 초기화 (페이지 이동 등으로 표시 내용을 알 수 없는 경우)"""
+        self.code = None
+        self.mode = None
+        self.period = None
+
+    def update(self, code: Optional[str], mode: Optional[str], period: Optional[str]):
+        """조회 결과가 표시된 후 상태 갱신"""
+        self.code = code
+        self.mode = mode
+        self.period = period
+
+    def shows(self, code: Optional[str], mode: Optional[str] = None, period: Optional[str] = None) -> bool:
+        """
+        해당 종목(과 구분/기간)의 결과가 표시된 상태인지 여부
+
+        Args:
+            code: 종목코드
+            mode: 'A' 또는 'Q' (None이면 확인하지 않음)
+            period: 기간 값 (None이면 확인하지 않음)
+        """
+        return (
+            self.code is not None
+            and self.code == code
+            and (mode is None or self.mode == mode)
+            and (period is None or self.period == period)
+        )
+
+    def __repr__(self):
+        return f"PageState(code={self.code}, mode={self.mode}, period={self.period})"
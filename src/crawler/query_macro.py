@@ -0,0 +1,134 @@
+"""
+조회 매크로 모듈
+연간/분기 구분 선택, 기간 선택, 조회 버튼 클릭, 테이블 추출을 한 번의
+execute_async_script 호출로 브라우저 안에서 수행하여 WebDriver 왕복 횟수를 줄임
+
+조회 버튼이 페이지 이동을 일으키면 스크립트가 중단되므로, 호출 측은 새 문서가
+로드되기를 기다린 뒤 테이블 추출 스크립트만 다시 실행해야 한다.
+"""
+from typing import Any, Dict, Optional
+
+from config.config import SELECTORS, WAIT_TIMEOUTS
+
+QUERY_MACRO_SCRIPT = """
+var args = arguments[0];
+var done = arguments[arguments.length - 1];
+var started = performance.now();
+var timings = {};
+var mark = function(name) { timings[name] = Math.round(performance.now() - started); };
+var finish = function(result) { mark('total'); result.timings = timings; done(result); };
+var fail = function(reason) { finish({ok: false, reason: reason}); };
+
+var waitFor = function(condition, timeoutMs, label, next) {
+    var begin = performance.now();
+    (function poll() {
+        var satisfied = false;
+        try { satisfied = condition(); } catch (e) { satisfied = false; }
+        if (satisfied) { mark(label); return next(); }
+        if (performance.now() - begin > timeoutMs) { return fail(label); }
+        setTimeout(poll, args.poll_ms);
+    })();
+};
+var change = function(select, value) {
+    select.value = value;
+    select.dispatchEvent(new Event('input', {bubbles: true}));
+    select.dispatchEvent(new Event('change', {bubbles: true}));
+};
+var hasOption = function(select, value) {
+    for (var i = 0; i < select.options.length; i++) {
+        if (select.options[i].value === value) return true;
+    }
+    return false;
+};
+var signature = function() {
+    var el = document.querySelector('#contents');
+    var text = el ? el.innerText : '';
+    var hash = 0;
+    for (var i = 0; i < text.length; i++) { hash = ((hash << 5) - hash + text.charCodeAt(i)) | 0; }
+    return text.length + ':' + hash;
+};
+var extract = function(submitted) {
+    var table = document.querySelector('#contents > table');
+    var input = document.querySelector(args.search_input);
+    finish({
+        ok: true,
+        submitted: submitted,
+        mode: modeSelect.value,
+        period: periodSelect.value,
+        table: table ? table.outerHTML : null,
+        stock_name: input ? input.value : null
+    });
+};
+
+var modeSelect = document.querySelector(args.mode_select);
+var periodSelect = document.querySelector(args.period_select);
+if (!modeSelect || !periodSelect) { return fail('select_missing'); }
+var changed = false;
+
+var submit = function() {
+    var current = !changed && document.querySelector('#contents > table') !== null &&
+        modeSelect.value === args.shown_mode && periodSelect.value === args.shown_period;
+    if (current) { mark('skip_submit'); return extract(false); }
+    var button = document.querySelector(args.submit_button);
+    if (!button) { return fail('submit_missing'); }
+    var before = signature();
+    // 페이지 이동이 일어나면 이 스크립트는 중단되고 호출 측이 새 문서에서 추출함
+    window.__crawlerStaleDocument = true;
+    button.click();
+    mark('submit');
+    waitFor(function() {
+        return document.readyState === 'complete' && signature() !== before;
+    }, args.refresh_timeout_ms, 'table_refresh', function() { extract(true); });
+};
+
+var selectPeriod = function() {
+    if (!args.period || (!changed && periodSelect.value === args.period)) { return submit(); }
+    waitFor(function() { return hasOption(periodSelect, args.period); }, args.dropdown_timeout_ms, 'period_options', function() {
+        change(periodSelect, args.period);
+        changed = true;
+        submit();
+    });
+};
+
+if (args.mode && modeSelect.value !== args.mode) {
+    change(modeSelect, args.mode);
+    changed = true;
+    mark('mode');
+}
+selectPeriod();
+"""
+
+
+def build_macro_args(
+    mode: Optional[str],
+    period: Optional[str],
+    shown_mode: Optional[str],
+    shown_period: Optional[str]
+) -> Dict[str, Any]:
+    """
+    조회 매크로 인자 생성
+
+    Args:
+        mode: 목표 구분 ('A' 또는 'Q', None이면 유지)
+        period: 목표 기간 값 (None이면 유지)
+        shown_mode: 현재 표시된 결과의 구분 (page_state)
+        shown_period: 현재 표시된 결과의 기간 (page_state)
+    """
+    return {
+        'mode': mode,
+        'period': period,
+        'shown_mode': shown_mode,
+        'shown_period': shown_period,
+        'mode_select': SELECTORS['annual']['selector'],
+        'period_select': SELECTORS['branch']['selector'],
+        'submit_button': SELECTORS['login']['quarter_submit'],
+        'search_input': SELECTORS['search']['input'],
+        'poll_ms': int(WAIT_TIMEOUTS['poll_interval'] * 1000),
+        'dropdown_timeout_ms': int(WAIT_TIMEOUTS['dropdown'] * 1000),
+        'refresh_timeout_ms': int(WAIT_TIMEOUTS['table_refresh'] * 1000),
+    }
+
+
+def script_timeout() -> float:
+    """매크로 실행 최대 시간(초) - 드롭다운과 테이블 갱신 대기 합계에 여유를 더함"""
+    return WAIT_TIMEOUTS['dropdown'] * 2 + WAIT_TIMEOUTS['table_refresh'] + 2
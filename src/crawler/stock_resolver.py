@@ -0,0 +1,140 @@
+"""
+종목코드 해석 캐시 모듈
+검색창 자동완성으로 찾은 종목의 종목명과 종목코드 필드값(또는 결과 페이지 URL)을 저장하여
+다음 조회부터는 자동완성 과정 없이 결과 페이지로 바로 이동할 수 있도록 함
+
+항목은 처음 검색할 때 채워지고, 바로 이동에 실패하면 삭제되어 다음 검색 때 다시 채워진다.
+변경 내용은 메모리에 모아 두었다가 flush_interval번 변경될 때마다, 그리고 크롤러 종료 시
+파일에 한 번에 기록한다.
+"""
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from config.config import STOCK_RESOLUTION_CONFIG
+
+
+class StockResolutionCache:
+    """종목코드 -> 결과 페이지 정보 캐시 클래스"""
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Args:
+            cache_file: 캐시 JSON 파일 경로
+        """
+        self.cache_file = cache_file or STOCK_RESOLUTION_CONFIG['cache_file']
+        self.flush_interval = STOCK_RESOLUTION_CONFIG['flush_interval']
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        # 아직 파일에 기록하지 않은 변경 (저장/삭제한 종목코드)
+        self._updated: Set[str] = set()
+        self._removed: Set[str] = set()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """캐시 파일 읽기"""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """캐시 파일 저장 (잠금 보유 상태에서 호출, 임시 파일에 쓴 뒤 교체)"""
+        try:
+            directory = os.path.dirname(self.cache_file)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            self.logger.warning(f"종목코드 해석 캐시 저장 실패: {str(e)}")
+
+    def get(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 종목 정보
+
+        Returns:
+            {'stock_name', 'code_values', 'url', 'resolved_at'} 또는 없으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(stock_code)
+            return dict(entry) if entry else None
+
+    def put(self, stock_code: str, **fields):
+        """
+        종목 정보 저장 (기존 항목에 병합, 파일 기록은 flush에서)
+
+        Args:
+            stock_code: 종목코드
+            **fields: 저장할 값 (stock_name, code_values, url 등)
+        """
+        with self._lock:
+            entry = self._entries.setdefault(stock_code, {})
+            entry.update(fields)
+            entry['resolved_at'] = datetime.now().isoformat()
+            self._updated.add(stock_code)
+            self._removed.discard(stock_code)
+            self._flush_if_due()
+
+    def invalidate(self, stock_code: str):
+        """종목 정보 삭제 (바로 이동 실패 시)"""
+        with self._lock:
+            if self._entries.pop(stock_code, None) is not None:
+                self._removed.add(stock_code)
+                self._updated.discard(stock_code)
+                self._flush_if_due()
+
+    def _flush_if_due(self):
+        """변경이 flush_interval개 쌓이면 기록 (잠금 보유 상태에서 호출)"""
+        if len(self._updated) + len(self._removed) >= self.flush_interval:
+            self._flush()
+
+    def flush(self):
+        """메모리의 변경 내용을 파일에 기록"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        """변경 내용 기록 (잠금 보유 상태에서 호출)"""
+        if not self._updated and not self._removed:
+            return
+        # 다른 프로세스가 추가한 항목을 잃지 않도록 파일 내용에 이 프로세스의 변경만 반영
+        entries = self._load()
+        for stock_code in self._removed:
+            entries.pop(stock_code, None)
+        for stock_code in self._updated:
+            if stock_code in self._entries:
+                entries[stock_code] = self._entries[stock_code]
+        self._entries = entries
+        self._updated.clear()
+        self._removed.clear()
+        self._save()
+
+
+_cache: Optional[StockResolutionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_stock_resolution_cache() -> Optional[StockResolutionCache]:
+    """
+    프로세스 공유 종목코드 해석 캐시 반환
+
+    Returns:
+        StockResolutionCache 또는 비활성화 시 None
+    """
+    global _cache
+    if not STOCK_RESOLUTION_CONFIG['enabled']:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = StockResolutionCache()
+            # 크롤러 종료 없이 프로세스가 끝나도 남은 변경을 기록
+            atexit.register(_cache.flush)
+        return _cache
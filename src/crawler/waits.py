@@ -0,0 +1,180 @@
+"""
+대기 조건 모듈
+고정 sleep 대신 DOM/URL 상태가 충족될 때까지만 대기하기 위한 조건 함수 제공
+
+모든 조건은 WebDriverWait.until()에 전달할 수 있는 callable(driver) 형태이며,
+implicit wait의 영향을 받지 않도록 find_element 대신 JavaScript로 DOM을 조회한다.
+"""
+from selenium.common.exceptions import WebDriverException
+
+
+def _run_script(driver, script, *args):
+    """스크립트 실행 (페이지 전환 중 발생하는 오류는 미충족으로 처리)"""
+    try:
+        return driver.execute_script(script, *args)
+    except WebDriverException:
+        return None
+
+
+def document_ready(driver):
+    """문서 로딩 완료 여부"""
+    return _run_script(driver, "return document.readyState;") == "complete"
+
+
+def document_interactive(driver):
+    """DOM 구성 완료 여부 (하위 리소스 로딩은 기다리지 않음)"""
+    return _run_script(driver, "return document.readyState;") in ("interactive", "complete")
+
+
+def mark_document(driver):
+    """현재 문서에 표시를 남김 (새 문서로 바뀌었는지 확인하기 위함)"""
+    _run_script(driver, "window.__crawlerStaleDocument = true;")
+
+
+def new_document_interactive(driver):
+    """mark_document() 이후 새 문서로 바뀌었고 DOM 구성이 끝났는지 여부"""
+    return bool(_run_script(
+        driver,
+        """
+        return !window.__crawlerStaleDocument &&
+            (document.readyState === 'interactive' || document.readyState === 'complete');
+        """
+    ))
+
+
+def element_present(css_selector):
+    """CSS 선택자에 해당하는 요소 존재 여부"""
+    def condition(driver):
+        return bool(_run_script(
+            driver, "return document.querySelector(arguments[0]) !== null;", css_selector
+        ))
+    return condition
+
+
+def element_visible(css_selector):
+    """CSS 선택자에 해당하는 요소가 화면에 표시되었는지 여부"""
+    def condition(driver):
+        return bool(_run_script(
+            driver,
+            """
+            var el = document.querySelector(arguments[0]);
+            return !!el && el.offsetParent !== null;
+            """,
+            css_selector
+        ))
+    return condition
+
+
+def select_has_options(css_selector, min_count=1):
+    """select 요소에 옵션이 채워졌는지 여부"""
+    def condition(driver):
+        count = _run_script(
+            driver,
+            """
+            var el = document.querySelector(arguments[0]);
+            return el ? el.options.length : 0;
+            """,
+            css_selector
+        )
+        return (count or 0) >= min_count
+    return condition
+
+
+def select_has_value(css_selector, value):
+    """select 요소에 특정 value의 옵션이 존재하는지 여부"""
+    def condition(driver):
+        return bool(_run_script(
+            driver,
+            """
+            var el = document.querySelector(arguments[0]);
+            if (!el) return false;
+            for (var i = 0; i < el.options.length; i++) {
+                if (el.options[i].value === arguments[1]) return true;
+            }
+            return false;
+            """,
+            css_selector,
+            value
+        ))
+    return condition
+
+
+def select_value_is(css_selector, value):
+    """select 요소의 현재 선택값이 value인지 여부"""
+    def condition(driver):
+        return _run_script(
+            driver,
+            "var el = document.querySelector(arguments[0]); return el ? el.value : null;",
+            css_selector
+        ) == value
+    return condition
+
+
+def input_value(driver, css_selector):
+    """입력 요소의 현재 값 (없으면 None)"""
+    return _run_script(
+        driver,
+        "var el = document.querySelector(arguments[0]); return el ? el.value : null;",
+        css_selector
+    )
+
+
+def input_value_is(css_selector, value):
+    """입력 요소의 현재 값이 value인지 여부"""
+    def condition(driver):
+        return input_value(driver, css_selector) == value
+    return condition
+
+
+def url_changed(old_url):
+    """현재 URL이 old_url과 달라졌는지 여부"""
+    def condition(driver):
+        try:
+            return driver.current_url != old_url
+        except WebDriverException:
+            return False
+    return condition
+
+
+def url_not_contains(text):
+    """현재 URL에 text가 포함되지 않는지 여부 (대소문자 무시)"""
+    def condition(driver):
+        try:
+            return text.lower() not in driver.current_url.lower()
+        except WebDriverException:
+            return False
+    return condition
+
+
+def page_signature(driver, css_selector="#contents"):
+    """
+    현재 페이지 상태 서명 (URL + 콘텐츠 영역 텍스트 해시)
+
+    조회 버튼 클릭/종목 검색 전후의 서명을 비교해 결과 갱신 여부를 판단한다.
+    """
+    signature = _run_script(
+        driver,
+        """
+        var el = document.querySelector(arguments[0]);
+        var text = el ? el.innerText : '';
+        var hash = 0;
+        for (var i = 0; i < text.length; i++) {
+            hash = ((hash << 5) - hash + text.charCodeAt(i)) | 0;
+        }
+        return [location.href, document.readyState, text.length + ':' + hash];
+        """,
+        css_selector
+    )
+    return tuple(signature) if signature else None
+
+
+def content_changed(old_signature, css_selector="#contents"):
+    """페이지 서명이 바뀌고 문서 로딩이 끝났는지 여부 (테이블 갱신 감지)"""
+    def condition(driver):
+        signature = page_signature(driver, css_selector)
+        if not signature or signature[1] != "complete":
+            return False
+        if not old_signature:
+            return True
+        return signature[0] != old_signature[0] or signature[2] != old_signature[2]
+    return condition
@@ -1,5 +1,7 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 from src.core.crawler_service import CrawlerService, CrawlingMode
+from src.crawler.fnguide import build_quarter_value
+from src.utils.run_journal import RunJournal, item_status
 from config.config import (
     CRAWLER_CONFIG, 
     CSV_CONFIG,
@@ -17,12 +19,15 @@ class CrawlerWorker(QThread):
     error = pyqtSignal(str)    # 에러 시그널
     data_saved = pyqtSignal(dict)  # 데이터 저장 완료 시그널
     
-    def __init__(self, stock_codes, year, quarter, user_id=None, password=None):
+    def __init__(self, stock_codes, year, quarter, user_id=None, password=None, resume=False, run_id=None):
         super().__init__()
         self.stock_codes = stock_codes
         self.year = year
         self.quarter = quarter
         self.is_running = True
+        self.resume = resume
+        self.run_id = run_id
+        self.period = build_quarter_value(year, quarter)
         
         # 파일명 생성 (연간/분기에 따라 다르게)
         if quarter is None:
@@ -69,6 +74,9 @@ class CrawlerWorker(QThread):
             
             self.log.emit(f"{data_type} 데이터 크롤링을 시작합니다...")
             
+            # 실행 기록 준비 (이어서 진행 시 완료된 종목 제외)
+            journal = self._prepare_journal()
+            
             # 각 종목별로 데이터 수집
             total = len(self.stock_codes)
             success_count = 0
@@ -92,6 +100,7 @@ class CrawlerWorker(QThread):
                         # 데이터 유효성 검사 및 저장
                         if self.save_data_to_csv(data):
                             success_count += 1
+                            journal.record(code, self.period, item_status(data))
                             self.log.emit(f"종목 {code} 데이터 저장 완료")
                             # 데이터 저장 완료 시그널 발생
                             self.data_saved.emit(data)
@@ -120,6 +129,29 @@ class CrawlerWorker(QThread):
             if self.service:
                 self.service.close()
     
+    def _prepare_journal(self):
+        """실행 기록 준비 - 이어서 진행하면 기존 결과 파일에 추가하고 완료된 종목은 건너뜀"""
+        journal = None
+        if self.resume:
+            journal = RunJournal(self.run_id) if self.run_id else RunJournal.latest(self.period)
+            if journal is None or not journal.exists():
+                self.log.emit("이어서 진행할 실행 기록이 없어 새로 시작합니다.")
+                journal = None
+        
+        if journal is None:
+            journal = RunJournal(self.run_id or f'{datetime.now().strftime("%Y%m%d_%H%M%S")}_{self.period}')
+            journal.start(self.file_name, period=self.period)
+            return journal
+        
+        self.file_name = journal.output_file() or self.file_name
+        self.is_first = not os.path.exists(self.file_name)
+        done = journal.completed()
+        skipped = len(self.stock_codes)
+        self.stock_codes = [code for code in self.stock_codes if (code, self.period) not in done]
+        skipped -= len(self.stock_codes)
+        self.log.emit(f"실행 {journal.run_id} 이어서 진행 - 완료된 {skipped}개 종목 건너뜀")
+        return journal
+    
     def save_data_to_csv(self, data):
         """데이터를 CSV 파일에 저장"""
         try:
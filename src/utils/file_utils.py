@@ -4,7 +4,7 @@
 """
 import csv
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 import logging
 
 
@@ -87,6 +87,42 @@ class FileManager:
             self.logger.error(f"데이터 저장 실패: {str(e)}")
             return False
     
+    def remove_rows(self, file_name: str, key_columns: List[str], keys: Set[Tuple[str, ...]]) -> int:
+        """
+        CSV 파일에서 키 컬럼 값이 keys에 있는 행 삭제 (임시 파일에 쓴 뒤 교체)
+        
+        Args:
+            file_name: CSV 파일명
+            key_columns: 키 컬럼 리스트 (예: ['stock_code', 'period'])
+            keys: 삭제할 행의 키 값 튜플 집합
+            
+        Returns:
+            삭제한 행 수
+        """
+        if not keys or not os.path.exists(file_name):
+            return 0
+        with open(file_name, mode='r', newline='', encoding=self.encoding) as file:
+            rows = list(csv.reader(file))
+        if not rows:
+            return 0
+        header, body = rows[0], rows[1:]
+        if any(column not in header for column in key_columns):
+            return 0
+        indexes = [header.index(column) for column in key_columns]
+        kept = [
+            row for row in body
+            if tuple(row[i] if i < len(row) else None for i in indexes) not in keys
+        ]
+        removed = len(body) - len(kept)
+        if removed:
+            temp_name = f"{file_name}.tmp"
+            with open(temp_name, mode='w', newline='', encoding=self.encoding) as file:
+                writer = csv.writer(file)
+                writer.writerow(header)
+                writer.writerows(kept)
+            os.replace(temp_name, file_name)
+        return removed
+    
     def ensure_directory(self, directory_path: str) -> bool:
         """
         디렉토리 존재 확인 및 생성
@@ -0,0 +1,169 @@
+"""
+결과 페이지 HTML 보관 모듈
+조회한 결과 페이지 HTML을 gzip으로 압축해 내용 해시(sha256) 단위로 저장하고,
+(종목코드, 기간)별 색인을 두어 브라우저 없이 다시 파싱할 수 있도록 함
+
+같은 내용의 HTML은 한 번만 저장된다.
+"""
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from config.config import HTML_ARCHIVE_CONFIG
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    code TEXT NOT NULL,
+    period TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    stock_name TEXT,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (code, period)
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_period ON snapshots (period);
+"""
+
+
+class HtmlArchive:
+    """압축/내용 주소 기반 HTML 보관소 클래스"""
+
+    def __init__(self, root_dir: Optional[str] = None, compress_level: Optional[int] = None):
+        """
+        Args:
+            root_dir: 보관소 디렉토리 (objects/ 아래에 HTML, index.sqlite3에 색인 저장)
+            compress_level: gzip 압축 수준 (1~9)
+        """
+        self.root_dir = root_dir or HTML_ARCHIVE_CONFIG['dir']
+        self.compress_level = compress_level or HTML_ARCHIVE_CONFIG['compress_level']
+        self.objects_dir = os.path.join(self.root_dir, "objects")
+        self.index_path = os.path.join(self.root_dir, "index.sqlite3")
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """색인 SQLite 연결 (스레드/프로세스별로 짧게 열고 닫음)"""
+        with self._lock:
+            conn = sqlite3.connect(self.index_path, timeout=30)
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    def object_path(self, sha256: str) -> str:
+        """해시에 해당하는 압축 파일 경로"""
+        return os.path.join(self.objects_dir, sha256[:2], f"{sha256}.html.gz")
+
+    def put(self, code: str, period: str, html: str, stock_name: Optional[str] = None) -> str:
+        """
+        HTML 저장 및 색인 갱신
+
+        Args:
+            code: 종목코드
+            period: 기간 값 (quarter_value)
+            html: 결과 페이지 HTML
+            stock_name: 종목명
+
+        Returns:
+            내용 해시(sha256)
+        """
+        raw = html.encode("utf-8")
+        sha256 = hashlib.sha256(raw).hexdigest()
+        path = self.object_path(sha256)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체하여 중단 시에도 손상된 파일이 남지 않도록 함
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(gzip.compress(raw, compresslevel=self.compress_level))
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots (code, period, sha256, stock_name, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (code, period, sha256, stock_name, time.time())
+            )
+        return sha256
+
+    def read(self, sha256: str) -> Optional[str]:
+        """해시로 HTML 읽기 (없으면 None)"""
+        try:
+            with open(self.object_path(sha256), "rb") as f:
+                return gzip.decompress(f.read()).decode("utf-8")
+        except OSError:
+            return None
+
+    def get(self, code: str, period: str) -> Optional[str]:
+        """(종목코드, 기간)의 최신 HTML 읽기 (없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT sha256 FROM snapshots WHERE code = ? AND period = ?",
+                (code, period)
+            ).fetchone()
+        return self.read(row[0]) if row else None
+
+    def entries(self, period: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        색인 항목 목록
+
+        Args:
+            period: 이 기간의 항목만 (None이면 전체)
+
+        Yields:
+            {'code', 'period', 'sha256', 'stock_name', 'fetched_at'}
+        """
+        query = "SELECT code, period, sha256, stock_name, fetched_at FROM snapshots"
+        params = ()
+        if period is not None:
+            query += " WHERE period = ?"
+            params = (period,)
+        query += " ORDER BY period, code"
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        for code, row_period, sha256, stock_name, fetched_at in rows:
+            yield {
+                'code': code,
+                'period': row_period,
+                'sha256': sha256,
+                'stock_name': stock_name,
+                'fetched_at': fetched_at,
+            }
+
+
+_archive: Optional[HtmlArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_html_archive() -> Optional[HtmlArchive]:
+    """
+    프로세스 공유 HTML 보관소 반환
+
+    Returns:
+        HtmlArchive 또는 비활성화 시 None
+    """
+    global _archive
+    if not HTML_ARCHIVE_CONFIG['enabled']:
+        return None
+    with _archive_lock:
+        if _archive is None:
+            _archive = HtmlArchive()
+        return _archive
@@ -0,0 +1,183 @@
+"""
+요청 속도 제한 모듈
+같은 호스트의 모든 크롤러 인스턴스/스레드/프로세스가 공유하는 토큰 버킷 제공
+
+버킷 상태(남은 토큰, 갱신 시각)는 파일에 저장되고 파일 잠금으로 보호되므로
+여러 프로세스가 같은 상태 파일을 사용하면 전체 요청 속도가 설정값을 넘지 않는다.
+적응형 속도 조절로 바꾼 속도도 상태 파일에 기록되어, 속도를 조절하는 프로세스가
+요청을 계속하는 동안 같은 버킷을 쓰는 모든 프로세스가 그 속도를 따른다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from config.config import RATE_LIMIT_CONFIG
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextmanager
+def _file_lock(lock_path: str):
+    """프로세스 간 배타적 파일 잠금"""
+    with open(lock_path, "a+") as lock_file:
+        if os.name == "nt":
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class TokenBucketRateLimiter:
+    """파일 기반 공유 토큰 버킷 클래스"""
+
+    def __init__(self, rate: float, burst: float, state_file: Optional[str] = None):
+        """
+        Args:
+            rate: 초당 보충되는 토큰 수 (허용 요청 속도)
+            burst: 버킷 최대 토큰 수 (순간 허용 요청 수)
+            state_file: 버킷 상태 파일 경로 (None이면 프로세스 내에서만 공유)
+        """
+        self.rate = rate
+        self.base_rate = rate  # 설정된 속도 (조절된 속도의 상한)
+        self.burst = burst
+        self.state_file = state_file
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._adjusted = False  # 이 프로세스가 속도를 조절했는지 여부
+        self._tokens = burst
+        self._updated = time.time()
+        if state_file:
+            os.makedirs(os.path.dirname(state_file), exist_ok=True)
+
+    def set_rate(self, rate: float):
+        """
+        허용 요청 속도 변경 (설정된 속도를 넘지 않음)
+
+        상태 파일을 쓰는 버킷이면 다음 토큰 요청 때 조절된 속도를 상태 파일에 기록해
+        다른 프로세스도 같은 속도를 사용한다.
+        """
+        self.rate = min(self.base_rate, max(rate, 1e-6))
+        self._adjusted = True
+
+    @contextmanager
+    def _state(self):
+        """버킷 상태 읽기/쓰기 (잠금 포함)"""
+        with self._lock:
+            if not self.state_file:
+                state = {'tokens': self._tokens, 'updated': self._updated}
+                yield state
+                self._tokens, self._updated = state['tokens'], state['updated']
+                return
+
+            with _file_lock(f"{self.state_file}.lock"):
+                try:
+                    with open(self.state_file, "r", encoding="utf-8") as f:
+                        state = json.load(f)
+                except (OSError, ValueError):
+                    state = {'tokens': self.burst, 'updated': time.time()}
+                yield state
+                with open(self.state_file, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        토큰을 얻을 때까지 대기
+
+        Args:
+            tokens: 소비할 토큰 수
+
+        Returns:
+            대기한 시간(초)
+        """
+        waited = 0.0
+        while True:
+            with self._state() as state:
+                now = time.time()
+                rate = self._shared_rate(state, now)
+                available = min(
+                    self.burst,
+                    state['tokens'] + max(0.0, now - state['updated']) * rate
+                )
+                state['updated'] = now
+                if available >= tokens:
+                    state['tokens'] = available - tokens
+                    return waited
+                state['tokens'] = available
+                delay = (tokens - available) / rate
+            time.sleep(delay)
+            waited += delay
+
+    def _shared_rate(self, state: Dict[str, float], now: float) -> float:
+        """
+        이번 요청에 적용할 속도 (잠금 보유 상태에서 호출)
+
+        이 프로세스가 속도를 조절했으면 상태에 기록하고(유효 시간 연장), 아니면 다른
+        프로세스가 기록한 조절 속도가 유효한 동안 그 속도를 사용한다.
+        """
+        if self._adjusted:
+            state['rate'] = self.rate
+            state['rate_until'] = now + RATE_LIMIT_CONFIG['shared_rate_ttl']
+            return self.rate
+        if state.get('rate') and state.get('rate_until', 0) > now:
+            return min(self.base_rate, state['rate'])
+        return self.rate
+
+
+_limiters: Dict[str, TokenBucketRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str = "default",
+    rate: Optional[float] = None,
+    burst: Optional[float] = None
+) -> Optional[TokenBucketRateLimiter]:
+    """
+    이름별 공유 토큰 버킷 반환 (같은 이름은 같은 상태 파일을 사용)
+
+    Args:
+        name: 버킷 이름
+        rate: 초당 허용 요청 수 (None이면 RATE_LIMIT_CONFIG['rate'], 처음 생성할 때만 적용)
+        burst: 순간 허용 요청 수 (None이면 RATE_LIMIT_CONFIG['burst'])
+
+    Returns:
+        TokenBucketRateLimiter 또는 비활성화 시 None
+    """
+    if not RATE_LIMIT_CONFIG['enabled']:
+        return None
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = TokenBucketRateLimiter(
+                rate=rate if rate is not None else RATE_LIMIT_CONFIG['rate'],
+                burst=burst if burst is not None else RATE_LIMIT_CONFIG['burst'],
+                state_file=os.path.join(RATE_LIMIT_CONFIG['state_dir'], f"{name}.json")
+            )
+        return _limiters[name]
+
+
+def throttle(limiter: Optional[TokenBucketRateLimiter], tokens: float = 1) -> float:
+    """limiter가 있으면 토큰을 얻을 때까지 대기 (없으면 즉시 반환)"""
+    if limiter is None:
+        return 0.0
+    return limiter.acquire(tokens)
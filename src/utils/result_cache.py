@@ -0,0 +1,201 @@
+"""
+조회 결과 캐시 모듈
+(종목코드, 기간 값) 단위로 추출 결과를 로컬 SQLite에 저장하여
+같은 조회를 반복할 때 브라우저/네트워크 요청을 생략
+
+확정된 과거 기간(기간 종료 후 정산 기간이 지난 기간)을 확정 후에 조회한 결과는 만료 없이
+보관하고, 확정 전에 조회한 결과는 짧은 유효 시간을 적용한다.
+"""
+import calendar
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any, Dict, Optional
+
+from config.config import RESULT_CACHE_CONFIG
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    code TEXT NOT NULL,
+    period TEXT NOT NULL,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (code, period)
+);
+CREATE INDEX IF NOT EXISTS idx_results_accessed ON results (accessed_at);
+"""
+
+
+def period_end(period: str) -> Optional[date]:
+    """
+    기간 값의 종료일 계산
+
+    Args:
+        period: 기간 값 (예: 202412D, 2024093)
+
+    Returns:
+        기간 마지막 날 또는 해석할 수 없으면 None
+    """
+    try:
+        year, month = int(period[:4]), int(period[4:6])
+        return date(year, month, calendar.monthrange(year, month)[1])
+    except (ValueError, TypeError, calendar.IllegalMonthError):
+        return None
+
+
+def period_ttl(period: str, fetched_at: float) -> Optional[float]:
+    """
+    기간별 결과 유효 시간
+
+    확정 여부는 조회 시점(fetched_at) 기준으로 판단한다. 확정 전에 조회한 결과는
+    짧은 유효 시간을 적용하고, 그 사이 기간이 확정되면 확정 시점에 바로 만료시켜
+    확정 수치로 다시 조회하도록 한다.
+
+    Args:
+        period: 기간 값
+        fetched_at: 결과 조회 시각 (time.time())
+
+    Returns:
+        유효 시간(초) 또는 확정된 뒤 조회한 결과면 None (만료 없음)
+    """
+    end = period_end(period)
+    if end is None:
+        return RESULT_CACHE_CONFIG['ttl_seconds']
+    settled = end + timedelta(days=RESULT_CACHE_CONFIG['settlement_days'] + 1)
+    settled_at = time.mktime(settled.timetuple())
+    if fetched_at >= settled_at:
+        return None
+    return min(RESULT_CACHE_CONFIG['open_period_ttl_seconds'], settled_at - fetched_at)
+
+
+class ResultCache:
+    """기간별 유효 시간과 크기 제한(LRU)을 갖는 디스크 결과 캐시 클래스"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttl_seconds: 모든 기간에 적용할 유효 시간(초) (None이면 기간별 유효 시간 사용)
+            max_entries: 최대 보관 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 삭제,
+                시작 시와 evict_interval번 저장할 때마다 확인)
+        """
+        self.path = path or RESULT_CACHE_CONFIG['path']
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries or RESULT_CACHE_CONFIG['max_entries']
+        self.evict_interval = RESULT_CACHE_CONFIG['evict_interval']
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._puts = 0
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._evict(conn)
+
+    @contextmanager
+    def _connect(self):
+        """SQLite 연결 (스레드/프로세스별로 짧게 열고 닫음)"""
+        with self._lock:
+            conn = sqlite3.connect(self.path, timeout=30)
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    def get(self, code: str, period: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 결과 조회
+
+        Args:
+            code: 종목코드
+            period: 기간 값 (quarter_value)
+
+        Returns:
+            결과 딕셔너리 또는 없거나 만료된 경우 None
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data, fetched_at FROM results WHERE code = ? AND period = ?",
+                (code, period)
+            ).fetchone()
+            if row is None:
+                return None
+            data, fetched_at = row
+            ttl = self.ttl_seconds if self.ttl_seconds is not None else period_ttl(period, fetched_at)
+            if ttl is not None and now - fetched_at > ttl:
+                return None
+            conn.execute(
+                "UPDATE results SET accessed_at = ? WHERE code = ? AND period = ?",
+                (now, code, period)
+            )
+        return json.loads(data)
+
+    def put(self, code: str, period: str, data: Dict[str, Any]):
+        """
+        결과 저장 (evict_interval번 저장할 때마다 최대 항목 수 확인 후 LRU 삭제)
+
+        Args:
+            code: 종목코드
+            period: 기간 값 (quarter_value)
+            data: 결과 딕셔너리
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (code, period, data, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (code, period, json.dumps(data, ensure_ascii=False), now, now)
+            )
+            # 전체 개수 확인은 테이블 전체를 읽으므로 저장할 때마다 하지 않음
+            self._puts += 1
+            if self._puts >= self.evict_interval:
+                self._puts = 0
+                self._evict(conn)
+
+    def _evict(self, conn):
+        """최대 항목 수를 넘은 만큼 가장 오래 사용되지 않은 항목 삭제 (잠금 보유 상태에서 호출)"""
+        count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM results WHERE rowid IN ("
+                "SELECT rowid FROM results ORDER BY accessed_at ASC LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    def invalidate(self, code: str, period: Optional[str] = None):
+        """특정 종목(또는 종목+기간) 캐시 삭제"""
+        with self._connect() as conn:
+            if period is None:
+                conn.execute("DELETE FROM results WHERE code = ?", (code,))
+            else:
+                conn.execute("DELETE FROM results WHERE code = ? AND period = ?", (code, period))
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+
+
+def has_metrics(data: Optional[Dict[str, Any]]) -> bool:
+    """종목코드/종목명 외에 값이 하나라도 있는 결과인지 여부 (캐시 저장 대상)"""
+    if not data:
+        return False
+    return any(
+        value is not None
+        for key, value in data.items()
+        if key not in ('stock_code', 'stock_name')
+    )
@@ -0,0 +1,144 @@
+"""
+실행 기록(저널) 모듈
+크롤링 실행별로 완료된 (종목코드, 기간)을 추가 전용 파일에 기록하여
+중단된 실행을 이어서 진행(resume)할 수 있도록 함
+"""
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+from src.utils.result_cache import has_metrics
+from config.config import JOURNAL_CONFIG
+
+
+def item_status(data: Optional[Dict[str, Any]]) -> str:
+    """
+    조회 결과의 기록 상태
+
+    Returns:
+        'ok' (데이터 있음), 'empty' (조회는 성공했지만 사이트에 데이터 없음),
+        'failed' (조회 실패, 이어서 진행 시 다시 조회)
+    """
+    if data is None:
+        return 'failed'
+    return 'ok' if has_metrics(data) else 'empty'
+
+
+class RunJournal:
+    """실행 기록 관리 클래스"""
+
+    def __init__(self, run_id: str, journal_dir: Optional[str] = None):
+        """
+        Args:
+            run_id: 실행 ID
+            journal_dir: 저널 파일 디렉토리
+        """
+        self.run_id = run_id
+        self.journal_dir = journal_dir or JOURNAL_CONFIG['dir']
+        self.file_path = os.path.join(self.journal_dir, f"{run_id}.jsonl")
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        os.makedirs(self.journal_dir, exist_ok=True)
+
+    @classmethod
+    def latest(cls, period: Optional[str] = None, journal_dir: Optional[str] = None) -> Optional["RunJournal"]:
+        """
+        가장 최근 실행 기록 찾기
+
+        Args:
+            period: 이 기간(quarter_value)으로 시작한 실행만 대상 (None이면 전체)
+            journal_dir: 저널 파일 디렉토리
+
+        Returns:
+            RunJournal 또는 없으면 None
+        """
+        journal_dir = journal_dir or JOURNAL_CONFIG['dir']
+        paths = sorted(
+            glob.glob(os.path.join(journal_dir, "*.jsonl")),
+            key=os.path.getmtime,
+            reverse=True
+        )
+        for path in paths:
+            journal = cls(os.path.splitext(os.path.basename(path))[0], journal_dir)
+            header = journal.header()
+            if header and (period is None or header.get('period') == period):
+                return journal
+        return None
+
+    def exists(self) -> bool:
+        """저널 파일 존재 여부"""
+        return os.path.exists(self.file_path)
+
+    def _append(self, record: Dict[str, Any]):
+        """기록 한 줄 추가 (즉시 디스크에 반영)"""
+        record['ts'] = time.time()
+        with self._lock:
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _records(self):
+        """기록 읽기 (중단 시 잘린 마지막 줄은 무시)"""
+        if not self.exists():
+            return
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def start(self, output_file: str, period: Optional[str] = None, **meta):
+        """
+        실행 시작 기록
+
+        Args:
+            output_file: 결과 CSV 파일 경로
+            period: 대표 기간 값 (resume 시 실행을 찾는 기준)
+            **meta: 추가 정보
+        """
+        self._append({'event': 'start', 'output_file': output_file, 'period': period, **meta})
+
+    def header(self) -> Optional[Dict[str, Any]]:
+        """첫 번째 시작 기록"""
+        for record in self._records():
+            if record.get('event') == 'start':
+                return record
+        return None
+
+    def output_file(self) -> Optional[str]:
+        """결과 CSV 파일 경로"""
+        header = self.header()
+        return header.get('output_file') if header else None
+
+    def record(self, code: str, period: str, status: str = 'ok'):
+        """
+        완료 항목 기록
+
+        Args:
+            code: 종목코드
+            period: 기간 값
+            status: item_status() 결과 ('ok', 'empty', 'failed')
+        """
+        self._append({'event': 'item', 'code': code, 'period': period, 'status': status})
+
+    def _latest_statuses(self) -> Dict[Tuple[str, str], str]:
+        """(종목코드, 기간)별 마지막 기록 상태"""
+        return {
+            (record['code'], record['period']): record.get('status', 'ok')
+            for record in self._records()
+            if record.get('event') == 'item'
+        }
+
+    def completed(self) -> Set[Tuple[str, str]]:
+        """완료된 (종목코드, 기간) 집합 (데이터를 저장했거나 데이터가 없는 것으로 확인된 항목)"""
+        return {key for key, status in self._latest_statuses().items() if status != 'failed'}
+
+    def failed(self) -> Set[Tuple[str, str]]:
+        """조회에 실패해 빈 행만 저장된 (종목코드, 기간) 집합 (이어서 진행 시 다시 조회)"""
+        return {key for key, status in self._latest_statuses().items() if status == 'failed'}
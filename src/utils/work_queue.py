@@ -0,0 +1,374 @@
+"""
+분산 작업 큐 모듈
+작업(종목 목록 x 기간 목록)을 (종목코드, 기간) 항목으로 나눠 SQLite에 저장하고,
+여러 머신의 워커가 리스(lease)를 받아 처리하도록 함
+
+워커는 처리 중 하트비트로 리스를 연장하고, 완료하면 결과를 기록하며, 실패하면 항목을
+반환한다. 하트비트가 끊겨 리스가 만료된 항목은 다른 워커에 다시 배정된다.
+다른 머신의 워커는 QueueServer(HTTP)를 통해 같은 큐를 사용한다. 서버는 기본적으로
+로컬(127.0.0.1)에만 바인드하며, 외부에 공개할 때는 공유 토큰을 설정해야 한다.
+"""
+import hmac
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from config.config import WORK_QUEUE_CONFIG, REQUEST_TIMEOUT
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    job_id TEXT NOT NULL,
+    code TEXT NOT NULL,
+    period TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    quarter INTEGER,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job_id, code, period)
+);
+CREATE INDEX IF NOT EXISTS idx_items_status ON items (job_id, status, lease_until);
+"""
+
+# 작업 항목: (종목코드, 연도, 분기 또는 None, 기간 값)
+WorkItem = Tuple[str, int, Optional[int], str]
+
+
+class WorkQueue:
+    """SQLite 기반 리스 작업 큐 클래스"""
+
+    def __init__(
+        self,
+        db_file: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None
+    ):
+        """
+        Args:
+            db_file: SQLite 파일 경로
+            lease_seconds: 리스 유효 시간(초)
+            max_attempts: 항목별 최대 시도 횟수
+        """
+        self.db_file = db_file or WORK_QUEUE_CONFIG['db_file']
+        self.lease_seconds = lease_seconds or WORK_QUEUE_CONFIG['lease_seconds']
+        self.max_attempts = max_attempts or WORK_QUEUE_CONFIG['max_attempts']
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """SQLite 연결 (스레드/프로세스별로 짧게 열고 닫음)"""
+        with self._lock:
+            conn = sqlite3.connect(self.db_file, timeout=30)
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    def create_job(self, job_id: str, items: List[WorkItem]) -> int:
+        """
+        작업 항목 등록 (이미 있는 항목은 유지하므로 같은 작업을 다시 등록해도 안전)
+
+        Args:
+            job_id: 작업 ID
+            items: (종목코드, 연도, 분기, 기간 값) 목록
+
+        Returns:
+            새로 등록된 항목 수
+        """
+        now = time.time()
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO items (job_id, code, year, quarter, period, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(job_id, code, year, quarter, period, now) for code, year, quarter, period in items]
+            )
+            return conn.total_changes - before
+
+    def claim(self, job_id: str, worker: str, limit: int = 1) -> List[Dict[str, Any]]:
+        """
+        대기 중이거나 리스가 만료된 항목을 가져와 리스 설정
+
+        같은 종목의 기간이 한 번에 배정되도록 (종목코드, 기간) 순서로 가져온다.
+
+        Args:
+            job_id: 작업 ID
+            worker: 워커 ID
+            limit: 최대 항목 수
+
+        Returns:
+            [{'code', 'year', 'quarter', 'period', 'attempts'}, ...]
+        """
+        now = time.time()
+        with self._connect() as conn:
+            # 다른 워커가 같은 항목을 가져가지 않도록 쓰기 잠금을 먼저 획득
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE items SET status = 'failed', worker = NULL, lease_until = NULL, "
+                "error = '리스 만료 횟수 초과', updated_at = ? "
+                "WHERE job_id = ? AND status = 'leased' AND lease_until < ? AND attempts >= ?",
+                (now, job_id, now, self.max_attempts)
+            )
+            rows = conn.execute(
+                "SELECT code, year, quarter, period, attempts FROM items "
+                "WHERE job_id = ? AND (status = 'pending' OR (status = 'leased' AND lease_until < ?)) "
+                "ORDER BY code, period LIMIT ?",
+                (job_id, now, limit)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE items SET status = 'leased', worker = ?, lease_until = ?, "
+                "attempts = attempts + 1, updated_at = ? "
+                "WHERE job_id = ? AND code = ? AND period = ?",
+                [(worker, now + self.lease_seconds, now, job_id, code, period) for code, _, _, period, _ in rows]
+            )
+        return [
+            {'code': code, 'year': year, 'quarter': quarter, 'period': period, 'attempts': attempts + 1}
+            for code, year, quarter, period, attempts in rows
+        ]
+
+    def heartbeat(self, job_id: str, worker: str) -> int:
+        """
+        워커가 가진 리스 연장
+
+        Returns:
+            연장된 항목 수
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE items SET lease_until = ?, updated_at = ? "
+                "WHERE job_id = ? AND worker = ? AND status = 'leased'",
+                (now + self.lease_seconds, now, job_id, worker)
+            )
+            return cursor.rowcount
+
+    def complete(self, job_id: str, worker: str, code: str, period: str, result: Optional[Dict[str, Any]]) -> bool:
+        """
+        항목 완료 및 결과 기록
+
+        리스가 만료되어 다른 워커에 재배정된 뒤에도 먼저 끝낸 결과를 인정하고,
+        이미 완료된 항목은 덮어쓰지 않는다.
+
+        Returns:
+            기록 여부
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE items SET status = 'done', worker = ?, lease_until = NULL, result = ?, "
+                "error = NULL, updated_at = ? "
+                "WHERE job_id = ? AND code = ? AND period = ? AND status != 'done'",
+                (worker, json.dumps(result, ensure_ascii=False), now, job_id, code, period)
+            )
+            return cursor.rowcount > 0
+
+    def release(self, job_id: str, worker: str, code: str, period: str, error: Optional[str] = None) -> bool:
+        """
+        처리하지 못한 항목 반환 (시도 횟수를 넘으면 실패 처리)
+
+        Returns:
+            반환 여부 (이 워커의 리스가 아니면 False)
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE items SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "worker = NULL, lease_until = NULL, error = ?, updated_at = ? "
+                "WHERE job_id = ? AND code = ? AND period = ? AND worker = ? AND status = 'leased'",
+                (self.max_attempts, error, now, job_id, code, period, worker)
+            )
+            return cursor.rowcount > 0
+
+    def progress(self, job_id: str) -> Dict[str, int]:
+        """상태별 항목 수 ({'pending', 'leased', 'done', 'failed'})"""
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        with self._connect() as conn:
+            for status, count in conn.execute(
+                "SELECT status, COUNT(*) FROM items WHERE job_id = ? GROUP BY status", (job_id,)
+            ):
+                counts[status] = count
+        return counts
+
+    def results(self, job_id: str) -> List[Dict[str, Any]]:
+        """
+        완료된 항목의 결과 ((기간, 종목코드) 순서)
+
+        Returns:
+            [{'period', ...결과 항목}, ...]
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT period, result FROM items WHERE job_id = ? AND status = 'done' "
+                "ORDER BY period, code",
+                (job_id,)
+            ).fetchall()
+        return [{'period': period, **(json.loads(result) or {})} for period, result in rows]
+
+
+# HTTP로 호출할 수 있는 큐 메서드
+_REMOTE_METHODS = ('create_job', 'claim', 'heartbeat', 'complete', 'release', 'progress', 'results')
+
+# 공유 토큰 헤더
+_TOKEN_HEADER = 'X-Queue-Token'
+
+
+class RemoteWorkQueue:
+    """QueueServer를 통해 다른 머신의 WorkQueue를 사용하는 클라이언트 클래스 (메서드는 WorkQueue와 같음)"""
+
+    def __init__(self, url: str, token: Optional[str] = None):
+        """
+        Args:
+            url: 큐 서버 주소 (예: http://coordinator:8765)
+            token: 공유 토큰 (None이면 WORK_QUEUE_CONFIG['server_token'])
+        """
+        self.url = url.rstrip('/')
+        self.session = requests.Session()
+        token = token or WORK_QUEUE_CONFIG['server_token']
+        if token:
+            self.session.headers[_TOKEN_HEADER] = token
+
+    def _call(self, method: str, **kwargs):
+        """큐 메서드 원격 호출 (통신 오류는 requests 예외로 전달)"""
+        response = self.session.post(f"{self.url}/{method}", json=kwargs, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()['result']
+
+    def create_job(self, job_id: str, items: List[WorkItem]) -> int:
+        return self._call('create_job', job_id=job_id, items=[list(item) for item in items])
+
+    def claim(self, job_id: str, worker: str, limit: int = 1) -> List[Dict[str, Any]]:
+        return self._call('claim', job_id=job_id, worker=worker, limit=limit)
+
+    def heartbeat(self, job_id: str, worker: str) -> int:
+        return self._call('heartbeat', job_id=job_id, worker=worker)
+
+    def complete(self, job_id: str, worker: str, code: str, period: str, result: Optional[Dict[str, Any]]) -> bool:
+        return self._call('complete', job_id=job_id, worker=worker, code=code, period=period, result=result)
+
+    def release(self, job_id: str, worker: str, code: str, period: str, error: Optional[str] = None) -> bool:
+        return self._call('release', job_id=job_id, worker=worker, code=code, period=period, error=error)
+
+    def progress(self, job_id: str) -> Dict[str, int]:
+        return self._call('progress', job_id=job_id)
+
+    def results(self, job_id: str) -> List[Dict[str, Any]]:
+        return self._call('results', job_id=job_id)
+
+
+class QueueServer:
+    """WorkQueue를 HTTP(JSON)로 제공하는 서버 클래스 (POST /<메서드>)"""
+
+    def __init__(
+        self,
+        queue: Optional[WorkQueue] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        token: Optional[str] = None
+    ):
+        """
+        Args:
+            queue: 제공할 작업 큐 (None이면 설정의 SQLite 파일)
+            host: 바인드 주소 (None이면 WORK_QUEUE_CONFIG['server_host'], 기본 로컬 전용)
+            port: 포트
+            token: 공유 토큰 (None이면 WORK_QUEUE_CONFIG['server_token'])
+
+        Raises:
+            ValueError: 로컬이 아닌 주소에 토큰 없이 바인드하려는 경우
+        """
+        self.queue = queue or WorkQueue()
+        self.logger = logging.getLogger(__name__)
+        host = host or WORK_QUEUE_CONFIG['server_host']
+        port = port or WORK_QUEUE_CONFIG['server_port']
+        self.token = token or WORK_QUEUE_CONFIG['server_token']
+        if not self.token and host not in ('127.0.0.1', 'localhost', '::1'):
+            # 인증 없이 작업 등록/결과 조회가 네트워크에 노출되지 않도록 함
+            raise ValueError(
+                f"로컬이 아닌 주소({host})에 바인드하려면 공유 토큰(FNGUIDE_QUEUE_TOKEN)을 설정하세요."
+            )
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+
+    def _handler(self):
+        """요청 처리 클래스 생성"""
+        queue = self.queue
+        logger = self.logger
+        token = self.token
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if token and not hmac.compare_digest(
+                    self.headers.get(_TOKEN_HEADER, '').encode('utf-8'), token.encode('utf-8')
+                ):
+                    self.send_error(401, "invalid token")
+                    return
+                method = self.path.strip('/')
+                if method not in _REMOTE_METHODS:
+                    self.send_error(404, "unknown method")
+                    return
+                try:
+                    length = int(self.headers.get('Content-Length') or 0)
+                    kwargs = json.loads(self.rfile.read(length) or b"{}")
+                    result = getattr(queue, method)(**kwargs)
+                    body = json.dumps({'result': result}, ensure_ascii=False).encode("utf-8")
+                except (TypeError, ValueError) as e:
+                    self.send_error(400, str(e))
+                    return
+                except Exception as e:
+                    logger.error(f"큐 요청 처리 실패 ({method}): {str(e)}")
+                    self.send_error(500, str(e))
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"큐 요청: {format % args}")
+
+        return Handler
+
+    def serve_forever(self):
+        """요청 처리 시작 (중단될 때까지)"""
+        host, port = self.httpd.server_address[:2]
+        self.logger.info(f"작업 큐 서버 시작: http://{host}:{port} ({self.queue.db_file})")
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.httpd.server_close()
+
+    def shutdown(self):
+        """서버 중지"""
+        self.httpd.shutdown()
+
+
+def get_work_queue(url: Optional[str] = None):
+    """
+    작업 큐 반환
+
+    Args:
+        url: 큐 서버 주소 (None이면 WORK_QUEUE_CONFIG['server_url'])
+
+    Returns:
+        서버 주소가 있으면 RemoteWorkQueue, 없으면 로컬 SQLite WorkQueue
+    """
+    url = url or WORK_QUEUE_CONFIG['server_url']
+    return RemoteWorkQueue(url) if url else WorkQueue()